@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import sys
+from graphtheory.traversing.dfs import DFSEngine, TREE, BACK
 
 class AcyclicGraphDFS:
     """Cycles detection in graphs based on DFS.
@@ -10,7 +10,6 @@ class AcyclicGraphDFS:
     Attributes
     ----------
     graph : input graph
-    color : dict with nodes, private
     parent : dict (DFS tree)
     
     Notes
@@ -25,34 +24,17 @@ class AcyclicGraphDFS:
     def __init__(self, graph):
         """The algorithm initialization."""
         self.graph = graph
-        self.color = dict(((node, "WHITE") for node in self.graph.iternodes()))
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None):
         """Executable pseudocode."""
-        if source is not None:
-            # Only one connected component will be checked!
-            self._visit(source)
-        else:
-            for node in self.graph.iternodes():
-                if self.color[node] == "WHITE":
-                    self._visit(node)
-
-    def _visit(self, node):
-        """Explore recursively the connected component."""
-        self.color[node] = "GREY"
-        for edge in self.graph.iteroutedges(node):
-            if self.color[edge.target] == "WHITE":
-                self.parent[edge.target] = node
-                self._visit(edge.target)
-            elif self.color[edge.target] == "GREY":   # back edge possible
-                if self.graph.is_directed() or edge.target != self.parent[node]:
-                    raise ValueError("cycle detected")
-            else:   # directed graph, cross or forward edge
-                pass
-        self.color[node] = "BLACK"
+        # If source is given, only one connected component will be checked!
+        for kind, item in self._engine.iterevents(source):
+            if kind == TREE:
+                self.parent[item.target] = item.source
+            elif kind == BACK:   # edges to the parent are skipped
+                raise ValueError("cycle detected")
 
 
 def is_acyclic(graph):
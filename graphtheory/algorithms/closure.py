@@ -7,6 +7,11 @@ from graphtheory.traversing.bfs import SimpleBFS
 #from graphtheory.traversing.dfs import DFSWithRecursion as SimpleDFS
 from graphtheory.traversing.dfs import SimpleDFS
 
+try:
+    import numpy
+except ImportError:   # TransitiveClosureNumPy is not available
+    numpy = None
+
 
 class TransitiveClosureSimple:
     """Based on the matrix multiplication, O(V^2 E) time."""
@@ -104,4 +109,40 @@ class TransitiveClosureDFS:
             algorithm.run(source, pre_action=lambda node:
                 self.T[source].__setitem__(node, True))
 
+
+class TransitiveClosureNumPy:
+    """Based on the Floyd-Warshall algorithm with a NumPy boolean matrix,
+    O(V^3) time, one vectorised OR per node."""
+
+    def __init__(self, graph):
+        """The algorithm initialization, O(V^2) memory (bytes)."""
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        if numpy is None:
+            raise ValueError("NumPy is required")
+        self.graph = graph
+        self.nodes = list(self.graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        n = len(self.nodes)
+        self.matrix = numpy.eye(n, dtype=bool)
+        for edge in self.graph.iteredges():
+            self.matrix[self.node_id[edge.source],
+                self.node_id[edge.target]] = True
+
+    def run(self):
+        """Executable pseudocode."""
+        M = self.matrix
+        for k in range(len(self.nodes)):
+            # Rows with the path to k get all nodes reachable from k.
+            M[M[:, k]] |= M[k]
+
+    def to_dict(self):
+        """Return the closure as dict-of-dict (like TransitiveClosure.T)."""
+        T = dict()
+        for i, source in enumerate(self.nodes):
+            row = self.matrix[i].tolist()
+            T[source] = dict((target, row[j])
+                for (j, target) in enumerate(self.nodes))
+        return T
+
 # EOF
@@ -117,6 +117,18 @@ class TestAcyclicDirectedGraph(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestLongCycle(unittest.TestCase):
+
+    def test_long_cycle(self):
+        N = 20000
+        G = Graph(n=N, directed=True)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1))
+        self.assertTrue(is_acyclic(G))
+        G.add_edge(Edge(N-1, 0))
+        self.assertFalse(is_acyclic(G))
+
 if __name__ == "__main__":
 
     unittest.main()
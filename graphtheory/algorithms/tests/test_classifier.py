@@ -82,6 +82,23 @@ class TestUndirectedGraph(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestLongPath(unittest.TestCase):
+
+    def test_long_path(self):
+        N = 20000
+        G = Graph(n=N, directed=True)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1))
+        G.add_edge(Edge(0, 2))
+        G.add_edge(Edge(N-1, 0))
+        algorithm = EdgeClassifierDFS(G)
+        algorithm.run(0)
+        self.assertEqual(algorithm.classifier[Edge(0, 2)], "FORWARD")
+        self.assertEqual(algorithm.classifier[Edge(N-1, 0)], "BACK")
+        self.assertEqual(list(algorithm.classifier.values()).count("TREE"),
+            N-1)
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -7,6 +7,8 @@ from graphtheory.algorithms.closure import TransitiveClosureSimple
 from graphtheory.algorithms.closure import TransitiveClosure
 from graphtheory.algorithms.closure import TransitiveClosureBFS
 from graphtheory.algorithms.closure import TransitiveClosureDFS
+from graphtheory.algorithms.closure import TransitiveClosureNumPy
+from graphtheory.algorithms.closure import numpy
 
 # 0 --> 1 --> 2 --> 3
 
@@ -48,6 +50,16 @@ class TestTransitiveClosure(unittest.TestCase):
         algorithm.run()
         self.assertEqual(algorithm.T, self.expected_T)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_closure_numpy(self):
+        algorithm = TransitiveClosureNumPy(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.to_dict(), self.expected_T)
+        self.G.add_edge(Edge(3, 0))   # one strongly connected component
+        algorithm = TransitiveClosureNumPy(self.G)
+        algorithm.run()
+        self.assertTrue(algorithm.matrix.all())
+
     def tearDown(self): pass
 
 if __name__ == "__main__":
@@ -72,6 +72,18 @@ class TestTopologicalSorting(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestLongPath(unittest.TestCase):
+
+    def test_topsort_dfs(self):
+        N = 20000
+        G = Graph(n=N, directed=True)
+        for node in range(N-1, 0, -1):
+            G.add_edge(Edge(node-1, node))
+        algorithm = TopologicalSortDFS(G)
+        algorithm.run()
+        self.assertEqual(algorithm.sorted_nodes, list(range(N)))
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -3,6 +3,7 @@
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
 from graphtheory.connectivity.connected import ConnectedComponentsBFS
+from graphtheory.structures.views import SubgraphView, ComplementView
 
 class ATFreeGraph:
     """Finding AT-free graphs.
@@ -47,7 +48,7 @@ class ATFreeGraph:
             for u in Nv:
                 self.component_structure[v,u] = 0
 
-            G_reduced = self.graph.subgraph(V - Nv)
+            G_reduced = SubgraphView(self.graph, V - Nv)
             algorithm = ConnectedComponentsBFS(G_reduced)
             algorithm.run()
             for u in algorithm.cc:   # tu jest numeracja skladowych od 0
@@ -61,7 +62,7 @@ class ATFreeGraph:
             return None
 
         V = set(self.graph.iternodes())
-        Gc = self.graph.complement()   # O(n^2) time
+        Gc = ComplementView(self.graph)   # O(n^2) time, no copy
         # Uzywamy dopelnienia G, bo tu krawedzie lacza pary wierzcholkow,
         # ktore nie sa sasiednie w grafie G.
 
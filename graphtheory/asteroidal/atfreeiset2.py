@@ -3,6 +3,7 @@
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
 from graphtheory.connectivity.connected import ConnectedComponentsBFS
+from graphtheory.structures.views import SubgraphView, ComplementView
 
 class ATFreeIndependentSet:
     """Find a maximum independent set for AT-free graphs.
@@ -44,7 +45,7 @@ class ATFreeIndependentSet:
         V = set(self.graph.iternodes())
         for v in V:
             Nv = set(self.graph.iteradjacent(v)).union([v])
-            G_reduced = self.graph.subgraph(V - Nv)
+            G_reduced = SubgraphView(self.graph, V - Nv)
             algorithm = ConnectedComponentsBFS(G_reduced)
             algorithm.run()
             component_list = [set() for x in range(algorithm.n_cc + 1)]
@@ -62,7 +63,7 @@ class ATFreeIndependentSet:
 
     def find_intervals(self):
         """Finding intervals for nonadjacent pairs of vertices."""
-        Gc = self.graph.complement()   # O(n^2) time
+        Gc = ComplementView(self.graph)   # O(n^2) time, no copy
         # Uzywamy dopelnienia G, bo tu krawedzie lacza pary wierzcholkow,
         # ktore nie sa sasiednie w grafie G.
         for edge in Gc.iteredges():   # total O(n^3) time
@@ -9,6 +9,7 @@ from graphtheory.structures.edges import Edge
 from graphtheory.flow.fordfulkerson import FordFulkersonSparse
 # no recursion
 from graphtheory.bipartiteness.bipartite import BipartiteGraphBFS as Bipartite
+from graphtheory.structures.views import graph_class
 # with recursion
 #from graphtheory.bipartiteness.bipartite import BipartiteGraphDFS as Bipartite
 
@@ -51,7 +52,7 @@ class MatchingFordFulkersonSet:
         """Executable pseudocode."""
         size = self.graph.v()
         # Create flow network.
-        network = self.graph.__class__(n=(size + 2), directed=True)
+        network = graph_class(self.graph)(n=(size + 2), directed=True)
         self.source = size
         self.sink = size + 1
         network.add_node(self.source)
@@ -115,7 +116,7 @@ class MatchingFordFulkersonList:
         """Executable pseudocode."""
         size = self.graph.v()
         # Create flow network.
-        network = self.graph.__class__(n=(size + 2), directed=True)
+        network = graph_class(self.graph)(n=(size + 2), directed=True)
         self.source = size
         self.sink = size + 1
         network.add_node(self.source)
@@ -173,7 +174,7 @@ class MatchingFordFulkersonColor:
         """Executable pseudocode."""
         size = self.graph.v()
         # Create flow network.
-        network = self.graph.__class__(n=(size + 2), directed=True)
+        network = graph_class(self.graph)(n=(size + 2), directed=True)
         self.source = size
         self.sink = size + 1
         network.add_node(self.source)
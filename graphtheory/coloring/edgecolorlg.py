@@ -7,6 +7,7 @@ except NameError:   # Python 3
 
 from graphtheory.structures.edges import Edge
 from graphtheory.coloring.nodecolorus import UnorderedSequentialNodeColoring as NodeColoring
+from graphtheory.structures.views import graph_class
 #from graphtheory.coloring.nodecolorrs import RandomSequentialNodeColoring as NodeColoring
 
 
@@ -46,7 +47,7 @@ class EdgeColoringWithLineGraph:
 
     def run(self):
         """Executable pseudocode."""
-        line_graph = self.graph.__class__(n=self.graph.e(), directed=False)
+        line_graph = graph_class(self.graph)(n=self.graph.e(), directed=False)
         # Trzeba dodac wierzcholki do grafu krawedziowego.
         # Graf krawedziowy moze byc niespojny!
         for edge in self.graph.iteredges():
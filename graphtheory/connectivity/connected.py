@@ -1,11 +1,24 @@
 #!/usr/bin/env python3
 
+import os
+from bisect import bisect_left
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing import shared_memory   # Python 3.8+
+except ImportError:   # ConnectedComponentsParallel runs in one process
+    shared_memory = None
+
 #from graphtheory.traversing.bfs import BFSWithQueue as SimpleBFS
 from graphtheory.traversing.bfs import SimpleBFS
 
 #from graphtheory.traversing.dfs import DFSWithStack as SimpleDFS
 #from graphtheory.traversing.dfs import DFSWithRecursion as SimpleDFS
 from graphtheory.traversing.dfs import SimpleDFS
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.views import TransposeView, graph_class
+from graphtheory.traversing.dobfs import csr_arrays
 
 
 class StronglyConnectedComponents:
@@ -26,7 +39,11 @@ class StronglyConnectedComponents:
         # use post_action!
         algorithm.run(post_action=lambda node: order.append(node))
         order.reverse()
-        algorithm = SimpleDFS(self.graph.transpose())
+        if getattr(self.graph, "inverse", None) is not None:
+            # Fast iterinedges, the transpose is not copied.
+            algorithm = SimpleDFS(TransposeView(self.graph))
+        else:
+            algorithm = SimpleDFS(self.graph.transpose())
         for source in order:
             if self.scc[source] is None:
                 algorithm.run(source, post_action=lambda
@@ -34,6 +51,125 @@ class StronglyConnectedComponents:
                 self.n_scc += 1
 
 
+class StronglyConnectedComponentsPearce:
+    """Strongly connected components for directed graphs (one pass).
+
+    The iterative Pearce's variant of the Tarjan algorithm.
+    One DFS with a stack of edge iterators is used (no recursion,
+    no transpose copy). The state is one integer array rindex
+    (DFS index or component number), a bytearray with root flags
+    and a stack of nodes. Component numbers are in a topological
+    order of the condensation (edges go to higher numbers).
+
+    Attributes
+    ----------
+    graph : input directed graph
+    scc : dict, node -> component number
+    n_scc : number of strongly connected components
+
+    Examples
+    --------
+    >>> from graphtheory.connectivity.connected import StronglyConnectedComponentsPearce
+    >>> algorithm = StronglyConnectedComponentsPearce(G)
+    >>> algorithm.run()
+    >>> algorithm.scc   # a dict with pairs (node, component_number)
+    >>> dag = algorithm.condensation()   # nodes are component numbers
+
+    Notes
+    -----
+    Pearce, D. J., 2016, A space-efficient algorithm for finding
+        strongly connected components, Information Processing Letters
+        116, 47-52.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization."""
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.scc = dict((node, None) for node in self.graph.iternodes())
+        self.n_scc = 0
+
+    def run(self):
+        """Executable pseudocode."""
+        graph = self.graph
+        nodes = list(graph.iternodes())
+        node_id = dict((node, i) for (i, node) in enumerate(nodes))
+        n = len(nodes)
+        rindex = array("q", [0]) * n   # 0 for not visited nodes
+        root = bytearray(n)
+        stack = []   # visited nodes without components
+        index = 1   # the next DFS index
+        component = n - 1   # component numbers go down from n-1
+        for start in range(n):
+            if rindex[start]:
+                continue
+            rindex[start] = index
+            index += 1
+            root[start] = 1
+            calls = [(start, iter(graph.iteroutedges(nodes[start])))]
+            while calls:
+                source, edges = calls[-1]
+                for edge in edges:
+                    target = node_id[edge.target]
+                    if rindex[target] == 0:   # a tree edge
+                        rindex[target] = index
+                        index += 1
+                        root[target] = 1
+                        calls.append(
+                            (target, iter(graph.iteroutedges(edge.target))))
+                        break
+                    if rindex[target] < rindex[source]:
+                        rindex[source] = rindex[target]
+                        root[source] = 0
+                else:   # all edges from source are processed
+                    calls.pop()
+                    if root[source]:   # a new component
+                        index -= 1
+                        while stack and rindex[source] <= rindex[stack[-1]]:
+                            rindex[stack.pop()] = component
+                            index -= 1
+                        rindex[source] = component
+                        component -= 1
+                    else:
+                        stack.append(source)
+                    if calls:   # back in the parent
+                        parent = calls[-1][0]
+                        if rindex[source] < rindex[parent]:
+                            rindex[parent] = rindex[source]
+                            root[parent] = 0
+        # Components found first are sinks, they get higher numbers.
+        self.n_scc = n - 1 - component
+        for i in range(n):
+            self.scc[nodes[i]] = rindex[i] - component - 1
+
+    def condensation(self):
+        """Return the condensation DAG (run() first)."""
+        return condensation(self.graph, self.scc, self.n_scc)
+
+
+def condensation(graph, scc, n_scc):
+    """Return the condensation of the directed graph.
+
+    Nodes are component numbers from 0 to n_scc-1. There is an edge
+    between components if there is an edge between their nodes,
+    the weight is the smallest weight of such edges.
+    """
+    weights = dict()
+    for edge in graph.iteredges():
+        pair = (scc[edge.source], scc[edge.target])
+        if pair[0] == pair[1]:
+            continue
+        if edge.weight < weights.get(pair, float("inf")):
+            weights[pair] = edge.weight
+    dag = graph_class(graph)(n=n_scc, directed=True)
+    for component in range(n_scc):   # isolated nodes are possible
+        dag.add_node(component)
+    for (source, target), weight in weights.items():
+        dag.add_edge(Edge(source, target, weight))
+    return dag
+
+
 class ConnectedComponentsBFS:
     """Connected components for undirected graphs with BFS."""
 
@@ -76,6 +212,164 @@ class ConnectedComponentsDFS:
                 self.n_cc += 1
 
 
+def _hook_candidates(offsets, targets, parent, lo, hi):
+    """Return a dict, root -> the smallest neighbor root (nodes lo..hi-1)."""
+    best = dict()
+    for source in range(lo, hi):
+        root = parent[source]
+        for k in range(offsets[source], offsets[source + 1]):
+            other = parent[targets[k]]
+            if other < root and other < best.get(root, root):
+                best[root] = other
+    return best
+
+
+def _init_worker(blocks):
+    """Attach shared CSR and parent arrays in a worker process."""
+    global _worker_blocks, _worker_arrays
+    _worker_blocks = [shared_memory.SharedMemory(name=name)
+        for (name, length) in blocks]
+    _worker_arrays = [block.buf.cast("q")[:length]
+        for (block, (name, length)) in zip(_worker_blocks, blocks)]
+
+
+def _worker_hooks(lo, hi):
+    """The task for a worker process."""
+    offsets, targets, parent = _worker_arrays
+    return _hook_candidates(offsets, targets, parent, lo, hi)
+
+
+class ConnectedComponentsParallel:
+    """Connected components for undirected graphs (parallel hooking).
+
+    The Shiloach-Vishkin style algorithm on CSR arrays. Every node
+    has a parent (a smaller node id), roots are component labels.
+    In every round worker processes scan their parts of the CSR arrays
+    (shared memory) and propose for every root the smallest
+    neighbor root. Roots are hooked, then the forest is compressed
+    (parent[u] <= u, so one pass in the id order is enough).
+    The number of roots is at least halved in a round,
+    so there are O(log V) rounds.
+
+    Attributes
+    ----------
+    graph : input undirected graph
+    cc : dict, node -> component number (the order of iternodes)
+    n_cc : number of connected components
+    workers : number of worker processes
+    rounds : number of hooking rounds
+
+    Examples
+    --------
+    >>> from graphtheory.connectivity.connected import ConnectedComponentsParallel
+    >>> algorithm = ConnectedComponentsParallel(G, workers=4)
+    >>> algorithm.run()
+    >>> algorithm.cc   # the same as ConnectedComponentsBFS
+    >>> algorithm.n_cc
+
+    Notes
+    -----
+    Parts have similar numbers of edges. If workers=1 or
+    multiprocessing.shared_memory is not available (Python 3.7),
+    no processes are started. The hooking and compression
+    in the main process are O(V) per round.
+
+    Shiloach, Y., Vishkin, U., 1982, An O(log n) parallel connectivity
+        algorithm, Journal of Algorithms 3, 57-67.
+    """
+
+    def __init__(self, graph, workers=None, parts=None):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : undirected graph
+        workers : int, optional (default=os.cpu_count())
+        parts : int, optional (default=workers), tasks in a round
+        """
+        if graph.is_directed():
+            raise ValueError("the graph is directed")
+        self.graph = graph
+        self.workers = workers if workers else (os.cpu_count() or 1)
+        if shared_memory is None:
+            self.workers = 1
+        self.parts = parts if parts else self.workers
+        self.cc = dict((node, None) for node in self.graph.iternodes())
+        self.n_cc = 0
+        self.rounds = 0
+
+    def _bounds(self, offsets):
+        """Return node ranges (lo, hi) with similar numbers of edges."""
+        n = len(offsets) - 1
+        m = offsets[n]
+        cuts = [0]
+        for part in range(1, self.parts):
+            cuts.append(min(max(bisect_left(offsets, m * part // self.parts),
+                cuts[-1]), n))
+        cuts.append(n)
+        return [(lo, hi) for (lo, hi) in zip(cuts, cuts[1:]) if lo < hi]
+
+    def run(self):
+        """Executable pseudocode."""
+        nodes, _, offsets, targets = csr_arrays(self.graph)
+        n = len(nodes)
+        bounds = self._bounds(offsets)
+        if self.workers == 1 or n == 0:
+            parent = array("q", range(n))
+            hooks = lambda: [_hook_candidates(offsets, targets, parent, lo, hi)
+                for (lo, hi) in bounds]
+            self._run(parent, hooks)
+        else:
+            arrays = [offsets, targets, array("q", range(n))]
+            blocks = []
+            views = []
+            try:
+                for data in arrays:
+                    block = shared_memory.SharedMemory(create=True,
+                        size=8 * max(len(data), 1))
+                    blocks.append(block)
+                    views.append(block.buf.cast("q")[:len(data)])
+                    views[-1][:] = array("q", data)
+                with ProcessPoolExecutor(max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=([(block.name, len(data))
+                            for (block, data) in zip(blocks, arrays)],)
+                        ) as executor:
+                    hooks = lambda: list(executor.map(_worker_hooks,
+                        *zip(*bounds)))
+                    self._run(views[2], hooks)
+                parent = array("q", views[2])
+            finally:
+                for view in views:
+                    view.release()
+                for block in blocks:
+                    block.close()
+                    block.unlink()
+        for i in range(n):   # parent[i] is the root, parent[i] <= i
+            root = parent[i]
+            if root == i:
+                self.cc[nodes[i]] = self.n_cc
+                self.n_cc += 1
+            else:
+                self.cc[nodes[i]] = self.cc[nodes[root]]
+
+    def _run(self, parent, hooks):
+        """Hooking and compression rounds."""
+        while True:
+            best = dict()
+            for result in hooks():
+                for root, other in result.items():
+                    if other < best.get(root, root):
+                        best[root] = other
+            if not best:
+                break
+            self.rounds += 1
+            for root, other in best.items():
+                parent[root] = other
+            for i in range(len(parent)):   # compression
+                parent[i] = parent[parent[i]]
+
+
 def is_connected(graph):
     """Test if the undirected graph is connected."""
     if graph.is_directed():
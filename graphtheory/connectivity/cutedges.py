@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 
-import sys
 from graphtheory.traversing.dfs import SimpleDFS
+from graphtheory.traversing.dfs import DFSEngine, PRE, POST, TREE, BACK
+from graphtheory.structures.views import graph_class
 
 
 class TrivialCutEdge:
@@ -94,40 +95,32 @@ class TarjanCutEdge:
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
         self._time = 0    # time stamp
         self._dd = dict(((node, 0) for node in self.graph.iternodes()))
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None):
         """Executable pseudocode."""
-        if source is not None:
-            self._visit(source)
-        else:
-            for node in self.graph.iternodes():
-                if self._dd[node] == 0:   # not visited
-                    self._visit(node)
-
-    def _visit(self, node):
-        """Explore recursively the connected component."""
-        self._time += 1
-        self._dd[node] = self._time
-        self.low[node] = self._time
-        for edge in self.graph.iteroutedges(node):
-            if edge.target == self.parent[node]:   # can be None!
-                continue
-            if self._dd[edge.target] == 0:   # not visited
-                self.parent[edge.target] = node
-                self.dag.add_edge(edge)
-                self._visit(edge.target)
-                self.low[node] = min(self.low[node], self.low[edge.target])
-            else:   # back edge
-                self.low[node] = min(self.low[node], self._dd[edge.target])
-        # All neighbors are visited. Check the bridge condition.
-        if self.parent[node] is not None and self.low[node] == self._dd[node]:
-            # Most to jest krawedz prowadzaca do node od jego rodzica.
-            # Tu jest klopotliwe wyciaganie calej krawedzi.
-            for edge in self.dag.iteroutedges(self.parent[node]):
-                if edge.target == node:
-                    self.cut_edges.append(edge)
+        # The recursion is replaced by DFSEngine events.
+        tree_edge = dict()   # node -> edge from its parent
+        for kind, item in self._engine.iterevents(source):
+            if kind == PRE:
+                self._time += 1
+                self._dd[item] = self._time
+                self.low[item] = self._time
+            elif kind == TREE:
+                self.parent[item.target] = item.source
+                self.dag.add_edge(item)
+                tree_edge[item.target] = item
+            elif kind == BACK:   # edges to the parent are skipped
+                self.low[item.source] = min(self.low[item.source],
+                                            self._dd[item.target])
+            elif kind == POST:
+                # All neighbors are visited. Check the bridge condition.
+                parent = self.parent[item]
+                if parent is None:
+                    continue
+                self.low[parent] = min(self.low[parent], self.low[item])
+                if self.low[item] == self._dd[item]:
+                    self.cut_edges.append(tree_edge[item])
 
 # EOF
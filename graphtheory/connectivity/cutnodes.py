@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-import sys
-from graphtheory.traversing.dfs import SimpleDFS
+from graphtheory.traversing.dfs import DFSEngine, PRE, POST, TREE, BACK
 from graphtheory.connectivity.connected import is_connected
+from graphtheory.structures.views import SubgraphView, graph_class
 
 
 class TrivialCutNode:
@@ -33,23 +33,22 @@ class TrivialCutNode:
 
     def run(self, source=None):
         """Executable pseudocode."""
-        old_ncc = self._find_ncc()
+        old_ncc = self._find_ncc(self.graph)
+        nodes = set(self.graph.iternodes())
         for source in self.graph.iternodes():
-            removed = list(self.graph.iteroutedges(source))
-            for edge in removed:
-                self.graph.del_edge(edge)
-            new_ncc = self._find_ncc()
-            for edge in removed:
-                self.graph.add_edge(edge)
-            if new_ncc > old_ncc + 1:   # source was not removed
+            # The graph is not modified, source is hidden by the view.
+            nodes.remove(source)
+            new_ncc = self._find_ncc(SubgraphView(self.graph, nodes))
+            nodes.add(source)
+            if new_ncc > old_ncc:
                 self.cut_nodes.append(source)
 
-    def _find_ncc(self):
+    def _find_ncc(self, graph):
         """Return the number of connected components."""
-        visited = dict((node, False) for node in self.graph.iternodes())
+        visited = dict((node, False) for node in graph.iternodes())
         ncc = 0
-        algorithm = SimpleDFS(self.graph)
-        for source in self.graph.iternodes():
+        algorithm = DFSEngine(graph)   # no DFS tree graph is built
+        for source in graph.iternodes():
             if not visited[source]:
                 algorithm.run(source, pre_action=lambda node:
                     visited.__setitem__(node, True))
@@ -90,57 +89,41 @@ class TarjanCutNode:
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
         self._time = 0    # time stamp
         self._dd = dict(((node, 0) for node in self.graph.iternodes()))
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None):
         """Executable pseudocode."""
-        if source is not None:
-            self._visit_root(source)
-        else:
-            for node in self.graph.iternodes():
-                if self._dd[node] == 0:   # not visited
-                    self._visit_root(node)
-
-    def _visit_root(self, node):
-        """Explore recursively the connected component from root."""
-        self._time = self._time + 1
-        self._dd[node] = self._time
-        self.low[node] = self._time
-        n_sons = 0   # number of sons for the root
-        for edge in self.graph.iteroutedges(node):
-            if self._dd[edge.target] == 0:   # not visited
-                n_sons += 1
-                self.parent[edge.target] = node
-                self.dag.add_edge(edge)
-                self._visit(edge.target)
-        # Is the root an articulation point?
-        if n_sons > 1:
-            self.cut_nodes.append(node)
-
-    def _visit(self, node):
-        """Explore recursively the connected component."""
-        self._time += 1
-        self._dd[node] = self._time
-        self.low[node] = self._time   # temporary
-        is_cut_node = False
-        for edge in self.graph.iteroutedges(node):
-            if edge.target == self.parent[node]:   # can be None!
-                continue
-            if self._dd[edge.target] == 0:   # not visited
-                self.parent[edge.target] = node
-                self.dag.add_edge(edge)
-                self._visit(edge.target)
-                self.low[node] = min(self.low[node], self.low[edge.target])
+        # The recursion is replaced by DFSEngine events.
+        n_sons = dict()   # root -> number of sons
+        is_cut_node = set()
+        for kind, item in self._engine.iterevents(source):
+            if kind == PRE:
+                self._time += 1
+                self._dd[item] = self._time
+                self.low[item] = self._time   # temporary
+                if self.parent[item] is None:   # a root
+                    n_sons[item] = 0
+            elif kind == TREE:
+                self.parent[item.target] = item.source
+                self.dag.add_edge(item)
+                if item.source in n_sons:
+                    n_sons[item.source] += 1
+            elif kind == BACK:   # edges to the parent are skipped
+                self.low[item.source] = min(self.low[item.source],
+                                            self._dd[item.target])
+            elif kind == POST:
+                parent = self.parent[item]
+                if parent is None:   # is the root an articulation point?
+                    if n_sons.pop(item) > 1:
+                        self.cut_nodes.append(item)
+                    continue
+                if item in is_cut_node:
+                    self.cut_nodes.append(item)
+                self.low[parent] = min(self.low[parent], self.low[item])
                 # Test for an articulation point.
-                if self.low[edge.target] >= self._dd[node]:
-                    is_cut_node = True
-            else:   # back edge
-                self.low[node] = min(self.low[node], self._dd[edge.target])
-        # All neighbors are visited. Check the test.
-        if is_cut_node:
-            self.cut_nodes.append(node)
+                if parent not in n_sons and self.low[item] >= self._dd[parent]:
+                    is_cut_node.add(parent)
 
 
 def is_biconnected(graph):
@@ -3,10 +3,15 @@
 import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
+from graphtheory.connectivity import connected
 from graphtheory.connectivity.connected import ConnectedComponentsBFS
 from graphtheory.connectivity.connected import ConnectedComponentsDFS
+from graphtheory.connectivity.connected import ConnectedComponentsParallel
 from graphtheory.connectivity.connected import is_connected
 from graphtheory.connectivity.connected import StronglyConnectedComponents
+from graphtheory.connectivity.connected import StronglyConnectedComponentsPearce
+from graphtheory.algorithms.topsort import TopologicalSortQueue
+from graphtheory.shortestpaths.dagshortestpath import DAGShortestPath
 
 # 0 - 1   2 - 3
 # |   |   | / |
@@ -45,6 +50,40 @@ class TestConnectedComponents(unittest.TestCase):
         self.assertRaises(ValueError, ConnectedComponentsDFS,
             Graph(n=1, directed=True))
 
+    def test_cc_parallel(self):
+        for workers in (1, 2):
+            algorithm = ConnectedComponentsParallel(self.G, workers=workers)
+            algorithm.run()
+            self.assertEqual(algorithm.n_cc, self.expected_n_cc)
+            self.assertEqual(algorithm.cc, self.expected_cc)
+        self.assertRaises(ValueError, ConnectedComponentsParallel,
+            Graph(n=1, directed=True))
+
+    def test_cc_parallel_no_shared_memory(self):
+        saved = connected.shared_memory
+        connected.shared_memory = None   # like Python 3.7
+        try:
+            algorithm = ConnectedComponentsParallel(self.G, workers=4)
+            self.assertEqual(algorithm.workers, 1)
+            algorithm.run()
+        finally:
+            connected.shared_memory = saved
+        self.assertEqual(algorithm.n_cc, self.expected_n_cc)
+        self.assertEqual(algorithm.cc, self.expected_cc)
+
+    def test_cc_parallel_long_path(self):
+        N = 1000
+        G = Graph(n=N)
+        for node in range(N-1, 0, -1):   # the worst order of ids
+            G.add_edge(Edge(node, node-1))
+        G.add_node(N)   # isolated
+        algorithm = ConnectedComponentsParallel(G, workers=1, parts=3)
+        algorithm.run()
+        self.assertEqual(algorithm.n_cc, 2)
+        self.assertEqual(set(algorithm.cc.values()), set([0, 1]))
+        self.assertEqual(algorithm.cc[N], 1)
+        self.assertTrue(algorithm.rounds <= 11)   # O(log V)
+
     def test_is_connected(self):
         self.assertFalse(is_connected(self.G))
         self.G.add_edge(Edge(5, 6))
@@ -84,6 +123,43 @@ class TestStronglyConnectedComponents(unittest.TestCase):
         self.assertRaises(
             ValueError, StronglyConnectedComponents, Graph(n=1, directed=False))
 
+    def test_scc_pearce(self):
+        algorithm = StronglyConnectedComponentsPearce(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.n_scc, self.expected_n_scc)
+        self.assertEqual(algorithm.scc, self.expected_scc)
+        self.assertRaises(ValueError, StronglyConnectedComponentsPearce,
+            Graph(n=1, directed=False))
+
+    def test_condensation(self):
+        algorithm = StronglyConnectedComponentsPearce(self.G)
+        algorithm.run()
+        dag = algorithm.condensation()
+        self.assertEqual(dag.v(), self.expected_n_scc)
+        self.assertEqual(sorted((edge.source, edge.target)
+            for edge in dag.iteredges()),
+            [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)])
+        # Component numbers are in a topological order.
+        algorithm = TopologicalSortQueue(dag)
+        algorithm.run()
+        self.assertEqual(algorithm.sorted_nodes, [0, 1, 2, 3])
+        algorithm = DAGShortestPath(dag)
+        algorithm.run(0)
+        self.assertEqual(algorithm.distance[3], 2)
+
+    def test_scc_pearce_long_cycle(self):
+        N = 20000
+        G = Graph(n=N, directed=True)
+        for node in range(N):
+            G.add_edge(Edge(node, (node + 1) % N))
+        G.add_edge(Edge(N-1, N))   # a sink
+        algorithm = StronglyConnectedComponentsPearce(G)
+        algorithm.run()
+        self.assertEqual(algorithm.n_scc, 2)
+        self.assertEqual(algorithm.scc[0], 0)
+        self.assertEqual(algorithm.scc[N-1], 0)
+        self.assertEqual(algorithm.scc[N], 1)
+
     def tearDown(self): pass
 
 if __name__ == "__main__":
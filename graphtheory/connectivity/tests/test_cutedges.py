@@ -50,6 +50,22 @@ class TestCutEdge(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestCutEdgeLongPath(unittest.TestCase):
+
+    def test_long_path(self):
+        N = 20000
+        G = Graph(n=N)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1))
+        algorithm = TarjanCutEdge(G)
+        algorithm.run(0)
+        self.assertEqual(len(algorithm.cut_edges), N-1)
+        G.add_edge(Edge(0, N-1))   # a cycle
+        algorithm = TarjanCutEdge(G)
+        algorithm.run(0)
+        self.assertEqual(algorithm.cut_edges, [])
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -62,6 +62,20 @@ class TestCutNode(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestCutNodeLongPath(unittest.TestCase):
+
+    def test_long_path(self):
+        N = 20000
+        G = Graph(n=N)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1))
+        algorithm = TarjanCutNode(G)
+        algorithm.run(N // 2)   # the root is a cut node
+        self.assertEqual(sorted(algorithm.cut_nodes), list(range(1, N-1)))
+        G.add_edge(Edge(0, N-1))   # a cycle
+        self.assertTrue(is_biconnected(G))
+
 if __name__ == "__main__":
 
     unittest.main()
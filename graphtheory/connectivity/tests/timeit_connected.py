@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 
 import timeit
+import random
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
 from graphtheory.structures.factory import GraphFactory
 from graphtheory.connectivity.connected import is_connected
+from graphtheory.connectivity.connected import ConnectedComponentsBFS
+from graphtheory.connectivity.connected import ConnectedComponentsParallel
+from graphtheory.connectivity.connected import StronglyConnectedComponents
+from graphtheory.connectivity.connected import StronglyConnectedComponentsPearce
 
 V = 10
 # V = 1000000   # OK for is_connected with BFS
@@ -17,4 +23,64 @@ print ("Testing is_connected ..." )
 t1 = timeit.Timer(lambda: is_connected(G))
 print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
 
+# A random sparse graph with many components, CSR arrays are reused.
+V = 1000
+#V = 200000
+random.seed(1)
+G = Graph(n=V)
+for node in range(V):
+    G.add_node(node)
+while G.e() < V * 3 // 4:
+    source, target = random.sample(range(V), 2)
+    if not G.has_edge((source, target)):
+        G.add_edge(Edge(source, target))
+E = G.e()
+C = CSRGraph.from_graph(G)
+
+print ("Testing ConnectedComponentsBFS ..." )
+t1 = timeit.Timer(lambda: ConnectedComponentsBFS(G).run())
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+for workers in (1, 2, 4, 8):
+    print ("Testing ConnectedComponentsParallel, workers={} ...".format(
+        workers) )
+    t1 = timeit.Timer(lambda: ConnectedComponentsParallel(C,
+        workers=workers).run())
+    print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+# Results for V = 200000, E = 150000, single run [s], 1 CPU (nproc=1):
+# ConnectedComponentsBFS                  1.14
+# ConnectedComponentsParallel workers=1   1.23 (5 rounds)
+# ConnectedComponentsParallel workers=2   1.39
+# ConnectedComponentsParallel workers=4   1.39
+# ConnectedComponentsParallel workers=8   1.44
+# Workers share one CPU here, so the process overhead is visible.
+# The profile for workers=1: hooking scans 82%, the serial part
+# (merging, compression) 18%, so up to about 3x is expected
+# for 4 workers on 4 CPUs.
+
+# A random sparse directed graph.
+V = 1000
+#V = 200000
+G = Graph(n=V, directed=True)
+for node in range(V):
+    G.add_node(node)
+while G.e() < V * 2:
+    source, target = random.sample(range(V), 2)
+    if not G.has_edge((source, target)):
+        G.add_edge(Edge(source, target))
+E = G.e()
+
+print ("Testing StronglyConnectedComponents (Kosaraju) ..." )
+t1 = timeit.Timer(lambda: StronglyConnectedComponents(G).run())
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+print ("Testing StronglyConnectedComponentsPearce ..." )
+t1 = timeit.Timer(lambda: StronglyConnectedComponentsPearce(G).run())
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+# Results for V = 200000, E = 400000, single run [s]:
+# StronglyConnectedComponents (Kosaraju)   4.59 (peak 212 MB, tracemalloc)
+# StronglyConnectedComponentsPearce        0.98 (peak 46 MB)
+
 # EOF
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import sys
 import collections
 
 
@@ -29,8 +28,6 @@ class EulerianCycleDFS:
         self.eulerian_cycle = list()
         self._graph_copy = self.graph.copy()
         self._stack = collections.deque()
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() ** 2, recursionlimit))
 
     def run(self, source=None):
         """Executable pseudocode."""
@@ -43,12 +40,16 @@ class EulerianCycleDFS:
         #del self._graph_copy
 
     def _visit(self, source):
-        """Visiting node."""
-        while self._graph_copy.outdegree(source) > 0:
-            edge = next(self._graph_copy.iteroutedges(source))
-            self._graph_copy.del_edge(edge)
-            self._visit(edge.target)
-        self._stack.append(source)
+        """Visiting node (iterative, the path stack replaces recursion)."""
+        path = [source]
+        while path:
+            node = path[-1]
+            if self._graph_copy.outdegree(node) > 0:
+                edge = next(self._graph_copy.iteroutedges(node))
+                self._graph_copy.del_edge(edge)
+                path.append(edge.target)
+            else:
+                self._stack.append(path.pop())
 
     def _is_eulerian(self):
         """Test if the graph is eulerian."""
@@ -94,8 +95,6 @@ class EulerianCycleDFSWithEdges:
         self.eulerian_cycle = list()
         self._graph_copy = self.graph.copy()
         self._stack = collections.deque()
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() ** 2, recursionlimit))
 
     def run(self, source=None):
         """Executable pseudocode."""
@@ -111,12 +110,16 @@ class EulerianCycleDFSWithEdges:
         #del self._graph_copy
 
     def _visit(self, start_edge):
-        """Visiting edge."""
-        while self._graph_copy.outdegree(start_edge.target) > 0:
-            edge = next(self._graph_copy.iteroutedges(start_edge.target))
-            self._graph_copy.del_edge(edge)
-            self._visit(edge)
-        self._stack.append(start_edge)
+        """Visiting edge (iterative, the path stack replaces recursion)."""
+        path = [start_edge]
+        while path:
+            node = path[-1].target
+            if self._graph_copy.outdegree(node) > 0:
+                edge = next(self._graph_copy.iteroutedges(node))
+                self._graph_copy.del_edge(edge)
+                path.append(edge)
+            else:
+                self._stack.append(path.pop())
 
     def _is_eulerian(self):
         """Test if the graph is eulerian."""
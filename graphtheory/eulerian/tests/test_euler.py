@@ -190,6 +190,23 @@ class TestEulerianCycleDirected2(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestEulerianLongCycle(unittest.TestCase):
+
+    def test_long_cycle(self):
+        N = 20000
+        G = Graph(n=N)
+        for node in range(N):
+            G.add_edge(Edge(node, (node+1) % N))
+        algorithm = EulerianCycleDFS(G)
+        algorithm.run(0)
+        self.assertEqual(len(algorithm.eulerian_cycle), N+1)
+        self.assertEqual(algorithm.eulerian_cycle[0], 0)
+        self.assertEqual(algorithm.eulerian_cycle[-1], 0)
+        algorithm = EulerianCycleDFSWithEdges(G)
+        algorithm.run(0)
+        self.assertEqual(len(algorithm.eulerian_cycle), N)
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -2,6 +2,7 @@
 
 import collections
 from graphtheory.structures.edges import Edge
+from graphtheory.structures.views import graph_class
 
 
 class Dinic:
@@ -31,7 +32,7 @@ class Dinic:
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
-        self.residual = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.residual = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():
             self.residual.add_node(node)
         # Initial capacities for the residual network.
@@ -128,7 +129,7 @@ class DinicSparse:
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
-        self.residual = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.residual = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():
             self.residual.add_node(node)
         # Legal flow.
@@ -2,6 +2,7 @@
 
 import collections
 from graphtheory.structures.edges import Edge
+from graphtheory.structures.views import graph_class
 
 
 class EdmondsKarp:
@@ -28,7 +29,7 @@ class EdmondsKarp:
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
-        self.residual = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.residual = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():
             self.residual.add_node(node)
         # Initial capacities for the residual network.
@@ -109,7 +110,7 @@ class EdmondsKarpSparse:
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
-        self.residual = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.residual = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():
             self.residual.add_node(node)
         # Legal flow.
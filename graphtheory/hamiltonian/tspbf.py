@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import sys
+from graphtheory.structures.views import graph_class
 
 class BruteForceTSPWithEdges:
     """The brute force algorithm (a.k.a. exhaustive search) for TSP.
@@ -78,7 +79,7 @@ class BruteForceTSPWithGraph:
         self.graph = graph
         self.hamiltonian_cycle = None
         self.source = None
-        self._path = self.graph.__class__(n=self.graph.v(),
+        self._path = graph_class(self.graph)(n=self.graph.v(),
             directed=self.graph.is_directed())
         for node in self.graph.iternodes():
             self._path.add_node(node)
@@ -8,6 +8,7 @@ except NameError:   # Python 3
 
 from graphtheory.spanningtrees.prim import PrimMatrixMSTWithEdges
 from graphtheory.traversing.dfs import SimpleDFS
+from graphtheory.structures.views import graph_class
 
 
 class PrimTSPWithEdges:
@@ -67,7 +68,7 @@ class PrimTSPWithGraph:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.hamiltonian_cycle = self.graph.__class__(n=self.graph.v())
+        self.hamiltonian_cycle = graph_class(self.graph)(n=self.graph.v())
         for node in self.graph.iternodes():
             self.hamiltonian_cycle.add_node(node)
         self.source = None
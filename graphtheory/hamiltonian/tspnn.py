@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from graphtheory.structures.views import graph_class
+
 try:
     integer_types = (int, long)
     range = xrange
@@ -63,7 +65,7 @@ class NearestNeighborTSPWithGraph:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.hamiltonian_cycle = self.graph.__class__(n=self.graph.v(),
+        self.hamiltonian_cycle = graph_class(self.graph)(n=self.graph.v(),
             directed=self.graph.is_directed())
         for node in self.graph.iternodes():
             self.hamiltonian_cycle.add_node(node)
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from graphtheory.structures.views import graph_class
+
 try:
     integer_types = (int, long)
     range = xrange
@@ -76,7 +78,7 @@ class RepeatedNearestNeighborTSPWithGraph:
         """Executable pseudocode."""
         for source in self.graph.iternodes():
             start_node = source
-            cycle = self.graph.__class__(n=self.graph.v())
+            cycle = graph_class(self.graph)(n=self.graph.v())
             for node in self.graph.iternodes():
                 cycle.add_node(node)
             self._used = dict((node, False) for node in self.graph.iternodes())
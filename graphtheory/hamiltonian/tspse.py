@@ -7,6 +7,7 @@ except ImportError:   # Python 3
     from queue import PriorityQueue
 
 from graphtheory.structures.unionfind import UnionFind
+from graphtheory.structures.views import graph_class
 
 
 class SortedEdgeTSPWithEdges:
@@ -98,7 +99,7 @@ class SortedEdgeTSPWithGraph:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.hamiltonian_cycle = self.graph.__class__(n=self.graph.v())
+        self.hamiltonian_cycle = graph_class(self.graph)(n=self.graph.v())
         for node in self.graph.iternodes():
             self.hamiltonian_cycle.add_node(node)
         self._uf = UnionFind()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+
+import sys
+import shutil
+import struct
+import tempfile
+from array import array
+from graphtheory.structures.csrgraphs import CSRGraph
+
+try:
+    import numpy
+except ImportError:   # memory mapping is not available
+    numpy = None
+
+# The binary graph format (little-endian, sections aligned to 8 bytes).
+#
+# header    : magic, version, flags, node kind, n, m, section positions
+# nodes     : empty (range(n)), int64[n], or uint64[n+1] offsets + UTF-8
+# offsets   : int64[n+1]
+# targets   : int64[m] (node ids, sorted in every row)
+# weights   : int64[m] or float64[m]
+# edge_next : int64[m] (optional, positions in targets)
+# edge_prev : int64[m] (optional, positions in targets)
+#
+# m is the length of targets (undirected edges are stored twice).
+
+MAGIC = b"GTGRAPH\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sHHHHqqqqqqqqq")
+
+DIRECTED = 1
+FLOAT_WEIGHTS = 2
+
+NODES_RANGE = 0
+NODES_INT = 1
+NODES_STR = 2
+
+CHUNK = 1 << 16   # numbers converted at once
+
+
+def _node_kind(nodes):
+    """Return the kind of the node table."""
+    if all(isinstance(node, int) for node in nodes):
+        if all(node == i for i, node in enumerate(nodes)):
+            return NODES_RANGE
+        return NODES_INT
+    if all(isinstance(node, str) for node in nodes):
+        return NODES_STR
+    raise ValueError("nodes must be int or str")
+
+
+def _is_float(weights):
+    """Test if weights have to be stored as float64."""
+    typecode = getattr(weights, "typecode", None)
+    if typecode is not None:
+        return typecode in "fd"
+    dtype = getattr(weights, "dtype", None)
+    if dtype is not None:
+        return dtype.kind == "f"
+    return not all(isinstance(weight, int) for weight in weights)
+
+
+def _align(fileobj):
+    """Pad the file to a multiple of 8 bytes."""
+    fileobj.write(b"\x00" * (-fileobj.tell() % 8))
+
+
+def _write_buffer(fileobj, values, typecode):
+    """Write numbers as int64 ("q") or float64 ("d") in chunks."""
+    for start in range(0, len(values), CHUNK):
+        chunk = values[start:start + CHUNK]
+        if getattr(chunk, "typecode", None) != typecode:
+            chunk = array(typecode, chunk)
+        if sys.byteorder == "big":
+            chunk = array(typecode, chunk)
+            chunk.byteswap()
+        fileobj.write(chunk.tobytes())
+
+
+def _read_buffer(fileobj, position, count, typecode):
+    """Read numbers from the file into an array."""
+    buffer = array(typecode)
+    fileobj.seek(position)
+    buffer.frombytes(fileobj.read(8 * count))
+    if len(buffer) != count:
+        raise ValueError("the file is truncated")
+    if sys.byteorder == "big":
+        buffer.byteswap()
+    return buffer
+
+
+def _map_buffer(path, position, count, typecode):
+    """Return a read-only NumPy memory map of numbers from the file."""
+    dtype = ("<i8" if typecode == "q" else "<f8")
+    if count == 0:   # empty files can not be mapped
+        return numpy.zeros(0, dtype=dtype)
+    return numpy.memmap(path, dtype=dtype, mode="r",
+        offset=position, shape=(count,))
+
+
+def _write_nodes(fileobj, nodes):
+    """Write the node table, return (kind, position, size)."""
+    kind = _node_kind(nodes)
+    _align(fileobj)
+    position = fileobj.tell()
+    if kind == NODES_INT:
+        _write_buffer(fileobj, nodes, "q")
+    elif kind == NODES_STR:
+        data = [node.encode("utf-8") for node in nodes]
+        offsets = array("q", [0])
+        for item in data:
+            offsets.append(offsets[-1] + len(item))
+        _write_buffer(fileobj, offsets, "q")
+        for item in data:
+            fileobj.write(item)
+    return kind, position, fileobj.tell() - position
+
+
+def _read_nodes(fileobj, kind, n, position):
+    """Read the node table into a list."""
+    if kind == NODES_RANGE:
+        return list(range(n))
+    elif kind == NODES_INT:
+        return _read_buffer(fileobj, position, n, "q").tolist()
+    elif kind == NODES_STR:
+        offsets = _read_buffer(fileobj, position, n + 1, "q")
+        data = fileobj.read(offsets[n])
+        return [data[offsets[i]:offsets[i+1]].decode("utf-8")
+            for i in range(n)]
+    raise ValueError("unknown node table")
+
+
+def _write_header(fileobj, flags, kind, n, m, positions):
+    """Write the header at the beginning of the file."""
+    fileobj.seek(0)
+    fileobj.write(HEADER.pack(MAGIC, VERSION, flags, kind, 0, n, m,
+        *positions))
+
+
+def save(graph, path):
+    """Save a graph in the binary format.
+
+    Parameters
+    ----------
+    graph : any graph (converted to CSRGraph if needed),
+        nodes must be int or str
+    path : str, the file name
+
+    Examples
+    --------
+    >>> from graphtheory.io.binary import save, load
+    >>> save(G, "graph.bin")
+    >>> H = load("graph.bin")   # CSRGraph with memory-mapped buffers
+
+    Notes
+    -----
+    The planar embedding (edge_next, edge_prev) is saved if present.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+    graph.freeze()
+    n, m = graph.v(), len(graph.targets)
+    flags = (DIRECTED if graph.is_directed() else 0)
+    weight_code = "q"
+    if _is_float(graph.weights):
+        flags |= FLOAT_WEIGHTS
+        weight_code = "d"
+    with open(path, "wb") as fileobj:
+        fileobj.write(b"\x00" * HEADER.size)
+        kind, nodes_pos, nodes_size = _write_nodes(fileobj, graph.nodes)
+        positions = [nodes_pos, nodes_size]
+        for buffer, typecode in [(graph.offsets, "q"), (graph.targets, "q"),
+                (graph.weights, weight_code), (graph.edge_next, "q"),
+                (graph.edge_prev, "q")]:
+            if buffer is None:
+                positions.append(0)
+                continue
+            _align(fileobj)
+            positions.append(fileobj.tell())
+            _write_buffer(fileobj, buffer, typecode)
+        _write_header(fileobj, flags, kind, n, m, positions)
+
+
+def load(path, mmap=True):
+    """Load a graph from the binary format.
+
+    Parameters
+    ----------
+    path : str, the file name
+    mmap : bool, optional (default=True), buffers are NumPy memory maps
+        (read on demand), else they are read into array.array
+
+    Returns
+    -------
+    graph : a frozen CSRGraph (no Edge objects are created)
+    """
+    if mmap and numpy is None:
+        raise ValueError("NumPy is required for memory mapping")
+    with open(path, "rb") as fileobj:
+        data = fileobj.read(HEADER.size)
+        if len(data) != HEADER.size:
+            raise ValueError("not a graph file")
+        (magic, version, flags, kind, _, n, m, nodes_pos, nodes_size,
+            offsets_pos, targets_pos, weights_pos, next_pos, prev_pos) = \
+            HEADER.unpack(data)
+        if magic != MAGIC:
+            raise ValueError("not a graph file")
+        if version != VERSION:
+            raise ValueError("unsupported version {}".format(version))
+        nodes = _read_nodes(fileobj, kind, n, nodes_pos)
+        weight_code = ("d" if flags & FLOAT_WEIGHTS else "q")
+        buffers = []
+        for position, count, typecode in [(offsets_pos, n + 1, "q"),
+                (targets_pos, m, "q"), (weights_pos, m, weight_code),
+                (next_pos, m, "q"), (prev_pos, m, "q")]:
+            if position == 0:
+                buffers.append(None)
+            elif mmap:
+                buffers.append(_map_buffer(path, position, count, typecode))
+            else:
+                buffers.append(_read_buffer(fileobj, position, count, typecode))
+    offsets, targets, weights, edge_next, edge_prev = buffers
+    graph = CSRGraph.from_arrays(nodes, offsets, targets, weights,
+        directed=bool(flags & DIRECTED))
+    graph.edge_next = edge_next
+    graph.edge_prev = edge_prev
+    return graph
+
+
+class GraphWriter:
+    """Streaming writer for the binary format (rows are not kept in memory).
+
+    Outedges are written row by row in the node order. Targets are
+    node ids from range(n). Undirected edges have to be written
+    in both directions. Missing rows are empty.
+
+    Examples
+    --------
+    >>> from graphtheory.io.binary import GraphWriter
+    >>> with GraphWriter("graph.bin", n=3, directed=True) as writer:
+    ...     writer.add_row([1, 2], [5, 6])   # edges from the node 0
+    ...     writer.add_row([2])              # weight 1
+    """
+
+    def __init__(self, path, *, n, directed=False, nodes=None,
+            float_weights=False):
+        """Open the file and write the node table.
+
+        Parameters
+        ----------
+        path : str, the file name
+        n : int, the number of nodes
+        directed : bool, optional (default=False)
+        nodes : list of int or str, optional (default range(n))
+        float_weights : bool, optional (default=False)
+        """
+        if nodes is None:
+            nodes = range(n)
+        if len(nodes) != n:
+            raise ValueError("n and nodes do not match")
+        self.n = n
+        self.m = 0
+        self.row = 0
+        self.flags = (DIRECTED if directed else 0)
+        self.weight_code = "q"
+        if float_weights:
+            self.flags |= FLOAT_WEIGHTS
+            self.weight_code = "d"
+        self.fileobj = open(path, "wb")
+        self.fileobj.write(b"\x00" * HEADER.size)
+        self.kind, self.nodes_pos, self.nodes_size = _write_nodes(
+            self.fileobj, nodes)
+        _align(self.fileobj)
+        self.targets_pos = self.fileobj.tell()
+        # Offsets and weights are copied after targets.
+        self._offsets = tempfile.TemporaryFile()
+        self._weights = tempfile.TemporaryFile()
+        _write_buffer(self._offsets, [0], "q")
+
+    def add_row(self, targets, weights=None):
+        """Write outedges of the next node (weights are 1 by default)."""
+        if self.row >= self.n:
+            raise ValueError("too many rows")
+        if weights is None:
+            weights = [1] * len(targets)
+        if len(weights) != len(targets):
+            raise ValueError("targets and weights do not match")
+        row = sorted(zip(targets, weights))
+        if row and (row[0][0] < 0 or row[-1][0] >= self.n):
+            raise ValueError("node out of range")
+        _write_buffer(self.fileobj, [target for (target, _) in row], "q")
+        _write_buffer(self._weights, [weight for (_, weight) in row],
+            self.weight_code)
+        self.m += len(row)
+        self.row += 1
+        _write_buffer(self._offsets, [self.m], "q")
+
+    def close(self):
+        """Write empty rows, offsets, weights, and the header."""
+        if self.fileobj is None:
+            return
+        while self.row < self.n:
+            self.add_row([])
+        offsets_pos = self.fileobj.tell()
+        self._offsets.seek(0)
+        shutil.copyfileobj(self._offsets, self.fileobj)
+        weights_pos = self.fileobj.tell()
+        self._weights.seek(0)
+        shutil.copyfileobj(self._weights, self.fileobj)
+        _write_header(self.fileobj, self.flags, self.kind, self.n, self.m,
+            [self.nodes_pos, self.nodes_size, offsets_pos, self.targets_pos,
+            weights_pos, 0, 0])
+        self._offsets.close()
+        self._weights.close()
+        self.fileobj.close()
+        self.fileobj = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# EOF
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.multigraphs import MultiGraph
+from graphtheory.io.edgelist import open_text, iter_lines, write_lines
+from graphtheory.io.edgelist import node_ids
+
+
+def iter_dimacs(path):
+    """Generate lines of the DIMACS file as lists of items (no comments).
+
+    Parameters
+    ----------
+    path : str, the file name (gzip if it ends with .gz)
+
+    Yields
+    ------
+    lists of str, for example ["p", "sp", "4", "5"] or ["a", "1", "2", "7"]
+    """
+    with open_text(path) as fileobj:
+        for line in iter_lines(fileobj):
+            items = line.split()
+            if not items or items[0] == "c":
+                continue
+            yield items
+
+
+def _read_problem(lines, kind):
+    """Return n from the problem line (lines before arcs are consumed)."""
+    for items in lines:
+        if items[0] == "p":
+            if items[1] != kind:
+                raise ValueError("not a {} problem".format(
+                    "shortest path" if kind == "sp" else "maximum flow"))
+            return int(items[2])
+        if items[0] == "a":
+            break
+    raise ValueError("the problem line is missing")
+
+
+def _arc_weight(graph, source, target):
+    """Return the weight of the arc (one edge for a pair in MultiGraph)."""
+    if isinstance(graph, MultiGraph):   # weight() counts parallel edges
+        return graph[source][target][0].weight
+    return graph.weight((source, target))
+
+
+def _del_arc(graph, source, target):
+    """Remove the arc (the stored edge for MultiGraph)."""
+    if isinstance(graph, MultiGraph):
+        graph.del_edge(graph[source][target][0])
+    else:
+        graph.del_edge((source, target))
+
+
+def read_dimacs_sp(path, graph_class=Graph):
+    """Read a directed graph from the DIMACS shortest path file (.gr).
+
+    Nodes are int from 1 to n. Loops are skipped, from parallel arcs
+    the arc with the smallest weight is kept. For MultiGraph every
+    parallel arc is kept (the same arcs only once).
+    Arcs are streamed to add_edges_from (the file is not buffered).
+
+    Examples
+    --------
+    >>> from graphtheory.io.dimacs import read_dimacs_sp
+    >>> from graphtheory.shortestpaths.dijkstra import Dijkstra
+    >>> G = read_dimacs_sp("USA-road-d.NY.gr.gz")
+    >>> algorithm = Dijkstra(G)
+    >>> algorithm.run(1)
+    """
+    lines = iter_dimacs(path)
+    n = _read_problem(lines, "sp")
+    graph = graph_class(n=n, directed=True)
+    for node in range(1, n + 1):
+        graph.add_node(node)
+    multi = isinstance(graph, MultiGraph)
+
+    def iterarcs():
+        for items in lines:
+            if items[0] != "a":
+                continue
+            source, target = int(items[1]), int(items[2])
+            weight = int(items[3])
+            if source == target:
+                continue
+            edge = Edge(source, target, weight)
+            if multi:
+                if (target in graph[source]
+                        and edge in graph[source][target]):   # the same arc
+                    continue
+            elif graph.has_edge((source, target)):   # a parallel arc
+                if weight < graph.weight((source, target)):
+                    graph.del_edge((source, target))
+                    graph.add_edge(edge)
+                continue
+            yield edge
+
+    graph.add_edges_from(iterarcs())
+    return graph
+
+
+def read_dimacs_flow(path, graph_class=Graph):
+    """Read a flow network from the DIMACS maximum flow file (.max).
+
+    Returns
+    -------
+    (graph, source, sink) : the graph is ready for flow algorithms
+
+    Notes
+    -----
+    Nodes are int from 1 to n. Loops are skipped, capacities of parallel
+    arcs are added. Antiparallel arcs are forbidden in flow algorithms
+    (the residual network), so the second arc (u, v) is replaced
+    by arcs (u, x) and (x, v) with a new node x > n (the same max flow).
+    Arcs are streamed to add_edges_from (the file is not buffered).
+
+    Examples
+    --------
+    >>> from graphtheory.io.dimacs import read_dimacs_flow
+    >>> from graphtheory.flow.dinic import Dinic
+    >>> G, source, sink = read_dimacs_flow("network.max")
+    >>> algorithm = Dinic(G)
+    >>> algorithm.run(source, sink)
+    """
+    lines = iter_dimacs(path)
+    n = _read_problem(lines, "max")
+    graph = graph_class(n=n, directed=True)
+    for node in range(1, n + 1):
+        graph.add_node(node)
+    terminals = dict()   # "s" or "t" -> node
+    split = dict()   # (node1, node2) -> new node for antiparallel arcs
+
+    def iterarcs():
+        last = n   # the last node
+        for items in lines:
+            if items[0] == "n":
+                terminals[items[2]] = int(items[1])
+                continue
+            if items[0] != "a":
+                continue
+            node1, node2 = int(items[1]), int(items[2])
+            capacity = int(items[3])
+            if node1 == node2:
+                continue
+            if graph.has_edge((node1, node2)):   # a parallel arc
+                capacity += _arc_weight(graph, node1, node2)
+                _del_arc(graph, node1, node2)
+                graph.add_edge(Edge(node1, node2, capacity))
+            elif graph.has_edge((node2, node1)):   # antiparallel arc
+                node = split.get((node1, node2))
+                if node is None:
+                    last += 1
+                    split[(node1, node2)] = last
+                    yield Edge(node1, last, capacity)
+                    yield Edge(last, node2, capacity)
+                else:
+                    capacity += _arc_weight(graph, node1, node)
+                    _del_arc(graph, node1, node)
+                    _del_arc(graph, node, node2)
+                    graph.add_edge(Edge(node1, node, capacity))
+                    graph.add_edge(Edge(node, node2, capacity))
+            else:
+                yield Edge(node1, node2, capacity)
+
+    graph.add_edges_from(iterarcs())
+    if "s" not in terminals or "t" not in terminals:
+        raise ValueError("source or sink is missing")
+    return graph, terminals["s"], terminals["t"]
+
+
+def write_dimacs_sp(graph, path):
+    """Write a directed graph to the DIMACS shortest path file (.gr).
+
+    Nodes are mapped to 1..n (the iternodes order) if they are not
+    int from 1 to n.
+    """
+    if not graph.is_directed():
+        raise ValueError("the graph is not directed")
+    node_id = node_ids(graph)
+    lines = ["p sp {} {}\n".format(graph.v(), graph.e())]
+    arcs = ("a {} {} {}\n".format(node_id[edge.source],
+        node_id[edge.target], edge.weight) for edge in graph.iteredges())
+    with open_text(path, "w") as fileobj:
+        write_lines(fileobj, lines)
+        write_lines(fileobj, arcs)
+
+
+def write_dimacs_flow(graph, source, sink, path):
+    """Write a flow network to the DIMACS maximum flow file (.max).
+
+    Nodes are mapped to 1..n (the iternodes order) if they are not
+    int from 1 to n.
+    """
+    if not graph.is_directed():
+        raise ValueError("the graph is not directed")
+    node_id = node_ids(graph)
+    lines = ["p max {} {}\n".format(graph.v(), graph.e()),
+        "n {} s\n".format(node_id[source]),
+        "n {} t\n".format(node_id[sink])]
+    arcs = ("a {} {} {}\n".format(node_id[edge.source],
+        node_id[edge.target], edge.weight) for edge in graph.iteredges())
+    with open_text(path, "w") as fileobj:
+        write_lines(fileobj, lines)
+        write_lines(fileobj, arcs)
+
+# EOF
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import gzip
+from graphtheory.structures.graphs import Graph
+
+CHUNK = 1 << 20   # bytes read or written at once
+
+
+def open_text(path, mode="r"):
+    """Open a text file with a large buffer (gzip for names ending with .gz)."""
+    if path.endswith(".gz"):   # level 6 is much faster than 9
+        return gzip.open(path, mode + "t", compresslevel=6)
+    return open(path, mode, buffering=CHUNK)
+
+
+def iter_lines(fileobj, chunk_size=CHUNK):
+    """Generate lines reading the file in chunks (constant memory)."""
+    while True:
+        lines = fileobj.readlines(chunk_size)
+        if not lines:
+            break
+        for line in lines:
+            yield line
+
+
+def write_lines(fileobj, lines, chunk_size=CHUNK):
+    """Write lines in large blocks (buffered output)."""
+    block = []
+    size = 0
+    for line in lines:
+        block.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            fileobj.write("".join(block))
+            block = []
+            size = 0
+    fileobj.write("".join(block))
+
+
+def node_ids(graph):
+    """Return a dict node -> id from 1 to n (identity for nodes 1..n)."""
+    nodes = list(graph.iternodes())
+    if set(nodes) == set(range(1, len(nodes) + 1)):
+        return dict((node, node) for node in nodes)
+    return dict((node, i) for i, node in enumerate(nodes, 1))
+
+
+def iter_edge_list(path, nodetype=int, weighttype=int, comments="#%"):
+    """Generate edges from the edge list file on demand.
+
+    Every line contains "source target" or "source target weight".
+    Empty lines and lines starting with comment characters are skipped.
+
+    Parameters
+    ----------
+    path : str, the file name (gzip if it ends with .gz)
+    nodetype : callable, optional (default=int)
+    weighttype : callable, optional (default=int)
+    comments : str, optional (default="#%")
+
+    Yields
+    ------
+    tuples (source, target) or (source, target, weight)
+    """
+    with open_text(path) as fileobj:
+        for line in iter_lines(fileobj):
+            items = line.split()
+            if not items or items[0][0] in comments:
+                continue
+            if len(items) == 2:
+                yield (nodetype(items[0]), nodetype(items[1]))
+            elif len(items) == 3:
+                yield (nodetype(items[0]), nodetype(items[1]),
+                    weighttype(items[2]))
+            else:
+                raise ValueError("bad line {!r}".format(line))
+
+
+def read_edge_list(path, graph_class=Graph, directed=False,
+        nodetype=int, weighttype=int, comments="#%"):
+    """Read a graph or a multigraph from the edge list file.
+
+    Parameters
+    ----------
+    path : str, the file name (gzip if it ends with .gz)
+    graph_class : class, optional (default=Graph), Graph or MultiGraph
+    directed : bool, optional (default=False)
+    nodetype, weighttype, comments : see iter_edge_list
+
+    Returns
+    -------
+    graph : a new graph (edges are loaded with add_edges_from)
+
+    Examples
+    --------
+    >>> from graphtheory.io.edgelist import read_edge_list, write_edge_list
+    >>> G = read_edge_list("graph.txt.gz", directed=True)
+    >>> write_edge_list(G, "graph.txt")
+    """
+    graph = graph_class(directed=directed)
+    graph.add_edges_from(iter_edge_list(path, nodetype=nodetype,
+        weighttype=weighttype, comments=comments))
+    return graph
+
+
+def write_edge_list(graph, path, weights=True):
+    """Write the graph as an edge list (buffered output).
+
+    Parameters
+    ----------
+    graph : any graph or multigraph
+    path : str, the file name (gzip if it ends with .gz)
+    weights : bool, optional (default=True), write the third column
+    """
+    if weights:
+        lines = ("{} {} {}\n".format(edge.source, edge.target, edge.weight)
+            for edge in graph.iteredges())
+    else:
+        lines = ("{} {}\n".format(edge.source, edge.target)
+            for edge in graph.iteredges())
+    with open_text(path, "w") as fileobj:
+        write_lines(fileobj, lines)
+
+# EOF
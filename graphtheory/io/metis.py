@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+from graphtheory.structures.graphs import Graph
+from graphtheory.io.edgelist import open_text, iter_lines, write_lines
+from graphtheory.io.edgelist import node_ids
+
+
+def _iter_rows(path):
+    """Generate the header and rows of the METIS file (no comments)."""
+    with open_text(path) as fileobj:
+        for line in iter_lines(fileobj):
+            if line.startswith("%"):
+                continue
+            yield line.split()
+
+
+def read_metis(path, graph_class=Graph):
+    """Read an undirected graph from the METIS graph file.
+
+    The header is "n m [fmt [ncon]]", the i-th row contains neighbors
+    of the node i (nodes are int from 1 to n). fmt is a binary number
+    [vsize][vwgt][ewgt]. Node sizes and node weights are skipped,
+    edge weights follow neighbors if ewgt is 1.
+
+    Examples
+    --------
+    >>> from graphtheory.io.metis import read_metis, write_metis
+    >>> G = read_metis("4elt.graph")
+    >>> write_metis(G, "copy.graph")
+    """
+    rows = _iter_rows(path)
+    header = next(rows, None)
+    while header is not None and not header:   # empty lines before header
+        header = next(rows, None)
+    if header is None:
+        raise ValueError("the header is missing")
+    n, m = int(header[0]), int(header[1])
+    fmt = (header[2].zfill(3) if len(header) > 2 else "000")
+    ncon = (int(header[3]) if len(header) > 3 else 1)
+    skip = (1 if fmt[0] == "1" else 0) + (ncon if fmt[1] == "1" else 0)
+    step = (2 if fmt[2] == "1" else 1)
+    graph = graph_class(n=n)
+    for node in range(1, n + 1):
+        graph.add_node(node)
+    source = 0
+    for items in rows:
+        source += 1
+        if source > n:
+            if items:
+                raise ValueError("too many rows")
+            continue
+        edges = []
+        for k in range(skip, len(items), step):
+            target = int(items[k])
+            if target > source:   # every edge is listed twice
+                if step == 2:
+                    edges.append((source, target, int(items[k+1])))
+                else:
+                    edges.append((source, target))
+        graph.add_edges_from(edges)
+    if graph.e() != m:
+        raise ValueError("the number of edges is not m")
+    return graph
+
+
+def write_metis(graph, path):
+    """Write an undirected graph to the METIS graph file.
+
+    Nodes are mapped to 1..n (the iternodes order) if they are not
+    int from 1 to n. Edge weights are written if some weight is not 1
+    (fmt 001).
+    """
+    if graph.is_directed():
+        raise ValueError("the graph is directed")
+    node_id = node_ids(graph)
+    nodes = sorted(graph.iternodes(), key=node_id.__getitem__)
+    weighted = any(edge.weight != 1 for edge in graph.iteredges())
+    if weighted:
+        header = "{} {} 001\n".format(len(nodes), graph.e())
+        rows = (" ".join("{} {}".format(node_id[edge.target], edge.weight)
+            for edge in graph.iteroutedges(node)) + "\n" for node in nodes)
+    else:
+        header = "{} {}\n".format(len(nodes), graph.e())
+        rows = (" ".join(str(node_id[target])
+            for target in graph.iteradjacent(node)) + "\n" for node in nodes)
+    with open_text(path, "w") as fileobj:
+        write_lines(fileobj, [header])
+        write_lines(fileobj, rows)
+
+
+def read_metis_partition(path):
+    """Read a METIS partition file (the i-th line is the part of the node i).
+
+    Returns
+    -------
+    dict : node (int from 1 to n) -> part (int)
+    """
+    partition = dict()
+    with open_text(path) as fileobj:
+        for node, line in enumerate(iter_lines(fileobj), 1):
+            partition[node] = int(line)
+    return partition
+
+
+def write_metis_partition(partition, path):
+    """Write a METIS partition file from a dict (nodes from 1 to n)."""
+    with open_text(path, "w") as fileobj:
+        write_lines(fileobj, ("{}\n".format(partition[node])
+            for node in range(1, len(partition) + 1)))
+
+# EOF
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.planarity.planarfactory import PlanarGraphFactory
+from graphtheory.io.binary import save, load, GraphWriter
+
+# A --o B
+# o   / o
+# |  /  |
+# | o   |
+# C --o D
+
+class TestBinaryFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.G = Graph(n=4, directed=True)
+        self.edges = [
+            Edge("A", "B", 2), Edge("B", "C", 4), Edge("C", "A", 6),
+            Edge("C", "D", 3), Edge("D", "B", 5)]
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "graph.bin")
+
+    def test_save_load(self):
+        save(self.G, self.path)
+        for mmap in (True, False):
+            T = load(self.path, mmap=mmap)
+            self.assertTrue(isinstance(T, CSRGraph))
+            self.assertTrue(T.is_directed())
+            self.assertTrue(T.is_frozen())
+            self.assertEqual(T.v(), 4)
+            self.assertEqual(T.e(), 5)
+            self.assertEqual(T.weight(("C", "A")), 6)
+            self.assertEqual(sorted(T.iteredges()), sorted(self.edges))
+            self.assertEqual(T.to_graph(), self.G)
+            del T   # closing memory maps
+
+    def test_int_nodes_float_weights(self):
+        G = Graph(n=4)
+        G.add_edge(Edge(10, 20, 1.5))
+        G.add_edge(Edge(20, 30, 2.5))
+        save(G, self.path)
+        T = load(self.path, mmap=False)
+        self.assertEqual(T.weights.typecode, "d")
+        self.assertEqual(T.to_graph(), G)
+        G = CSRGraph.from_edge_list([(0, 1), (1, 2), (2, 0)])
+        save(G, self.path)
+        T = load(self.path)
+        self.assertEqual(T, G)
+
+    def test_errors(self):
+        G = Graph()
+        G.add_edge(Edge((1, 2), (3, 4)))   # tuples as nodes
+        self.assertRaises(ValueError, save, G, self.path)
+        with open(self.path, "wb") as fileobj:
+            fileobj.write(b"not a graph")
+        self.assertRaises(ValueError, load, self.path)
+
+    def test_embedding(self):
+        G = PlanarGraphFactory(Graph).make_wheel(n=7)
+        save(G, self.path)
+        T = load(self.path, mmap=False).to_graph()
+        self.assertEqual(T, G)
+        self.assertEqual(T.edge_next, G.edge_next)
+        self.assertEqual(T.edge_prev, G.edge_prev)
+        self.assertEqual(T.f(), G.f())
+        self.assertEqual(len(list(T.iterfaces())), len(list(G.iterfaces())))
+
+    def test_writer(self):
+        nodes = ["A", "B", "C", "D"]
+        with GraphWriter(self.path, n=4, directed=True, nodes=nodes) as writer:
+            writer.add_row([1], [2])         # A
+            writer.add_row([2], [4])         # B
+            writer.add_row([3, 0], [3, 6])   # C, unsorted
+            writer.add_row([1], [5])         # D
+            self.assertRaises(ValueError, writer.add_row, [0])
+        T = load(self.path)
+        self.assertEqual(T.to_graph(), self.G)
+        with GraphWriter(self.path, n=3, float_weights=True) as writer:
+            writer.add_row([1], [0.5])
+            writer.add_row([0], [0.5])
+            self.assertRaises(ValueError, writer.add_row, [5])
+        T = load(self.path, mmap=False)
+        self.assertEqual(T.v(), 3)
+        self.assertEqual(T.e(), 1)
+        self.assertEqual(T.weight((1, 0)), 0.5)
+        self.assertEqual(T.outdegree(2), 0)   # missing rows are empty
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.multigraphs import MultiGraph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.flow.dinic import Dinic
+from graphtheory.io.edgelist import read_edge_list, write_edge_list
+from graphtheory.io.edgelist import iter_edge_list
+from graphtheory.io.dimacs import read_dimacs_sp, write_dimacs_sp
+from graphtheory.io.dimacs import read_dimacs_flow, write_dimacs_flow
+from graphtheory.io.metis import read_metis, write_metis
+from graphtheory.io.metis import read_metis_partition, write_metis_partition
+
+
+class TestEdgeList(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.G = GraphFactory(Graph).make_random(n=10, directed=True)
+
+    def test_round_trip(self):
+        for name in ("graph.txt", "graph.txt.gz"):
+            path = os.path.join(self.tmpdir, name)
+            write_edge_list(self.G, path)
+            T = read_edge_list(path, directed=True)
+            self.assertEqual(T.e(), self.G.e())
+            for edge in T.iteredges():
+                self.assertEqual(self.G.weight(edge), edge.weight)
+
+    def test_read(self):
+        path = os.path.join(self.tmpdir, "graph.txt")
+        with open(path, "w") as fileobj:
+            fileobj.write("# comment\n0 1\n\n1 2 5\n% comment\n1 2 7\n")
+        self.assertEqual(list(iter_edge_list(path)),
+            [(0, 1), (1, 2, 5), (1, 2, 7)])
+        M = read_edge_list(path, graph_class=MultiGraph)
+        self.assertEqual(M.e(), 3)
+        self.assertEqual(M.weight((2, 1)), 2)   # parallel edges
+        self.assertRaises(ValueError, read_edge_list, path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+
+class TestDIMACS(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "graph.gr")
+
+    def test_sp(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("c shortest path\np sp 4 5\n"
+                "a 1 2 7\na 2 3 1\na 1 2 3\na 3 4 2\na 4 4 1\n")
+        G = read_dimacs_sp(self.path)
+        self.assertTrue(G.is_directed())
+        self.assertEqual(G.v(), 4)
+        self.assertEqual(G.e(), 3)
+        self.assertEqual(G.weight((1, 2)), 3)   # the smallest weight
+        write_dimacs_sp(G, self.path)
+        self.assertEqual(read_dimacs_sp(self.path), G)
+
+    def test_sp_multigraph(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("p sp 3 5\n"
+                "a 1 2 5\na 1 2 3\na 2 3 1\na 1 2 5\na 3 3 1\n")
+        G = read_dimacs_sp(self.path)
+        self.assertEqual(list(G.iteroutedges(1)), [Edge(1, 2, 3)])
+        M = read_dimacs_sp(self.path, graph_class=MultiGraph)
+        self.assertEqual(M.e(), 3)   # the same arcs only once
+        self.assertEqual(sorted(M.iteroutedges(1)),
+            [Edge(1, 2, 3), Edge(1, 2, 5)])
+
+    def test_flow(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("p max 4 6\nn 1 s\nn 4 t\n"
+                "a 1 2 4\na 1 3 2\na 2 3 1\na 3 2 3\na 2 4 2\na 3 4 4\n"
+                "a 3 2 1\n")
+        G, source, sink = read_dimacs_flow(self.path)
+        self.assertEqual((source, sink), (1, 4))
+        self.assertEqual(G.v(), 5)   # the new node for antiparallel arcs
+        self.assertEqual(G.weight((3, 5)), 4)   # 3 + 1
+        algorithm = Dinic(G)
+        algorithm.run(source, sink)
+        self.assertEqual(algorithm.max_flow, 5)
+        write_dimacs_flow(G, source, sink, self.path)
+        T, source, sink = read_dimacs_flow(self.path)
+        self.assertEqual(T, G)
+
+    def test_flow_multigraph(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("p max 3 4\nn 1 s\nn 3 t\n"
+                "a 1 2 4\na 1 2 4\na 2 3 5\na 1 2 1\n")
+        M, source, sink = read_dimacs_flow(self.path, graph_class=MultiGraph)
+        self.assertEqual(M.e(), 2)
+        self.assertEqual(list(M.iteroutedges(1)), [Edge(1, 2, 9)])
+
+    def test_errors(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("p max 2 1\na 1 2 4\n")
+        self.assertRaises(ValueError, read_dimacs_sp, self.path)
+        self.assertRaises(ValueError, read_dimacs_flow, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+
+class TestMETIS(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "graph.metis")
+
+    def test_read(self):
+        with open(self.path, "w") as fileobj:
+            fileobj.write("% comment\n4 2 011\n"
+                "5 2 1\n1 1 1 3 2\n1 2 2\n1\n")   # node 4 is isolated
+        G = read_metis(self.path)
+        self.assertFalse(G.is_directed())
+        self.assertEqual(G.v(), 4)
+        self.assertEqual(G.e(), 2)
+        self.assertEqual(G.weight((3, 2)), 2)
+        self.assertEqual(G.degree(4), 0)
+
+    def test_round_trip(self):
+        G = GraphFactory(Graph).make_random(n=10)
+        for name in ("graph.metis", "graph.metis.gz"):
+            path = os.path.join(self.tmpdir, name)
+            write_metis(G, path)
+            T = read_metis(path)
+            self.assertEqual(T.e(), G.e())
+            for edge in G.iteredges():   # nodes 0..9 are mapped to 1..10
+                self.assertEqual(T.weight((edge.source + 1,
+                    edge.target + 1)), edge.weight)
+        partition = {1: 0, 2: 1, 3: 1, 4: 0}
+        write_metis_partition(partition, self.path)
+        self.assertEqual(read_metis_partition(self.path), partition)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
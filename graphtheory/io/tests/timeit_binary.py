@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+#
+# Saving and loading a graph: pickle vs the binary format.
+# Testing test_pickle_dump ...
+# 500000 1.356078878000062
+# Testing test_pickle_load ...
+# 500000 0.6656512090000888
+# Testing test_binary_save ...
+# 500000 0.005547826999872996
+# Testing test_binary_load_mmap ...
+# 500000 0.004401331000053688
+# Testing test_binary_load ...
+# 500000 0.006355552999821157
+# Size pickle 14991671 binary 8160096
+
+import os
+import pickle
+import timeit
+import tempfile
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.io.binary import save, load
+
+N = 20000   # number of nodes
+M = 500000   # number of edges
+
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M)
+C = CSRGraph.from_graph(G)
+tmpdir = tempfile.mkdtemp()
+path1 = os.path.join(tmpdir, "graph.pickle")
+path2 = os.path.join(tmpdir, "graph.bin")
+
+def test_pickle_dump():
+    with open(path1, "wb") as fileobj:
+        pickle.dump(G, fileobj, pickle.HIGHEST_PROTOCOL)
+
+def test_pickle_load():
+    with open(path1, "rb") as fileobj:
+        pickle.load(fileobj)
+
+def test_binary_save():
+    save(C, path2)
+
+def test_binary_load_mmap():
+    load(path2, mmap=True)
+
+def test_binary_load():
+    load(path2, mmap=False)
+
+for func in (test_pickle_dump, test_pickle_load,
+            test_binary_save, test_binary_load_mmap, test_binary_load):
+    print("Testing {} ...".format(func.__name__))
+    t1 = timeit.Timer(func)
+    print("{} {}".format(M, t1.timeit(1)))
+
+print("Size pickle {} binary {}".format(
+    os.path.getsize(path1), os.path.getsize(path2)))
+os.remove(path1)
+os.remove(path2)
+os.rmdir(tmpdir)
+
+# EOF
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+#
+# Throughput of text readers and writers in MB/s (file sizes).
+# Testing edge list (3.5 MB) ...
+# write 9.1 MB/s, read 5.7 MB/s
+# Testing edge list gzip (1.4 MB) ...
+# write 1.9 MB/s, read 2.1 MB/s
+# Testing DIMACS sp (3.9 MB) ...
+# write 8.9 MB/s, read 3.9 MB/s
+# Testing METIS (4.8 MB) ...
+# write 7.7 MB/s, read 5.5 MB/s
+
+import os
+import timeit
+import tempfile
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.io.edgelist import read_edge_list, write_edge_list
+from graphtheory.io.dimacs import read_dimacs_sp, write_dimacs_sp
+from graphtheory.io.metis import read_metis, write_metis
+
+N = 20000   # number of nodes
+M = 200000   # number of edges
+
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M)
+U = GraphFactory(Graph).make_sparse(n=N, directed=False, m=M)
+tmpdir = tempfile.mkdtemp()
+
+tests = [
+    ("edge list", "graph.txt", lambda path: write_edge_list(G, path),
+        lambda path: read_edge_list(path, directed=True)),
+    ("edge list gzip", "graph.txt.gz", lambda path: write_edge_list(G, path),
+        lambda path: read_edge_list(path, directed=True)),
+    ("DIMACS sp", "graph.gr", lambda path: write_dimacs_sp(G, path),
+        read_dimacs_sp),
+    ("METIS", "graph.metis", lambda path: write_metis(U, path),
+        read_metis),
+]
+
+for name, filename, writer, reader in tests:
+    path = os.path.join(tmpdir, filename)
+    t1 = timeit.Timer(lambda: writer(path)).timeit(1)
+    size = os.path.getsize(path) / 1e6   # MB
+    t2 = timeit.Timer(lambda: reader(path)).timeit(1)
+    print("Testing {} ({:.1f} MB) ...".format(name, size))
+    print("write {:.1f} MB/s, read {:.1f} MB/s".format(size / t1, size / t2))
+    os.remove(path)
+os.rmdir(tmpdir)
+
+# EOF
@@ -8,6 +8,7 @@ except NameError:   # Py3
 import collections
 from graphtheory.structures.edges import Edge
 from graphtheory.spanningtrees.prim import PrimMST
+from graphtheory.structures.views import graph_class
 
 class HalinGraphTreeDecomposition:
     """Halin graphs tree decomposition."""
@@ -170,7 +171,7 @@ class HalinGraphTreeDecomposition:
 
     def _find_td(self):
         """Find a tree decomposition for a Halin graph."""
-        H = self.graph.__class__(n=self.graph.v())   # graf przeciec klik maksymalnych
+        H = graph_class(self.graph)(n=self.graph.v())   # graf przeciec klik maksymalnych
         bag_dict = dict()
         # Budowanie workow.
         for c in self.cliques:
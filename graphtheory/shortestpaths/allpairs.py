@@ -6,6 +6,53 @@ try:
 except NameError:   # Python 3
     integer_types = (int,)
 
+try:
+    import numpy
+except ImportError:   # pure Python loops are used
+    numpy = None
+
+from graphtheory.shortestpaths.floydwarshall import _matrix_to_dict
+
+# The number of elements in one broadcast block (rows x V x V).
+CHUNK = 1 << 22
+
+
+def _weight_matrix(graph):
+    """Return (nodes, matrix, integer) for the min-plus backend."""
+    nodes = list(graph.iternodes())
+    node_id = dict((node, i) for (i, node) in enumerate(nodes))
+    matrix = numpy.full((len(nodes), len(nodes)), numpy.inf)
+    numpy.fill_diagonal(matrix, 0)
+    integer = True
+    for edge in graph.iteredges():
+        matrix[node_id[edge.source], node_id[edge.target]] = edge.weight
+        if not isinstance(edge.weight, integer_types):
+            integer = False
+    return nodes, matrix, integer
+
+
+def min_plus_product(A, B, argmin=False):
+    """Return the min-plus product C[i, j] = min_k (A[i, k] + B[k, j]).
+    
+    Rows of A are taken in chunks, so the broadcast array
+    (rows, V, V) has at most CHUNK elements.
+    With argmin=True the tuple (C, K) is returned, where K[i, j]
+    is the first k giving the minimum.
+    """
+    n = A.shape[0]
+    C = numpy.empty((n, B.shape[1]))
+    K = (numpy.empty((n, B.shape[1]), dtype=numpy.int64) if argmin else None)
+    rows = max(1, CHUNK // max(1, A.shape[1] * B.shape[1]))
+    for start in range(0, n, rows):
+        T = A[start:start + rows, :, None] + B[None, :, :]
+        if argmin:
+            K[start:start + rows] = T.argmin(axis=1)
+            C[start:start + rows] = numpy.take_along_axis(T,
+                K[start:start + rows, None, :], axis=1)[:, 0, :]
+        else:
+            C[start:start + rows] = T.min(axis=1)
+    return ((C, K) if argmin else C)
+
 
 class SlowAllPairs:
     """All-pairs shortest paths algorithm in O(V^4) time.
@@ -29,6 +76,9 @@ class SlowAllPairs:
     
     Notes
     -----
+    With NumPy the min-plus product of matrices is used (dict loops
+    otherwise). Steps stop when distances are not changed.
+    
     Based on:
     
     Cormen, T. H., Leiserson, C. E., Rivest, R. L., and Stein, C., 2009, 
@@ -60,11 +110,28 @@ class SlowAllPairs:
 
     def run(self):
         """Executable pseudocode."""
-        for m in range(2, self.graph.v()):   # |V|-2 times
-            self.distance = self.extended_shortest_paths(self.distance)
+        if numpy is not None:
+            self._run_numpy()
+        else:
+            for m in range(2, self.graph.v()):   # |V|-2 times
+                new_distance = self.extended_shortest_paths(self.distance)
+                if new_distance == self.distance:   # early termination
+                    break
+                self.distance = new_distance
         if any(self.distance[node][node] < 0 for node in self.graph.iternodes()):
             raise ValueError("negative cycle detected")
 
+    def _run_numpy(self):
+        """The min-plus backend, O(V^3) time per step."""
+        nodes, W, integer = _weight_matrix(self.graph)
+        D = W
+        for m in range(2, len(nodes)):   # |V|-2 times
+            new_D = min_plus_product(D, W)
+            if numpy.array_equal(new_D, D):   # early termination
+                break
+            D = new_D
+        self.distance = _matrix_to_dict(nodes, D, integer)
+
     def extended_shortest_paths(self, old_distance):
         """O(V^3) time."""
         new_distance = dict()
@@ -172,6 +239,9 @@ class SlowAllPairsWithPaths:   # not for FasterAllPairsSP
     
     Notes
     -----
+    With NumPy the min-plus product of matrices is used (dict loops
+    otherwise). Steps stop when distances are not changed.
+    
     Based on:
     
     Cormen, T. H., Leiserson, C. E., Rivest, R. L., and Stein, C., 2009, 
@@ -207,11 +277,38 @@ class SlowAllPairsWithPaths:   # not for FasterAllPairsSP
 
     def run(self):
         """Executable pseudocode."""
-        for m in range(2, self.graph.v()):   # |V|-2 times
-            self.distance = self.extended_shortest_paths(self.distance)
+        if numpy is not None:
+            self._run_numpy()
+        else:
+            for m in range(2, self.graph.v()):   # |V|-2 times
+                new_distance = self.extended_shortest_paths(self.distance)
+                if new_distance == self.distance:   # early termination
+                    break
+                self.distance = new_distance
         if any(self.distance[node][node] < 0 for node in self.graph.iternodes()):
             raise ValueError("negative cycle detected")
 
+    def _run_numpy(self):
+        """The min-plus backend with the argmin as the parent."""
+        nodes, W, integer = _weight_matrix(self.graph)
+        D = W
+        P = numpy.where(numpy.isfinite(W),
+            numpy.arange(len(nodes))[:, None], -1)
+        numpy.fill_diagonal(P, -1)
+        for m in range(2, len(nodes)):   # |V|-2 times
+            new_D, K = min_plus_product(D, W, argmin=True)
+            better = new_D < D
+            if not better.any():   # early termination
+                break
+            P[better] = K[better]
+            D = new_D
+        self.distance = _matrix_to_dict(nodes, D, integer)
+        for i, source in enumerate(nodes):
+            row = P[i].tolist()
+            self.parent[source] = dict((target,
+                (nodes[row[j]] if row[j] >= 0 else None))
+                for (j, target) in enumerate(nodes))
+
     def extended_shortest_paths(self, old_distance):
         """O(V^3) time."""
         new_distance = dict()
@@ -226,13 +323,15 @@ class SlowAllPairsWithPaths:   # not for FasterAllPairsSP
         return new_distance
 
     def path(self, source, target):
-        """Path reconstruction."""
-        if source == target:
-            return [source]
-        elif self.parent[source][target] is None:
-            raise ValueError("no path to target")
-        else:
-            return self.path(source, self.parent[source][target]) + [target]
+        """Path reconstruction (iterative)."""
+        path = [target]
+        while target != source:
+            target = self.parent[source][target]
+            if target is None:
+                raise ValueError("no path to target")
+            path.append(target)
+        path.reverse()
+        return path
 
 
 class FasterAllPairs:
@@ -256,6 +355,9 @@ class FasterAllPairs:
     
     Notes
     -----
+    With NumPy the min-plus product of matrices is used (dict loops
+    otherwise). Steps stop when distances are not changed.
+    
     Based on:
     
     Cormen, T. H., Leiserson, C. E., Rivest, R. L., and Stein, C., 2009, 
@@ -284,10 +386,16 @@ class FasterAllPairs:
 
     def run(self):
         """Executable pseudocode."""
-        m = 1
-        while m < (self.graph.v() - 1):   # log(V) times
-            self.distance = self.extended_shortest_paths(self.distance)
-            m = 2 * m
+        if numpy is not None:
+            self._run_numpy()
+        else:
+            m = 1
+            while m < (self.graph.v() - 1):   # log(V) times
+                new_distance = self.extended_shortest_paths(self.distance)
+                if new_distance == self.distance:   # early termination
+                    break
+                self.distance = new_distance
+                m = 2 * m
         if any(self.distance[node][node] < 0 for node in self.graph.iternodes()):
             raise ValueError("negative cycle detected")
 
@@ -303,4 +411,16 @@ class FasterAllPairs:
                         old_distance[source][node] + old_distance[node][target])
         return new_distance
 
+    def _run_numpy(self):
+        """The min-plus backend, repeated squaring."""
+        nodes, D, integer = _weight_matrix(self.graph)
+        m = 1
+        while m < (len(nodes) - 1):   # log(V) times
+            new_D = min_plus_product(D, D)
+            if numpy.array_equal(new_D, D):   # early termination
+                break
+            D = new_D
+            m = 2 * m
+        self.distance = _matrix_to_dict(nodes, D, integer)
+
 # EOF
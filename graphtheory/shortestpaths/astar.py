@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+import heapq
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.structures.views import TransposeView
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+
+
+def make_euclidean_heuristic(coordinates=None, scale=1):
+    """Return the heuristic scale * |coordinates[node] - coordinates[target]|.
+
+    Parameters
+    ----------
+    coordinates : dict, node -> Point (nodes are Points if None)
+    scale : number, the heuristic is admissible if every edge weight
+        is at least scale * (the edge length)
+    """
+    if coordinates is None:
+        return lambda node, target: scale * abs(node - target)
+    return lambda node, target: scale * abs(
+        coordinates[node] - coordinates[target])
+
+
+class Landmarks:
+    """Landmark (ALT) lower bounds for A*, built by Dijkstra's searches.
+
+    The triangle inequality gives d(v, t) >= d(L, t) - d(L, v)
+    and d(v, t) >= d(v, L) - d(t, L) for every landmark L.
+    An instance is a heuristic callable h(node, target).
+
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    landmarks : list of nodes
+    distance_from : dict, landmark -> (dict, node -> d(landmark, node))
+    distance_to : dict, landmark -> (dict, node -> d(node, landmark))
+
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.astar import AStar, Landmarks
+    >>> heuristic = Landmarks(G, k=8)   # preprocessing, 2k Dijkstra's runs
+    >>> algorithm = AStar(G, heuristic)
+    >>> algorithm.run(source, target)
+
+    Notes
+    -----
+    Distances to landmarks are found in TransposeView (no copy)
+    if the graph has fast iterinedges (graphs.Graph with inverse=True,
+    CSRGraph), otherwise the transpose is copied.
+
+    Goldberg, A. V., Harrelson, C., 2005, Computing the shortest path:
+        A* search meets graph theory, SODA 2005.
+    """
+
+    def __init__(self, graph, landmarks=None, k=4):
+        """Choose landmarks and compute distances.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        landmarks : list of nodes, optional (farthest nodes by default)
+        k : int, the number of landmarks if landmarks are not given
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.distance_from = dict()
+        self.distance_to = dict()
+        if (getattr(graph, "inverse", None) is not None
+                or isinstance(graph, CSRGraph)):
+            transposed = TransposeView(graph)   # fast iterinedges, no copy
+        else:   # iterinedges in O(V) time
+            transposed = graph.transpose()
+        if landmarks is None:
+            landmarks = self._farthest_landmarks(k)
+        self.landmarks = list(landmarks)
+        for landmark in self.landmarks:
+            self._add_landmark(landmark, transposed)
+
+    def _add_landmark(self, landmark, transposed):
+        """Compute distances from and to the landmark."""
+        algorithm = DijkstraHeap(self.graph)
+        algorithm.run(landmark)
+        self.distance_from[landmark] = algorithm.distance
+        algorithm = DijkstraHeap(transposed)
+        algorithm.run(landmark)
+        self.distance_to[landmark] = algorithm.distance
+
+    def _farthest_landmarks(self, k):
+        """Choose k nodes, every next node is the farthest from chosen ones."""
+        landmarks = []
+        nearest = dict()   # node -> distance from the nearest landmark
+        node = next(iter(self.graph.iternodes()), None)
+        while node is not None and len(landmarks) < k:
+            landmarks.append(node)
+            algorithm = DijkstraHeap(self.graph)
+            algorithm.run(node)
+            for other, dist in algorithm.distance.items():
+                if dist < nearest.get(other, float("inf")):
+                    nearest[other] = dist
+            candidates = [other for other in nearest
+                if other not in landmarks]
+            node = max(candidates, key=nearest.get, default=None)
+        return landmarks
+
+    def __call__(self, node, target):
+        """Return a lower bound for the distance from node to target."""
+        bound = 0
+        for landmark in self.landmarks:
+            distance = self.distance_from[landmark]
+            if node in distance and target in distance:
+                bound = max(bound, distance[target] - distance[node])
+            distance = self.distance_to[landmark]
+            if node in distance and target in distance:
+                bound = max(bound, distance[node] - distance[target])
+        return bound
+
+
+class AStar:
+    """The A* algorithm for s-t queries with a pluggable heuristic.
+
+    Nodes are taken from the heap with the key distance + h(node, target).
+    Stale heap entries are skipped (lazy deletion), a node can be
+    reopened if the heuristic is not consistent.
+
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    heuristic : function h(node, target), a lower bound (admissible)
+    parent : dict with reached nodes (shortest path tree)
+    distance : dict with reached nodes (upper bounds, exact on the path)
+    source : node
+    target : node
+    settled : number of settled nodes
+
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.astar import AStar
+    >>> from graphtheory.shortestpaths.astar import make_euclidean_heuristic
+    >>> heuristic = make_euclidean_heuristic(coordinates)   # node -> Point
+    >>> algorithm = AStar(G, heuristic)   # initialization
+    >>> algorithm.run(source, target)   # calculations
+    >>> algorithm.distance[target]   # distance from source to target
+    >>> algorithm.path(target)   # path from source to target
+
+    Notes
+    -----
+    Without a heuristic (h = 0) it is the Dijkstra's algorithm.
+
+    https://en.wikipedia.org/wiki/A*_search_algorithm
+    """
+
+    def __init__(self, graph, heuristic=None):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        heuristic : function h(node, target), optional
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.heuristic = (heuristic if heuristic is not None
+            else (lambda node, target: 0))
+        self.parent = dict()
+        self.distance = dict()
+        self.source = None
+        self.target = None
+        self.settled = 0
+
+    def run(self, source, target):
+        """Finding the shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+        target : node
+        """
+        self.source = source
+        self.target = target
+        self.settled = 0
+        self.parent = parent = {source: None}
+        self.distance = distance = {source: 0}
+        heuristic = self.heuristic
+        estimate = dict()   # cached h(node, target)
+        heap = [(heuristic(source, target), 0, source)]
+        heappop, heappush = heapq.heappop, heapq.heappush
+        inf = float("inf")   # not reached yet
+        while heap:
+            _, dist, node = heappop(heap)
+            if dist > distance[node]:   # an old entry
+                continue
+            self.settled += 1
+            if node == target:
+                break
+            for edge in self.graph.iteroutedges(node):
+                alt = dist + edge.weight
+                if alt < distance.get(edge.target, inf):
+                    distance[edge.target] = alt
+                    parent[edge.target] = node
+                    if edge.target not in estimate:
+                        estimate[edge.target] = heuristic(edge.target, target)
+                    heappush(heap,
+                        (alt + estimate[edge.target], alt, edge.target))
+
+    def path(self, target):
+        """Construct a path from source to target (iterative)."""
+        if target not in self.distance:
+            raise ValueError("no path to target")
+        path = [target]
+        while self.parent[target] is not None:
+            target = self.parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+# EOF
@@ -6,6 +6,8 @@ try:
 except NameError:   # Python 3
     integer_types = (int,)
 
+from collections import deque
+
 
 class BellmanFord:
     """The Bellman-Ford algorithm for the shortest path problem.
@@ -55,6 +57,8 @@ class BellmanFord:
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
         self.distance = dict(((node, float("inf")) for node in self.graph.iternodes()))
         self.source = None
+        self.passes = 0   # the number of passes over edges
+        self.cycle = None   # a negative cycle (list of nodes) if detected
 
     def run(self, source):
         """Finding shortest paths from the source.
@@ -66,13 +70,60 @@ class BellmanFord:
         self.source = source
         self.distance[source] = 0
         for step in range(self.graph.v()-1):   # |V|-1 times
+            self.passes += 1
+            relaxed = False
             for edge in self.graph.iteredges():   # O(E) time
-                self._relax(edge)
+                if self._relax(edge):
+                    relaxed = True
+            if not relaxed:   # early exit, distances are final
+                return
         # Check for negative cycles.
         for edge in self.graph.iteredges():   # O(E) time
             if self.distance[edge.target] > self.distance[edge.source] + edge.weight:
+                self._relax(edge)
+                self.cycle = self._cycle_from(edge.target, self.parent)
                 raise ValueError("negative cycle detected")
 
+    def _cycle_from(self, node, parent):
+        """Return the cycle in the parent graph reached from node or None.
+        
+        The path of |V| parents from node ends on the cycle,
+        nodes of the cycle are returned in the edge order.
+        """
+        for step in range(self.graph.v()):
+            node = parent[node]
+            if node is None:
+                return None
+        cycle = [node]
+        source = parent[node]
+        while source != node:
+            cycle.append(source)
+            source = parent[source]
+        cycle.reverse()
+        return cycle
+
+    def find_negative_cycle(self):
+        """Return a negative cycle (list of nodes) or None, O(V*E) time.
+        
+        All nodes start with distance 0 (a virtual source), so cycles
+        are found in the whole graph. The cycle [a, b, c] has edges
+        a-b, b-c, c-a. Attributes distance and parent are not changed.
+        """
+        distance = dict((node, 0) for node in self.graph.iternodes())
+        parent = dict((node, None) for node in self.graph.iternodes())
+        for step in range(self.graph.v()):   # |V| times
+            changed = None
+            for edge in self.graph.iteredges():   # O(E) time
+                alt = distance[edge.source] + edge.weight
+                if distance[edge.target] > alt:
+                    distance[edge.target] = alt
+                    parent[edge.target] = edge.source
+                    changed = edge.target
+            if changed is None:   # early exit, no negative cycles
+                return None
+        self.cycle = self._cycle_from(changed, parent)
+        return self.cycle
+
     def _relax(self, edge):
         """Edge relaxation."""
         alt = self.distance[edge.source] + edge.weight
@@ -102,4 +153,156 @@ class BellmanFord:
         path.reverse()
         return path
 
+
+class BellmanFordQueue(BellmanFord):
+    """The queue-based Bellman-Ford algorithm (SPFA), O(V*E) time.
+    
+    Only nodes with changed distances are scanned (a FIFO queue).
+    A negative cycle is detected when a shortest path has |V| edges.
+    
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    parent : dict with nodes (shortest path tree)
+    distance : dict with nodes (distances to source node)
+    source : node
+    scans : number of scanned nodes
+    cycle : a negative cycle (list of nodes) if detected
+    
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.bellmanford import BellmanFordQueue
+    >>> algorithm = BellmanFordQueue(G)     # initialization
+    >>> algorithm.run(source)     # calculations
+    >>> algorithm.path(target)   # path from source to target
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization."""
+        BellmanFord.__init__(self, graph)
+        self.scans = 0
+
+    def run(self, source):
+        """Finding shortest paths from the source.
+        
+        Parameters
+        ----------
+        source : node
+        """
+        self.source = source
+        self.distance[source] = 0
+        n = self.graph.v()
+        length = {source: 0}   # the number of edges on the path
+        queue = deque([source])
+        in_queue = set([source])
+        while queue:
+            node = queue.popleft()
+            in_queue.remove(node)
+            self.scans += 1
+            for edge in self.graph.iteroutedges(node):
+                alt = self.distance[node] + edge.weight
+                if self.distance[edge.target] > alt:
+                    self.distance[edge.target] = alt
+                    self.parent[edge.target] = node
+                    length[edge.target] = length[node] + 1
+                    if length[edge.target] >= n:
+                        self._negative_cycle(edge.target)
+                    if edge.target not in in_queue:
+                        queue.append(edge.target)
+                        in_queue.add(edge.target)
+
+    def _negative_cycle(self, node):
+        """Find the cycle and raise ValueError."""
+        self.cycle = self._cycle_from(node, self.parent)
+        if self.cycle is None:   # the parent graph is not updated yet
+            self.cycle = self.find_negative_cycle()
+        raise ValueError("negative cycle detected")
+
+
+class GoldbergRadzik(BellmanFordQueue):
+    """The Bellman-Ford algorithm with the Goldberg-Radzik ordering.
+    
+    In every pass labeled nodes with an outedge of negative reduced
+    cost are roots of a DFS in the admissible graph (reduced costs
+    not positive). Nodes are scanned in the topological order,
+    so distances along paths are updated in one pass.
+    
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    parent : dict with nodes (shortest path tree)
+    distance : dict with nodes (distances to source node)
+    source : node
+    passes : number of passes
+    scans : number of scanned nodes
+    cycle : a negative cycle (list of nodes) if detected
+    
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.bellmanford import GoldbergRadzik
+    >>> algorithm = GoldbergRadzik(G)     # initialization
+    >>> algorithm.run(source)     # calculations
+    >>> algorithm.path(target)   # path from source to target
+    
+    Notes
+    -----
+    Goldberg, A. V., Radzik, T., 1993, A heuristic improvement of the
+        Bellman-Ford algorithm, Applied Mathematics Letters 6, 3-6.
+    """
+
+    def run(self, source):
+        """Finding shortest paths from the source.
+        
+        Parameters
+        ----------
+        source : node
+        """
+        self.source = source
+        self.distance[source] = 0
+        labeled = [source]
+        while labeled:
+            self.passes += 1
+            if self.passes > self.graph.v():
+                self._negative_cycle(labeled[0])
+            next_labeled = set()
+            for node in self._topological_order(labeled):
+                self.scans += 1
+                for edge in self.graph.iteroutedges(node):
+                    alt = self.distance[node] + edge.weight
+                    if self.distance[edge.target] > alt:
+                        self.distance[edge.target] = alt
+                        self.parent[edge.target] = node
+                        next_labeled.add(edge.target)
+            labeled = list(next_labeled)
+
+    def _is_active(self, node):
+        """Test if the node has an outedge with negative reduced cost."""
+        return any(self.distance[node] + edge.weight < self.distance[edge.target]
+            for edge in self.graph.iteroutedges(node))
+
+    def _topological_order(self, labeled):
+        """Return nodes reachable from active labeled nodes
+        in the admissible graph, in the topological order (iterative DFS)."""
+        visited = set()
+        postorder = []
+        for root in labeled:
+            if root in visited or not self._is_active(root):
+                continue
+            visited.add(root)
+            stack = [(root, self.graph.iteroutedges(root))]
+            while stack:
+                node, edges = stack[-1]
+                for edge in edges:
+                    if (edge.target not in visited and self.distance[node]
+                            + edge.weight <= self.distance[edge.target]):
+                        visited.add(edge.target)
+                        stack.append((edge.target,
+                            self.graph.iteroutedges(edge.target)))
+                        break
+                else:
+                    stack.pop()
+                    postorder.append(node)
+        postorder.reverse()
+        return postorder
+
 # EOF
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+import heapq
+
+
+class BidirectionalDijkstra:
+    """The bidirectional Dijkstra's algorithm for s-t queries.
+
+    The forward search from source uses outedges, the backward search
+    from target uses inedges. The side with the smaller heap top
+    is scanned. The search stops when the sum of heap tops is not
+    smaller than the best s-t distance found so far.
+
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    parent : dict with reached nodes (forward tree with the s-t path)
+    distance : dict with reached nodes (upper bounds, exact on the path)
+    source : node
+    target : node
+    settled : number of settled nodes (both directions)
+
+    Examples
+    --------
+    >>> from graphtheory.structures.graphs import Graph
+    >>> from graphtheory.shortestpaths.bidirectional import BidirectionalDijkstra
+    >>> G = Graph(n=10, directed=True, inverse=True)   # fast iterinedges
+    # Add nodes and edges here.
+    >>> algorithm = BidirectionalDijkstra(G)   # initialization
+    >>> algorithm.run(source, target)   # calculations
+    >>> algorithm.distance[target]   # distance from source to target
+    >>> algorithm.path(target)   # path from source to target
+
+    Notes
+    -----
+    The backward search is fast if iterinedges is fast
+    (graphs.Graph with inverse=True, CSRGraph).
+
+    https://en.wikipedia.org/wiki/Bidirectional_search
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.parent = dict()
+        self.distance = dict()
+        self.source = None
+        self.target = None
+        self.settled = 0
+
+    def run(self, source, target):
+        """Finding the shortest path from source to target.
+
+        Parameters
+        ----------
+        source : node
+        target : node
+        """
+        self.source = source
+        self.target = target
+        self.settled = 0
+        forward = {source: 0}
+        backward = {target: 0}
+        forward_parent = {source: None}
+        backward_parent = {target: None}   # the next node on the path
+        forward_heap = [(0, source)]
+        backward_heap = [(0, target)]
+        heappop, heappush = heapq.heappop, heapq.heappush
+        inf = float("inf")   # not reached yet
+        best = (0 if source == target else float("inf"))
+        meeting = (source if source == target else None)
+        while forward_heap and backward_heap:
+            if forward_heap[0][0] + backward_heap[0][0] >= best:
+                break
+            if forward_heap[0][0] <= backward_heap[0][0]:
+                dist, node = heappop(forward_heap)
+                if dist > forward[node]:   # an old entry
+                    continue
+                self.settled += 1
+                for edge in self.graph.iteroutedges(node):
+                    alt = dist + edge.weight
+                    if alt < forward.get(edge.target, inf):
+                        forward[edge.target] = alt
+                        forward_parent[edge.target] = node
+                        heappush(forward_heap, (alt, edge.target))
+                        if edge.target in backward:
+                            total = alt + backward[edge.target]
+                            if total < best:
+                                best, meeting = total, edge.target
+            else:
+                dist, node = heappop(backward_heap)
+                if dist > backward[node]:   # an old entry
+                    continue
+                self.settled += 1
+                for edge in self.graph.iterinedges(node):
+                    alt = dist + edge.weight
+                    if alt < backward.get(edge.source, inf):
+                        backward[edge.source] = alt
+                        backward_parent[edge.source] = node
+                        heappush(backward_heap, (alt, edge.source))
+                        if edge.source in forward:
+                            total = alt + forward[edge.source]
+                            if total < best:
+                                best, meeting = total, edge.source
+        self.distance = forward
+        self.parent = forward_parent
+        if meeting is None:
+            return
+        # Splice the backward part of the path into the forward tree.
+        node = meeting
+        while backward_parent[node] is not None:
+            next_node = backward_parent[node]
+            forward_parent[next_node] = node
+            forward[next_node] = best - backward[next_node]
+            node = next_node
+
+    def path(self, target):
+        """Construct a path from source to target (iterative)."""
+        if target not in self.distance:
+            raise ValueError("no path to target")
+        path = [target]
+        while self.parent[target] is not None:
+            target = self.parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+# EOF
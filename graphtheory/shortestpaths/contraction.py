@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+import heapq
+import pickle
+
+# The hierarchy file is a pickled dict with this format name.
+FORMAT = "graphtheory.contraction"
+VERSION = 1
+
+
+class ContractionHierarchy:
+    """Contraction hierarchies for s-t shortest path queries.
+
+    Nodes are contracted one by one (the rank is the order).
+    When a node v is contracted, a shortcut (u, w) is added for
+    in-neighbor u and out-neighbor w if the path u-v-w is not longer
+    than a witness path from u to w avoiding v. A query is
+    a bidirectional Dijkstra's search using only edges to nodes
+    with higher ranks, shortcuts are unpacked to original edges.
+
+    Attributes
+    ----------
+    graph : input directed weighted graph (None after load)
+    rank : dict, node -> int (the contraction order)
+    up_out : dict, node -> (dict, target -> weight), edges up from node
+    up_in : dict, node -> (dict, source -> weight), edges down to node
+    middle : dict, (source, target) -> node, the contracted node
+        of the shortcut
+    shortcuts : number of shortcuts
+    settled : number of settled nodes in the last query
+    witness_limit : max number of settled nodes in a witness search
+
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.contraction import ContractionHierarchy
+    >>> algorithm = ContractionHierarchy(G)   # initialization
+    >>> algorithm.run()   # preprocessing
+    >>> algorithm.save("graph.ch")   # build once
+    >>> algorithm = ContractionHierarchy.load("graph.ch")   # service start
+    >>> algorithm.query(source, target)   # distance from source to target
+    >>> algorithm.path(source, target)   # path with original edges
+
+    Notes
+    -----
+    Node ordering by the edge difference (shortcuts added minus edges
+    removed, plus contracted neighbors), priorities are updated lazily.
+
+    Geisberger, R., Sanders, P., Schultes, D., Delling, D., 2008,
+        Contraction hierarchies: faster and simpler hierarchical routing
+        in road networks, WEA 2008, LNCS 5038, 319-333.
+    """
+
+    def __init__(self, graph, witness_limit=50):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        witness_limit : int, optional (default=50)
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.witness_limit = witness_limit
+        self.rank = dict()
+        self.up_out = dict()
+        self.up_in = dict()
+        self.middle = dict()
+        self.shortcuts = 0
+        self.settled = 0
+
+    def run(self):
+        """Contract all nodes (preprocessing)."""
+        self._out = dict((node, dict()) for node in self.graph.iternodes())
+        self._in = dict((node, dict()) for node in self.graph.iternodes())
+        for edge in self.graph.iteredges():
+            if edge.source == edge.target:
+                continue
+            weight = self._out[edge.source].get(edge.target)
+            if weight is None or edge.weight < weight:   # parallel edges
+                self._out[edge.source][edge.target] = edge.weight
+                self._in[edge.target][edge.source] = edge.weight
+        self._contracted_neighbors = dict(
+            (node, 0) for node in self.graph.iternodes())
+        heap = [(self._priority(node), node)
+            for node in self.graph.iternodes()]
+        heapq.heapify(heap)
+        while heap:
+            _, node = heapq.heappop(heap)
+            priority = self._priority(node)   # lazy update
+            if heap and priority > heap[0][0]:
+                heapq.heappush(heap, (priority, node))
+                continue
+            self._contract(node)
+        self.shortcuts = len(self.middle)
+        del self._out, self._in, self._contracted_neighbors
+
+    def _priority(self, node):
+        """Return the edge difference of the node."""
+        return (len(self._find_shortcuts(node)) - len(self._in[node])
+            - len(self._out[node]) + self._contracted_neighbors[node])
+
+    def _find_shortcuts(self, node):
+        """Return shortcuts (source, target, weight) needed without node."""
+        shortcuts = []
+        out_edges = self._out[node]
+        if not out_edges:
+            return shortcuts
+        max_out = max(out_edges.values())
+        for source, in_weight in self._in[node].items():
+            distance = self._witness_search(source, node, in_weight + max_out)
+            for target, out_weight in out_edges.items():
+                if target == source:
+                    continue
+                weight = in_weight + out_weight
+                if distance.get(target, float("inf")) > weight:
+                    shortcuts.append((source, target, weight))
+        return shortcuts
+
+    def _witness_search(self, source, avoided, limit):
+        """Dijkstra's search from source without the avoided node,
+        distances up to limit, at most witness_limit settled nodes."""
+        distance = {source: 0}
+        heap = [(0, source)]
+        settled = 0
+        inf = float("inf")   # not reached yet
+        while heap and settled < self.witness_limit:
+            dist, node = heapq.heappop(heap)
+            if dist > distance[node]:   # an old entry
+                continue
+            if dist > limit:
+                break
+            settled += 1
+            for target, weight in self._out[node].items():
+                if target == avoided:
+                    continue
+                alt = dist + weight
+                if alt < distance.get(target, inf):
+                    distance[target] = alt
+                    heapq.heappush(heap, (alt, target))
+        return distance
+
+    def _contract(self, node):
+        """Contract the node, move its edges to the upward graphs."""
+        for source, target, weight in self._find_shortcuts(node):
+            self._out[source][target] = weight
+            self._in[target][source] = weight
+            self.middle[(source, target)] = node
+        self.rank[node] = len(self.rank)
+        self.up_out[node] = self._out.pop(node)
+        self.up_in[node] = self._in.pop(node)
+        for target in self.up_out[node]:
+            del self._in[target][node]
+            self._contracted_neighbors[target] += 1
+        for source in self.up_in[node]:
+            del self._out[source][node]
+            self._contracted_neighbors[source] += 1
+
+    def _search(self, source, target):
+        """Bidirectional upward search, return (distance, meeting, parents)."""
+        forward = {source: 0}
+        backward = {target: 0}
+        forward_parent = {source: None}
+        backward_parent = {target: None}
+        forward_heap = [(0, source)]
+        backward_heap = [(0, target)]
+        best = (0 if source == target else float("inf"))
+        meeting = (source if source == target else None)
+        self.settled = 0
+        inf = float("inf")   # not reached yet
+        while ((forward_heap and forward_heap[0][0] < best) or
+                (backward_heap and backward_heap[0][0] < best)):
+            if (not backward_heap or backward_heap[0][0] >= best or
+                    (forward_heap and forward_heap[0][0] < best and
+                    forward_heap[0][0] <= backward_heap[0][0])):
+                heap, distance, parent = forward_heap, forward, forward_parent
+                other, edges = backward, self.up_out
+            else:
+                heap, distance, parent = (backward_heap, backward,
+                    backward_parent)
+                other, edges = forward, self.up_in
+            dist, node = heapq.heappop(heap)
+            if dist > distance[node]:   # an old entry
+                continue
+            self.settled += 1
+            for next_node, weight in edges[node].items():
+                alt = dist + weight
+                if alt < distance.get(next_node, inf):
+                    distance[next_node] = alt
+                    parent[next_node] = node
+                    heapq.heappush(heap, (alt, next_node))
+                    if next_node in other and alt + other[next_node] < best:
+                        best = alt + other[next_node]
+                        meeting = next_node
+        return best, meeting, forward_parent, backward_parent
+
+    def query(self, source, target):
+        """Return the distance from source to target (inf if no path)."""
+        return self._search(source, target)[0]
+
+    def path(self, source, target):
+        """Return the shortest path from source to target (original edges)."""
+        _, meeting, forward_parent, backward_parent = self._search(
+            source, target)
+        if meeting is None:
+            raise ValueError("no path to target")
+        up_path = [meeting]
+        while forward_parent[up_path[-1]] is not None:
+            up_path.append(forward_parent[up_path[-1]])
+        up_path.reverse()
+        while backward_parent[up_path[-1]] is not None:
+            up_path.append(backward_parent[up_path[-1]])
+        path = [source]
+        for edge in zip(up_path, up_path[1:]):
+            stack = [edge]
+            while stack:   # unpacking shortcuts, iterative
+                node1, node2 = stack.pop()
+                node = self.middle.get((node1, node2))
+                if node is None:
+                    path.append(node2)
+                else:
+                    stack.append((node, node2))
+                    stack.append((node1, node))
+        return path
+
+    def save(self, path):
+        """Save the hierarchy to a file (pickle, only trusted files)."""
+        state = {"format": FORMAT, "version": VERSION, "rank": self.rank,
+            "up_out": self.up_out, "up_in": self.up_in,
+            "middle": self.middle, "witness_limit": self.witness_limit}
+        with open(path, "wb") as fileobj:
+            pickle.dump(state, fileobj, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Return the hierarchy from a file made by save()."""
+        with open(path, "rb") as fileobj:
+            state = pickle.load(fileobj)
+        if not isinstance(state, dict) or state.get("format") != FORMAT:
+            raise ValueError("not a contraction hierarchy file")
+        if state["version"] != VERSION:
+            raise ValueError("unsupported version")
+        algorithm = cls.__new__(cls)
+        algorithm.graph = None
+        algorithm.witness_limit = state["witness_limit"]
+        algorithm.rank = state["rank"]
+        algorithm.up_out = state["up_out"]
+        algorithm.up_in = state["up_in"]
+        algorithm.middle = state["middle"]
+        algorithm.shortcuts = len(algorithm.middle)
+        algorithm.settled = 0
+        return algorithm
+
+# EOF
@@ -6,6 +6,8 @@ try:
 except ImportError:   # Python 3
     from queue import PriorityQueue
 
+import heapq
+
 
 class Dijkstra:
     """The Dijkstra's algorithm for the shortest path problem, O(m log n) time.
@@ -311,4 +313,117 @@ class DijkstraMatrix:
         path.reverse()
         return path
 
+
+class DijkstraHeap:
+    """The Dijkstra's algorithm with a binary heap (heapq), O(m log n) time.
+    
+    Queries can stop early: at the target, after all targets
+    are settled, or at the radius. Decrease-key is replaced by pushing
+    a new entry, old entries are skipped when popped (lazy deletion).
+    
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    parent : dict with reached nodes (shortest path tree)
+    distance : dict with reached nodes (distances to source node)
+    source : node
+    settled : number of settled nodes (popped with the final distance)
+    
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import Edge
+    >>> from graphtheory.structures.graphs import Graph
+    >>> from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+    >>> G = Graph(n=10, directed=True)    # an exemplary directed graph
+    # Add nodes and edges here.
+    >>> algorithm = DijkstraHeap(G)   # initialization
+    >>> algorithm.run(source, target)   # stop when target is settled
+    >>> algorithm.distance[target]   # distance from source to target
+    >>> algorithm.path(target)   # path from source to target
+    >>> algorithm.run(source, targets=[t1, t2])   # multi-target query
+    >>> algorithm.run(source, radius=100)   # nodes with distance <= 100
+    
+    Notes
+    -----
+    Unreached nodes are not present in distance and parent
+    (no O(n) initialization for point-to-point queries).
+    After an early exit at targets, distances of nodes that are not
+    settled are upper bounds. After the radius query, only nodes
+    with distance <= radius are kept.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization.
+        
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.parent = dict()
+        self.distance = dict()
+        self.source = None
+        self.settled = 0
+
+    def run(self, source, target=None, targets=None, radius=None):
+        """Finding shortest paths from the source.
+        
+        Parameters
+        ----------
+        source : node
+        target : node, optional (stop when the target is settled)
+        targets : iterable of nodes, optional (stop when all are settled)
+        radius : number, optional (settle nodes with distance <= radius)
+        """
+        self.source = source
+        self.parent = {source: None}
+        self.distance = distance = {source: 0}
+        self.settled = 0
+        parent = self.parent
+        remaining = set()
+        if targets is not None:
+            remaining.update(targets)
+        if target is not None:
+            remaining.add(target)
+        heap = [(0, source)]
+        heappop, heappush = heapq.heappop, heapq.heappush
+        iteroutedges = self.graph.iteroutedges
+        inf = float("inf")   # not reached yet
+        while heap:
+            dist, node = heappop(heap)
+            if dist > distance[node]:   # an old entry
+                continue
+            if radius is not None and dist > radius:
+                break
+            self.settled += 1
+            if remaining:
+                remaining.discard(node)
+                if not remaining:
+                    break
+            for edge in iteroutedges(node):
+                alt = dist + edge.weight
+                if alt < distance.get(edge.target, inf):
+                    distance[edge.target] = alt
+                    parent[edge.target] = node
+                    heappush(heap, (alt, edge.target))
+        if radius is not None:   # remove nodes out of the ball
+            for node in [node for node in distance if distance[node] > radius]:
+                del distance[node]
+                del parent[node]
+
+    def path(self, target):
+        """Construct a path from source to target (iterative)."""
+        if target not in self.distance:
+            raise ValueError("no path to target")
+        path = [target]
+        while self.parent[target] is not None:
+            target = self.parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+    path_iter = path
+
 # EOF
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+import heapq
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+
+
+class DynamicDijkstra:
+    """The dynamic single-source shortest paths (local repair).
+
+    The shortest path tree from DijkstraHeap is kept up to date
+    when edges are added, removed or their weights are changed.
+    Only nodes with changed distances are processed (Ramalingam-Reps).
+    A decrease starts a Dijkstra's search from the edge target.
+    An increase of a tree edge finds affected nodes in the subtree
+    of the edge target (nodes without an alternative parent),
+    then their distances are computed again from unaffected inedges.
+
+    Attributes
+    ----------
+    graph : input directed weighted graph (modified by updates)
+    parent : dict with reached nodes (shortest path tree)
+    distance : dict with reached nodes (distances to source node)
+    children : dict, node -> set of children in the tree
+    source : node
+    touched : number of nodes processed in the last update
+    total_touched : number of nodes processed in all updates
+    updates : number of updates
+
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import Edge
+    >>> from graphtheory.structures.graphs import Graph
+    >>> from graphtheory.shortestpaths.dynamic import DynamicDijkstra
+    >>> G = Graph(n=10, directed=True, inverse=True)   # fast iterinedges
+    # Add nodes and edges here.
+    >>> algorithm = DynamicDijkstra(G)   # initialization
+    >>> algorithm.run(source)   # the shortest path tree
+    >>> algorithm.change_weight((0, 1), 7)   # traffic
+    >>> algorithm.del_edge(Edge(2, 3))
+    >>> algorithm.add_edge(Edge(2, 4, 5))
+    >>> algorithm.distance[target], algorithm.touched
+
+    Notes
+    -----
+    Edge weights are non-negative. Increases use iterinedges,
+    so graphs.Graph with inverse=True or a graph with fast iterinedges
+    should be used.
+
+    Ramalingam, G., Reps, T., 1996, An incremental algorithm for
+        a generalization of the shortest-path problem,
+        Journal of Algorithms 21, 267-305.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.parent = dict()
+        self.distance = dict()
+        self.children = dict()
+        self.source = None
+        self.touched = 0
+        self.total_touched = 0
+        self.updates = 0
+
+    def run(self, source):
+        """Build the shortest path tree from the source (DijkstraHeap)."""
+        algorithm = DijkstraHeap(self.graph)
+        algorithm.run(source)
+        self.source = source
+        self.parent = algorithm.parent
+        self.distance = algorithm.distance
+        self.children = dict((node, set()) for node in self.distance)
+        for node, parent in self.parent.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+    def _set_parent(self, node, parent):
+        """Move the node in the tree (parent None removes the node)."""
+        old_parent = self.parent.get(node)
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        if parent is None:
+            del self.parent[node]
+            del self.distance[node]
+        else:
+            self.parent[node] = parent
+            self.children.setdefault(parent, set()).add(node)
+            self.children.setdefault(node, set())
+
+    def _count(self, touched):
+        """Update counters."""
+        self.touched = touched
+        self.total_touched += touched
+        self.updates += 1
+
+    def add_edge(self, edge):
+        """Add the edge to the graph and repair the tree."""
+        self.graph.add_edge(edge)
+        self._count(self._decrease(edge.source, edge.target, edge.weight))
+
+    def del_edge(self, edge):
+        """Remove the edge from the graph and repair the tree."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        self.graph.del_edge((source, target))
+        touched = 0
+        if self.parent.get(target) == source:
+            touched = self._increase(target)
+        self._count(touched)
+
+    def change_weight(self, edge, weight):
+        """Change the edge weight and repair the tree.
+
+        Parameters
+        ----------
+        edge : edge or tuple (source, target) from the graph
+        weight : number, the new weight (non-negative)
+        """
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        if not self.graph.has_edge((source, target)):
+            raise ValueError("the edge is not in the graph")
+        old_weight = self.graph.weight((source, target))
+        self.graph.del_edge((source, target))
+        self.graph.add_edge(self.graph.edge_class(source, target, weight))
+        touched = 0
+        if weight < old_weight:
+            touched = self._decrease(source, target, weight)
+        elif weight > old_weight and self.parent.get(target) == source:
+            touched = self._increase(target)
+        self._count(touched)
+
+    def _decrease(self, source, target, weight):
+        """Propagate shorter distances from target, return touched."""
+        if source not in self.distance:
+            return 0
+        alt = self.distance[source] + weight
+        if alt >= self.distance.get(target, float("inf")):
+            return 0
+        self.distance[target] = alt
+        self._set_parent(target, source)
+        touched = 0
+        heap = [(alt, target)]
+        while heap:
+            dist, node = heapq.heappop(heap)
+            if dist > self.distance[node]:   # an old entry
+                continue
+            touched += 1
+            for edge in self.graph.iteroutedges(node):
+                alt = dist + edge.weight
+                if alt < self.distance.get(edge.target, float("inf")):
+                    self.distance[edge.target] = alt
+                    self._set_parent(edge.target, node)
+                    heapq.heappush(heap, (alt, edge.target))
+        return touched
+
+    def _increase(self, root):
+        """Repair the subtree of root after its tree edge became longer
+        or was removed, return touched."""
+        # Phase 1: affected nodes in the order of old distances.
+        # An alternative parent with a smaller distance is not in
+        # the subtree, so the node and its subtree are not affected.
+        affected = set()
+        touched = 0
+        heap = [(self.distance[root], root)]
+        while heap:
+            dist, node = heapq.heappop(heap)
+            touched += 1
+            best = None
+            for edge in self.graph.iterinedges(node):
+                other = edge.source
+                if (other in self.distance and other not in affected and
+                        self.distance[other] + edge.weight == dist and
+                        self.distance[other] < dist):
+                    best = other
+                    break
+            if best is not None:
+                self._set_parent(node, best)
+                continue
+            affected.add(node)
+            for child in self.children.get(node, ()):
+                heapq.heappush(heap, (self.distance[child], child))
+        # Phase 2: new distances from unaffected nodes (Dijkstra).
+        inf = float("inf")
+        new_distance = dict()
+        new_parent = dict()
+        heap = []
+        for node in affected:
+            for edge in self.graph.iterinedges(node):
+                other = edge.source
+                if other in self.distance and other not in affected:
+                    alt = self.distance[other] + edge.weight
+                    if alt < new_distance.get(node, inf):
+                        new_distance[node] = alt
+                        new_parent[node] = other
+            if node in new_distance:
+                heapq.heappush(heap, (new_distance[node], node))
+        done = set()
+        while heap:
+            dist, node = heapq.heappop(heap)
+            if node in done or dist > new_distance[node]:   # an old entry
+                continue
+            done.add(node)
+            for edge in self.graph.iteroutedges(node):
+                if edge.target in affected:
+                    alt = dist + edge.weight
+                    if alt < new_distance.get(edge.target, inf):
+                        new_distance[edge.target] = alt
+                        new_parent[edge.target] = node
+                        heapq.heappush(heap, (alt, edge.target))
+        for node in affected:
+            if node in new_distance:
+                self.distance[node] = new_distance[node]
+                self._set_parent(node, new_parent[node])
+            else:   # unreachable now
+                self._set_parent(node, None)
+        return touched + len(done)
+
+    def path(self, target):
+        """Construct a path from source to target (iterative)."""
+        if target not in self.distance:
+            raise ValueError("no path to target")
+        path = [target]
+        while self.parent[target] is not None:
+            target = self.parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+# EOF
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 
+try:
+    import numpy
+except ImportError:   # FloydWarshallNumPy is not available
+    numpy = None
+
+
 class FloydWarshall:
     """The Floyd-Warshall algorithm (all-pairs shortest paths).
     
@@ -225,4 +231,237 @@ class FloydWarshallAllGraphs:
             for node in self.graph.iternodes()):
                 raise ValueError("negative cycle detected")
 
+
+def _matrix_to_dict(nodes, matrix, integer=False):
+    """Return the distance matrix as dict-of-dict (ints if integer)."""
+    inf = float("inf")
+    distance = dict()
+    for i, source in enumerate(nodes):
+        row = matrix[i].tolist()
+        if integer:
+            row = [(value if value == inf else int(value)) for value in row]
+        distance[source] = dict(zip(nodes, row))
+    return distance
+
+
+class FloydWarshallNumPy:
+    """The Floyd-Warshall algorithm with NumPy matrices, O(V^3) time.
+    
+    Nodes are mapped to indices, every k-step is one NumPy operation
+    D = minimum(D, D[:, k, None] + D[None, k, :]).
+    Negative cycles are detected.
+    
+    Attributes
+    ----------
+    graph : input weighted graph (directed or undirected)
+    nodes : list of nodes (index to node)
+    node_id : dict (node to index)
+    distance_matrix : numpy.ndarray (n, n), float, inf if no path
+    parent_matrix : numpy.ndarray (n, n), int, -1 if no parent
+    
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import Edge
+    >>> from graphtheory.structures.graphs import Graph
+    >>> from graphtheory.shortestpaths.floydwarshall import FloydWarshallNumPy
+    >>> G = Graph(n=10, directed=True)    # an exemplary directed graph
+    # Add nodes and edges here.
+    >>> algorithm = FloydWarshallNumPy(G)     # initialization
+    >>> algorithm.run()     # calculations
+    >>> algorithm.path(source, target)   # path from source to target
+    >>> algorithm.distance = algorithm.to_dict()   # dict-of-dict
+    >>> algorithm.parent = algorithm.parent_to_dict()   # dict-of-dict
+    
+    Notes
+    -----
+    Integer weights are exact up to 2**53 (float64 matrix).
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization.
+        
+        Parameters
+        ----------
+        graph : directed or undirected weighted graph
+        """
+        if numpy is None:
+            raise ValueError("NumPy is required")
+        self.graph = graph
+        self.nodes = list(self.graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        n = len(self.nodes)
+        self.distance_matrix = numpy.full((n, n), numpy.inf)
+        numpy.fill_diagonal(self.distance_matrix, 0)
+        self.parent_matrix = numpy.full((n, n), -1, dtype=numpy.int64)
+        self._integer = True
+        for edge in self.graph.iteredges():
+            self._add_edge(self.node_id[edge.source],
+                self.node_id[edge.target], edge.weight)
+            if not self.graph.is_directed():
+                self._add_edge(self.node_id[edge.target],
+                    self.node_id[edge.source], edge.weight)
+            if not isinstance(edge.weight, int):
+                self._integer = False
+
+    def _add_edge(self, i, j, weight):
+        """Put the edge weight into matrices (the smallest for multigraphs)."""
+        if weight < self.distance_matrix[i, j]:
+            self.distance_matrix[i, j] = weight
+            self.parent_matrix[i, j] = i
+
+    def run(self):
+        """Finding all shortest paths."""
+        D = self.distance_matrix
+        P = self.parent_matrix
+        diagonal = numpy.einsum("ii->i", D)   # a view of the diagonal
+        for k in range(len(self.nodes)):
+            alt = D[:, k, None] + D[None, k, :]
+            better = alt < D
+            numpy.copyto(D, alt, where=better)
+            numpy.copyto(P, P[k][None, :], where=better)
+            if diagonal.min() < 0:   # stop before values blow up
+                raise ValueError("negative cycle detected")
+
+    def path(self, source, target):
+        """Construct a path from source to target (iterative)."""
+        i, j = self.node_id[source], self.node_id[target]
+        if self.distance_matrix[i, j] == numpy.inf:
+            raise ValueError("no path to target")
+        path = [j]
+        while j != i:
+            j = int(self.parent_matrix[i, j])
+            path.append(j)
+        path.reverse()
+        return [self.nodes[j] for j in path]
+
+    def to_dict(self):
+        """Return distances as dict-of-dict (like FloydWarshall.distance)."""
+        return _matrix_to_dict(self.nodes, self.distance_matrix, self._integer)
+
+    def parent_to_dict(self):
+        """Return parents as dict-of-dict (like FloydWarshallPaths.parent)."""
+        parent = dict()
+        for i, source in enumerate(self.nodes):
+            row = self.parent_matrix[i].tolist()
+            parent[source] = dict((target,
+                (self.nodes[row[j]] if (row[j] >= 0 and i != j) else None))
+                for (j, target) in enumerate(self.nodes))
+        return parent
+
+
+class FloydWarshallBlocked:
+    """The blocked (tiled) Floyd-Warshall algorithm with NumPy, O(V^3) time.
+    
+    The matrix is divided into tiles block x block. For every diagonal
+    tile (k-block) the diagonal tile is computed first, next tiles
+    in the same row and column, and all other tiles at the end.
+    Only three tiles are used at once, so they fit in the CPU cache.
+    With the path parameter the matrix is a memory map of .npy file
+    and only a few tiles are in RAM.
+    
+    Attributes
+    ----------
+    graph : input weighted graph (directed or undirected)
+    nodes : list of nodes (index to node)
+    node_id : dict (node to index)
+    block : int, the tile size
+    distance_matrix : numpy.ndarray or numpy.memmap (n, n), inf if no path
+    
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.floydwarshall import FloydWarshallBlocked
+    >>> algorithm = FloydWarshallBlocked(G, block=256, path="distance.npy")
+    >>> algorithm.run()     # calculations
+    >>> algorithm.distance_matrix[i, j]   # nodes are algorithm.nodes
+    >>> D = numpy.load("distance.npy", mmap_mode="r")   # later
+    
+    Notes
+    -----
+    Paths are not computed (use FloydWarshallNumPy).
+    
+    Venkataraman, G., Sahni, S., Mukhopadhyaya, S., 2003,
+        A blocked all-pairs shortest-paths algorithm,
+        ACM Journal of Experimental Algorithmics 8, 2.2.
+    """
+
+    def __init__(self, graph, block=256, path=None):
+        """The algorithm initialization.
+        
+        Parameters
+        ----------
+        graph : directed or undirected weighted graph
+        block : int, optional (default=256)
+        path : str, optional, the .npy file for the distance matrix
+        """
+        if numpy is None:
+            raise ValueError("NumPy is required")
+        if block < 1:
+            raise ValueError("block must be positive")
+        self.graph = graph
+        self.block = block
+        self.nodes = list(self.graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        n = len(self.nodes)
+        if path is None:
+            self.distance_matrix = numpy.full((n, n), numpy.inf)
+        else:
+            self.distance_matrix = numpy.lib.format.open_memmap(path,
+                mode="w+", dtype=numpy.float64, shape=(n, n))
+            for i in range(n):   # row by row, no n x n temporary array
+                self.distance_matrix[i] = numpy.inf
+        D = self.distance_matrix
+        for i in range(n):
+            D[i, i] = 0
+        self._integer = True
+        for edge in self.graph.iteredges():
+            if not isinstance(edge.weight, int):
+                self._integer = False
+            i, j = self.node_id[edge.source], self.node_id[edge.target]
+            D[i, j] = min(D[i, j], edge.weight)
+            if not self.graph.is_directed():
+                D[j, i] = min(D[j, i], edge.weight)
+
+    def _update(self, C, A, B):
+        """C = min(C, A min-plus B), A or B can be C (in-place)."""
+        for k in range(A.shape[1]):
+            numpy.minimum(C, A[:, k, None] + B[None, k, :], out=C)
+
+    def run(self):
+        """Finding all shortest path distances."""
+        D = self.distance_matrix
+        n = len(self.nodes)
+        blocks = [slice(start, min(start + self.block, n))
+            for start in range(0, n, self.block)]
+        for K in blocks:
+            tile = numpy.array(D[K, K])   # the diagonal tile
+            self._update(tile, tile, tile)
+            if (tile.diagonal() < 0).any():
+                raise ValueError("negative cycle detected")
+            D[K, K] = tile
+            row = dict()   # final tiles D[K, J]
+            for J in blocks:
+                if J != K:
+                    row[J.start] = C = numpy.array(D[K, J])
+                    self._update(C, tile, C)
+                    D[K, J] = C
+            for I in blocks:
+                if I == K:
+                    continue
+                column = numpy.array(D[I, K])
+                self._update(column, column, tile)
+                D[I, K] = column
+                for J in blocks:
+                    if J != K:
+                        C = numpy.array(D[I, J])
+                        self._update(C, column, row[J.start])
+                        D[I, J] = C
+        if isinstance(D, numpy.memmap):
+            D.flush()
+        if (D.diagonal() < 0).any():
+            raise ValueError("negative cycle detected")
+
+    def to_dict(self):
+        """Return distances as dict-of-dict (like FloydWarshall.distance)."""
+        return _matrix_to_dict(self.nodes, self.distance_matrix, self._integer)
+
 # EOF
@@ -1,8 +1,20 @@
 #!/usr/bin/env python3
 
+import os
+import heapq
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from graphtheory.structures.edges import Edge
+from graphtheory.structures.csrgraphs import CSRGraph
 from graphtheory.shortestpaths.bellmanford import BellmanFord
 from graphtheory.shortestpaths.dijkstra import Dijkstra
+from graphtheory.io import binary
+from graphtheory.structures.views import graph_class
+
+try:
+    import numpy
+except ImportError:   # JohnsonParallel is not available
+    numpy = None
 
 
 class Johnson:
@@ -38,23 +50,26 @@ class Johnson:
     https://en.wikipedia.org/wiki/Johnson's_algorithm
     """
 
-    def __init__(self, graph):
+    def __init__(self, graph, bellmanford_class=BellmanFord):
         """The algorithm initialization.
         
         Parameters
         ----------
         graph : directed weighted graph
+        bellmanford_class : class, optional (default=BellmanFord),
+            BellmanFord, BellmanFordQueue or GoldbergRadzik
         """
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
+        self.bellmanford_class = bellmanford_class
         self.distance = None
 
     def run(self):
         """Finding all shortest paths."""
         # graph copy
         size = self.graph.v()
-        self._new_graph = self.graph.__class__(n=(size + 1), directed=True)
+        self._new_graph = graph_class(self.graph)(n=(size + 1), directed=True)
         for node in self.graph.iternodes():   # O(V) time
             self._new_graph.add_node(node)
         for edge in self.graph.iteredges():   # O(E) time
@@ -63,7 +78,7 @@ class Johnson:
         self._new_graph.add_node(self._new_node)
         for node in self.graph.iternodes():   # O(V) time
             self._new_graph.add_edge(Edge(self._new_node, node, 0))
-        self._bf = BellmanFord(self._new_graph)
+        self._bf = self.bellmanford_class(self._new_graph)
         # If this step detects a negative cycle, the algorithm is terminated.
         self._bf.run(self._new_node)   # O(V*E) time
         # Edges are reweighted.
@@ -122,16 +137,19 @@ class JohnsonFaster:
     https://en.wikipedia.org/wiki/Johnson's_algorithm
     """
 
-    def __init__(self, graph):
+    def __init__(self, graph, bellmanford_class=BellmanFord):
         """The algorithm initialization.
         
         Parameters
         ----------
         graph : directed weighted graph
+        bellmanford_class : class, optional (default=BellmanFord),
+            BellmanFord, BellmanFordQueue or GoldbergRadzik
         """
         if not graph.is_directed():
             raise ValueError("the graph is not directed")
         self.graph = graph
+        self.bellmanford_class = bellmanford_class
         self.positive_weights = all(edge.weight >= 0
             for edge in self.graph.iteredges())   # O(E) time
         self.distance = None
@@ -142,7 +160,7 @@ class JohnsonFaster:
             self._new_graph = self.graph
         else:
             # graph copy
-            self._new_graph = self.graph.__class__(
+            self._new_graph = graph_class(self.graph)(
                 n=(self.graph.v()+1), directed=True)
             for node in self.graph.iternodes():   # O(V) time
                 self._new_graph.add_node(node)
@@ -152,7 +170,7 @@ class JohnsonFaster:
             self._new_graph.add_node(self._new_node)
             for node in self.graph.iternodes():   # O(V) time
                 self._new_graph.add_edge(Edge(self._new_node, node, 0))
-            self._bf = BellmanFord(self._new_graph)
+            self._bf = self.bellmanford_class(self._new_graph)
             # If this step detects a negative cycle,
             # the algorithm is terminated.
             self._bf.run(self._new_node)   # O(V*E) time
@@ -180,4 +198,195 @@ class JohnsonFaster:
                         - self._bf.distance[source] 
                         + self._bf.distance[target])
 
+
+# The reweighted graph in a worker process (loaded once per process).
+_worker_graph = None
+
+
+def _init_worker(graph_path):
+    """Map the reweighted CSR graph in a worker process."""
+    global _worker_graph
+    _worker_graph = binary.load(graph_path, mmap=True)
+
+
+def _csr_dijkstra(offsets, targets, weights, source):
+    """Return distances (list) from the node id source, heapq on ids."""
+    n = len(offsets) - 1
+    inf = float("inf")
+    distance = [inf] * n
+    distance[source] = 0
+    heap = [(0, source)]
+    heappop, heappush = heapq.heappop, heapq.heappush
+    while heap:
+        dist, i = heappop(heap)
+        if dist > distance[i]:   # an old entry
+            continue
+        lo, hi = int(offsets[i]), int(offsets[i+1])
+        for j, weight in zip(targets[lo:hi].tolist(),
+                weights[lo:hi].tolist()):
+            alt = dist + weight
+            if alt < distance[j]:
+                distance[j] = alt
+                heappush(heap, (alt, j))
+    return distance
+
+
+def _johnson_rows(graph, sources, potential, output_path):
+    """Run Dijkstra from sources and write rows into the output file."""
+    output = numpy.load(output_path, mmap_mode="r+")
+    for source in sources:
+        row = numpy.array(_csr_dijkstra(graph.offsets, graph.targets,
+            graph.weights, source), dtype=numpy.float64)
+        # Distances in the original graph, inf - finite is inf.
+        output[source] = row - potential[source] + potential
+    output.flush()
+    del output
+    return len(sources)
+
+
+def _worker_rows(sources, potential, output_path):
+    """The task for a worker process."""
+    return _johnson_rows(_worker_graph, sources, potential, output_path)
+
+
+class JohnsonParallel:
+    """The Johnson algorithm with Dijkstra's runs in worker processes.
+    
+    Edges are reweighted with the Bellman-Ford potential (only if
+    there are negative weights), the reweighted graph is saved once
+    in the binary CSR format and it is memory-mapped by every worker.
+    Workers write rows of the distance matrix directly into
+    the .npy file, the whole matrix is never in RAM.
+    
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    nodes : list of nodes (index to node)
+    node_id : dict (node to index)
+    workers : int, the number of processes
+    distance_matrix : numpy.memmap (n, n) or numpy.ndarray, inf if no path
+    
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.johnson import JohnsonParallel
+    >>> algorithm = JohnsonParallel(G, workers=4, path="distance.npy")
+    >>> algorithm.run()     # calculations
+    >>> algorithm.distance_matrix[i, j]   # nodes are algorithm.nodes
+    >>> D = numpy.load("distance.npy", mmap_mode="r")   # later
+    
+    Notes
+    -----
+    Nodes must be int or str (the binary format). NumPy is required.
+    Without path the matrix is read into RAM after run().
+    """
+
+    def __init__(self, graph, workers=None, path=None, chunk=None,
+            bellmanford_class=BellmanFord):
+        """The algorithm initialization.
+        
+        Parameters
+        ----------
+        graph : directed weighted graph
+        bellmanford_class : class, optional (default=BellmanFord)
+        workers : int, optional (default: the number of CPUs),
+            1 means no worker processes
+        path : str, optional, the .npy file for the distance matrix
+        chunk : int, optional, the number of sources in one task
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        if numpy is None:
+            raise ValueError("NumPy is required")
+        self.graph = graph
+        self.workers = (workers if workers else (os.cpu_count() or 1))
+        self.path = path
+        self.chunk = chunk
+        self.bellmanford_class = bellmanford_class
+        self.nodes = list(self.graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        self.distance_matrix = None
+
+    def _potential(self):
+        """Return the Bellman-Ford potential as an array (zeros if
+        weights are non-negative)."""
+        n = len(self.nodes)
+        potential = numpy.zeros(n)
+        if all(edge.weight >= 0 for edge in self.graph.iteredges()):
+            return potential
+        new_node = ("johnson",)   # not int or str, a new node
+        new_graph = graph_class(self.graph)(n=(n + 1), directed=True)
+        for node in self.nodes:   # O(V) time
+            new_graph.add_node(node)
+            new_graph.add_edge(Edge(new_node, node, 0))
+        for edge in self.graph.iteredges():   # O(E) time
+            new_graph.add_edge(edge)
+        algorithm = self.bellmanford_class(new_graph)
+        # If this step detects a negative cycle, the algorithm is terminated.
+        algorithm.run(new_node)   # O(V*E) time
+        for i, node in enumerate(self.nodes):
+            potential[i] = algorithm.distance[node]
+        return potential
+
+    def _reweighted_graph(self, potential):
+        """Return CSRGraph with non-negative reweighted edges."""
+        graph = CSRGraph.from_graph(self.graph)
+        offsets = numpy.asarray(graph.offsets, dtype=numpy.int64)
+        targets = numpy.asarray(graph.targets, dtype=numpy.int64)
+        sources = numpy.repeat(numpy.arange(len(self.nodes)),
+            numpy.diff(offsets))
+        weights = (numpy.asarray(graph.weights, dtype=numpy.float64)
+            + potential[sources] - potential[targets])
+        numpy.maximum(weights, 0, out=weights)   # rounding errors
+        if graph.weights.typecode == "q":   # int weights and potential
+            weights = weights.astype(numpy.int64)
+        return CSRGraph.from_arrays(range(len(self.nodes)), offsets,
+            targets, weights, directed=True)
+
+    def run(self):
+        """Finding all shortest path distances."""
+        n = len(self.nodes)
+        potential = self._potential()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graph_path = os.path.join(tmpdir, "graph.bin")
+            binary.save(self._reweighted_graph(potential), graph_path)
+            output_path = (self.path if self.path is not None
+                else os.path.join(tmpdir, "distance.npy"))
+            output = numpy.lib.format.open_memmap(output_path, mode="w+",
+                dtype=numpy.float64, shape=(n, n))
+            del output   # the header is written, rows are in workers
+            chunk = self.chunk or max(1, n // (4 * self.workers))
+            tasks = [list(range(start, min(start + chunk, n)))
+                for start in range(0, n, chunk)]
+            if self.workers == 1:
+                graph = binary.load(graph_path, mmap=True)
+                for sources in tasks:
+                    _johnson_rows(graph, sources, potential, output_path)
+                del graph   # close memory maps
+            else:
+                with ProcessPoolExecutor(max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(graph_path,)) as executor:
+                    for _ in executor.map(_worker_rows, tasks,
+                            [potential] * len(tasks),
+                            [output_path] * len(tasks)):
+                        pass
+            if self.path is None:
+                self.distance_matrix = numpy.load(output_path)
+            else:
+                self.distance_matrix = numpy.load(output_path, mmap_mode="r")
+
+    def to_dict(self):
+        """Return distances as dict-of-dict (like Johnson.distance)."""
+        inf = float("inf")
+        integer = all(isinstance(edge.weight, int)
+            for edge in self.graph.iteredges())
+        distance = dict()
+        for i, source in enumerate(self.nodes):
+            row = self.distance_matrix[i].tolist()
+            if integer:
+                row = [(value if value == inf else int(round(value)))
+                    for value in row]
+            distance[source] = dict(zip(self.nodes, row))
+        return distance
+
 # EOF
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+import heapq
+import itertools
+from graphtheory.structures.views import MaskedView
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+
+
+class YenKShortestPaths:
+    """The k shortest simple paths (the Yen algorithm), a generator.
+
+    Paths are generated on demand in the order of nondecreasing length.
+    A candidate path is a root (a prefix of a found path) and a spur
+    path from DijkstraHeap, where root nodes and edges used by found
+    paths with the same root are hidden by MaskedView (no graph copies).
+    With the Lawler improvement only spur nodes after the deviation
+    node of the path are used.
+
+    Attributes
+    ----------
+    graph : input directed weighted graph
+    searches : number of spur searches (Dijkstra's runs)
+
+    Examples
+    --------
+    >>> from graphtheory.shortestpaths.kshortest import YenKShortestPaths
+    >>> algorithm = YenKShortestPaths(G)   # initialization
+    >>> for length, path in algorithm.iterpaths(source, target):
+    ...     print(length, path)   # break when enough
+    >>> algorithm.run(source, target, k=3)   # a list of 3 (length, path)
+
+    Notes
+    -----
+    Edge weights are non-negative.
+
+    Yen, J. Y., 1971, Finding the k shortest loopless paths
+        in a network, Management Science 17, 712-716.
+
+    Lawler, E. L., 1972, A procedure for computing the k best solutions
+        to discrete optimization problems and its application to
+        the shortest path problem, Management Science 18, 401-405.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed weighted graph with non-negative edge weights
+        """
+        if not graph.is_directed():
+            raise ValueError("the graph is not directed")
+        self.graph = graph
+        self.searches = 0
+
+    def _spur_path(self, view, source, target):
+        """Return (distance, path) in the view or None."""
+        self.searches += 1
+        algorithm = DijkstraHeap(view)
+        algorithm.run(source, target)
+        if target not in algorithm.distance:
+            return None
+        return algorithm.distance[target], algorithm.path(target)
+
+    def iterpaths(self, source, target):
+        """Generate (length, path) for simple paths from source to target."""
+        view = MaskedView(self.graph)
+        first = self._spur_path(view, source, target)
+        if first is None:
+            return
+        counter = itertools.count()   # ties in the heap
+        candidates = [(first[0], next(counter), first[1], 0)]
+        seen = set([tuple(first[1])])
+        found = []   # paths already generated
+        while candidates:
+            length, _, path, deviation = heapq.heappop(candidates)
+            found.append(path)
+            yield length, path
+            # Prefix lengths along the path.
+            prefix = [0]
+            for edge in zip(path, path[1:]):
+                prefix.append(prefix[-1] + self.graph.weight(edge))
+            for i in range(deviation, len(path) - 1):   # Lawler
+                root = path[:i+1]
+                view.hidden_nodes = set(root[:-1])
+                view.hidden_edges = set((other[i], other[i+1])
+                    for other in found
+                    if len(other) > i + 1 and other[:i+1] == root)
+                spur = self._spur_path(view, path[i], target)
+                if spur is None:
+                    continue
+                new_path = root[:-1] + spur[1]
+                key = tuple(new_path)
+                if key in seen:
+                    continue
+                seen.add(key)
+                heapq.heappush(candidates,
+                    (prefix[i] + spur[0], next(counter), new_path, i))
+
+    def run(self, source, target, k):
+        """Return a list of at most k pairs (length, path)."""
+        return list(itertools.islice(self.iterpaths(source, target), k))
+
+# EOF
@@ -3,6 +3,7 @@
 import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
+from graphtheory.shortestpaths import allpairs
 from graphtheory.shortestpaths.allpairs import *
 
 
@@ -84,6 +85,41 @@ class TestAllPairsShortestPaths(unittest.TestCase):
         algorithm = SlowAllPairsWithPaths(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    def test_without_numpy(self):
+        old_numpy, allpairs.numpy = allpairs.numpy, None
+        try:
+            self.test_slow()
+            self.test_faster()
+            self.test_slow_with_paths()
+            self.test_negative_cycle()
+        finally:
+            allpairs.numpy = old_numpy
+
+    @unittest.skipIf(allpairs.numpy is None, "NumPy is not installed")
+    def test_min_plus_product(self):
+        inf = float("inf")
+        A = allpairs.numpy.array([[0, 1, inf], [inf, 0, 2], [3, inf, 0]])
+        old_chunk, allpairs.CHUNK = allpairs.CHUNK, 1   # one row at once
+        try:
+            C, K = min_plus_product(A, A, argmin=True)
+        finally:
+            allpairs.CHUNK = old_chunk
+        self.assertEqual(C.tolist(), [[0, 1, 3], [5, 0, 2], [3, 4, 0]])
+        self.assertEqual(K[0, 2], 1)
+        self.assertEqual(K[2, 1], 0)
+        self.assertEqual(min_plus_product(A, A).tolist(), C.tolist())
+
+    def test_float_weights(self):
+        self.G.add_edge(Edge(4, 0, 2.5))
+        algorithm = FasterAllPairs(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.distance[4][0], 2.5)
+        self.assertEqual(algorithm.distance[4][2], 3)
+        algorithm = SlowAllPairsWithPaths(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.path(4, 2), [4, 3, 2])
+        self.assertRaises(ValueError, algorithm.path, 0, 4)
+
 if __name__ == "__main__":
 
     unittest.main()
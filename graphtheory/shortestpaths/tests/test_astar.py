@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.structures.points import Point
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.astar import AStar, Landmarks
+from graphtheory.shortestpaths.astar import make_euclidean_heuristic
+
+# 6---7---8
+# |   |   |
+# 3---4---5   grid with coordinates, weights are lengths
+# |   |   |
+# 0---1---2
+
+class TestAStar(unittest.TestCase):
+
+    def setUp(self):
+        self.size = 3
+        self.coordinates = dict((node, Point(node % 3, node // 3))
+            for node in range(9))
+        self.G = Graph(n=9, directed=True)
+        for node in range(9):
+            for other in (node + 1, node + 3):
+                if other < 9 and (other == node + 3 or node % 3 != 2):
+                    self.G.add_edge(Edge(node, other, 1))
+                    self.G.add_edge(Edge(other, node, 1))
+        self.G.del_edge((4, 5))   # a longer detour
+        self.G.del_edge((5, 4))
+
+    def test_euclidean(self):
+        heuristic = make_euclidean_heuristic(self.coordinates)
+        algorithm = AStar(self.G, heuristic)
+        algorithm.run(3, 5)
+        self.assertEqual(algorithm.distance[5], 4)
+        path = algorithm.path(5)
+        self.assertEqual(len(path), 5)
+        self.assertEqual((path[0], path[-1]), (3, 5))
+        algorithm.run(0, 2)   # the straight line
+        self.assertEqual(algorithm.path(2), [0, 1, 2])
+        self.assertEqual(algorithm.settled, 3)
+        # Nodes are Points.
+        H = Graph(n=3, directed=True)
+        H.add_edge(Edge(Point(0, 0), Point(3, 4), 5))
+        algorithm = AStar(H, make_euclidean_heuristic())
+        algorithm.run(Point(0, 0), Point(3, 4))
+        self.assertEqual(algorithm.distance[Point(3, 4)], 5)
+
+    def test_landmarks(self):
+        heuristic = Landmarks(self.G, k=2)
+        self.assertEqual(len(heuristic.landmarks), 2)
+        self.assertEqual(heuristic(2, 2), 0)
+        self.assertTrue(heuristic(3, 5) <= 4)
+        algorithm = AStar(self.G, heuristic)
+        algorithm.run(3, 5)
+        self.assertEqual(algorithm.distance[5], 4)
+
+    def test_landmarks_transpose_view(self):
+        G = GraphFactory(Graph).make_sparse(n=30, directed=True, m=100,
+            seed=7)
+        H = Graph(n=30, directed=True, inverse=True)   # fast iterinedges
+        for node in G.iternodes():
+            H.add_node(node)
+        for edge in G.iteredges():
+            H.add_edge(edge)
+        expected = Landmarks(G, [0, 5, 17])   # the transpose is copied
+        for graph in (H, CSRGraph.from_graph(G)):
+            heuristic = Landmarks(graph, [0, 5, 17])   # TransposeView
+            self.assertEqual(heuristic.distance_to, expected.distance_to)
+            self.assertEqual(heuristic.distance_from, expected.distance_from)
+
+    def test_random(self):
+        G = GraphFactory(Graph).make_sparse(n=50, directed=True, m=200,
+            seed=5)
+        for heuristic in (None, Landmarks(G, k=3), Landmarks(G, [0, 10])):
+            algorithm1 = AStar(G, heuristic)
+            algorithm2 = DijkstraHeap(G)
+            for source in range(0, 50, 9):
+                algorithm2.run(source)
+                for target in range(50):
+                    algorithm1.run(source, target)
+                    if target in algorithm2.distance:
+                        self.assertEqual(algorithm1.distance[target],
+                            algorithm2.distance[target])
+                    else:
+                        self.assertRaises(ValueError, algorithm1.path, target)
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -4,6 +4,8 @@ import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
 from graphtheory.shortestpaths.bellmanford import BellmanFord
+from graphtheory.shortestpaths.bellmanford import BellmanFordQueue
+from graphtheory.shortestpaths.bellmanford import GoldbergRadzik
 
 #    1
 # 0 --o 1
@@ -40,6 +42,16 @@ class TestBellmanFord(unittest.TestCase):
         path_expected = [0, 1, 2, 3]
         self.assertEqual(algorithm.path(target), path_expected)
         self.assertEqual(algorithm.path_iter(target), path_expected)
+        self.assertEqual(algorithm.passes, 2)   # early exit
+
+    def test_queue(self):
+        for algorithm_class in (BellmanFordQueue, GoldbergRadzik):
+            algorithm = algorithm_class(self.G)
+            algorithm.run(0)
+            self.assertEqual(algorithm.distance, {0: 0, 2: 2, 1: 1, 3: 3})
+            self.assertEqual(algorithm.path(3), [0, 1, 2, 3])
+            self.assertEqual(algorithm.cycle, None)
+        self.assertEqual(algorithm.find_negative_cycle(), None)
 
     def tearDown(self): pass
 
@@ -74,6 +86,28 @@ class TestBellmanFordCormen(unittest.TestCase):
         self.assertEqual(algorithm.path(target), path_expected)
         self.assertEqual(algorithm.path_iter(target), path_expected)
 
+    def test_queue_cormen(self):
+        for algorithm_class in (BellmanFordQueue, GoldbergRadzik):
+            algorithm = algorithm_class(self.G)
+            algorithm.run(0)
+            self.assertEqual(algorithm.distance,
+                {3: 7, 2: 4, 0: 0, 4: -2, 1: 2})
+            self.assertEqual(algorithm.path_iter(4), [0, 3, 2, 1, 4])
+
+    def test_negative_cycle(self):
+        self.G.add_edge(Edge(2, 3, 1))   # the cycle 2-3-2 (weight -2)
+        for algorithm_class in (BellmanFord, BellmanFordQueue,
+                GoldbergRadzik):
+            algorithm = algorithm_class(self.G)
+            self.assertRaises(ValueError, algorithm.run, 0)
+            cycle = algorithm.cycle
+            self.assertEqual(sorted(cycle), [2, 3], algorithm_class)
+        algorithm = BellmanFord(self.G)
+        cycle = algorithm.find_negative_cycle()
+        self.assertEqual(sum(self.G.weight((cycle[i-1], cycle[i]))
+            for i in range(len(cycle))), -2)
+        self.assertEqual(algorithm.distance[0], float("inf"))
+
     def tearDown(self): pass
 
 if __name__ == "__main__":
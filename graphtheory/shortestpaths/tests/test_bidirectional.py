@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.bidirectional import BidirectionalDijkstra
+
+
+class TestBidirectionalDijkstra(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 9           # number of nodes
+        self.G = Graph(n=self.N, directed=True, inverse=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 65), Edge(1, 8, 41), Edge(1, 2, 35),
+            Edge(2, 3, 56), Edge(3, 4, 4),  Edge(3, 6, 20),
+            Edge(5, 2, 30), Edge(6, 5, 18), Edge(6, 7, 15),
+            Edge(8, 3, 28)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_shortest_path(self):
+        algorithm = BidirectionalDijkstra(self.G)
+        algorithm.run(0, 7)
+        self.assertEqual(algorithm.distance[7], 169)
+        self.assertEqual(algorithm.path(7), [0, 1, 8, 3, 6, 7])
+        for node in algorithm.path(7):   # exact distances on the path
+            self.assertEqual(algorithm.distance[node],
+                {0: 0, 1: 65, 8: 106, 3: 134, 6: 154, 7: 169}[node])
+        algorithm.run(4, 4)
+        self.assertEqual(algorithm.path(4), [4])
+
+    def test_no_path(self):
+        algorithm = BidirectionalDijkstra(self.G)
+        algorithm.run(2, 8)
+        self.assertRaises(ValueError, algorithm.path, 8)
+
+    def test_random(self):
+        G = GraphFactory(Graph).make_sparse(n=50, directed=True, m=200,
+            seed=3)
+        algorithm1 = BidirectionalDijkstra(G)
+        algorithm2 = DijkstraHeap(G)
+        for source in range(0, 50, 7):
+            algorithm2.run(source)
+            for target in range(50):
+                algorithm1.run(source, target)
+                if target in algorithm2.distance:
+                    self.assertEqual(algorithm1.distance[target],
+                        algorithm2.distance[target])
+                    path = algorithm1.path(target)
+                    self.assertEqual(sum(G.weight(edge) for edge in
+                        zip(path, path[1:])), algorithm2.distance[target])
+                else:
+                    self.assertRaises(ValueError, algorithm1.path, target)
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, BidirectionalDijkstra, Graph(n=2))
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
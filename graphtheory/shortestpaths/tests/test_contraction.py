@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+import os
+import shutil
+import tempfile
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.contraction import ContractionHierarchy
+
+
+class TestContractionHierarchy(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 9           # number of nodes
+        self.G = Graph(n=self.N, directed=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 65), Edge(1, 8, 41), Edge(1, 2, 35),
+            Edge(2, 3, 56), Edge(3, 4, 4),  Edge(3, 6, 20),
+            Edge(5, 2, 30), Edge(6, 5, 18), Edge(6, 7, 15),
+            Edge(8, 3, 28)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_query(self):
+        algorithm = ContractionHierarchy(self.G)
+        algorithm.run()
+        self.assertEqual(sorted(algorithm.rank.values()), list(self.nodes))
+        self.assertEqual(algorithm.query(0, 7), 169)
+        self.assertEqual(algorithm.path(0, 7), [0, 1, 8, 3, 6, 7])
+        self.assertEqual(algorithm.query(2, 8), float("inf"))
+        self.assertRaises(ValueError, algorithm.path, 2, 8)
+        self.assertEqual(algorithm.path(4, 4), [4])
+
+    def test_random(self):
+        G = GraphFactory(Graph).make_sparse(n=60, directed=True, m=240,
+            seed=7)
+        algorithm = ContractionHierarchy(G)
+        algorithm.run()
+        dijkstra = DijkstraHeap(G)
+        for source in range(0, 60, 5):
+            dijkstra.run(source)
+            for target in range(60):
+                if target not in dijkstra.distance:
+                    self.assertEqual(algorithm.query(source, target),
+                        float("inf"))
+                    continue
+                self.assertEqual(algorithm.query(source, target),
+                    dijkstra.distance[target])
+                path = algorithm.path(source, target)
+                self.assertEqual((path[0], path[-1]), (source, target))
+                self.assertEqual(sum(G.weight(edge) for edge in
+                    zip(path, path[1:])), dijkstra.distance[target])
+
+    def test_save_load(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            name = os.path.join(tmpdir, "graph.ch")
+            algorithm = ContractionHierarchy(self.G)
+            algorithm.run()
+            algorithm.save(name)
+            loaded = ContractionHierarchy.load(name)
+            self.assertEqual(loaded.rank, algorithm.rank)
+            self.assertEqual(loaded.shortcuts, algorithm.shortcuts)
+            self.assertEqual(loaded.path(0, 7), [0, 1, 8, 3, 6, 7])
+            with open(name, "wb") as fileobj:
+                fileobj.write(b"\x80\x04N.")   # pickled None
+            self.assertRaises(ValueError, ContractionHierarchy.load, name)
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_exceptions(self):
+        self.assertRaises(ValueError, ContractionHierarchy, Graph(n=2))
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
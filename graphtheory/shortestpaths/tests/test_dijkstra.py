@@ -4,6 +4,7 @@ import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
 from graphtheory.shortestpaths.dijkstra import Dijkstra, Dijkstra2, DijkstraMatrix
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
 
 #    1
 # 0 --> 1
@@ -67,6 +68,19 @@ class TestDijkstra(unittest.TestCase):
         self.assertEqual(algorithm.path(target), path_expected)
         self.assertEqual(algorithm.path_iter(target), path_expected)
 
+    def test_dijkstra_heap(self):
+        source = 0
+        target = 3
+        algorithm = DijkstraHeap(self.G)
+        algorithm.run(source)
+        distance_expected = {0: 0, 1: 1, 2: 2, 3: 3}
+        self.assertEqual(algorithm.distance, distance_expected)
+        parent_expected = {0: None, 2: 1, 1: 0, 3: 2}
+        self.assertEqual(algorithm.parent, parent_expected)
+        path_expected = [0, 1, 2, 3]
+        self.assertEqual(algorithm.path(target), path_expected)
+        self.assertEqual(algorithm.settled, 4)
+
     def tearDown(self): pass
 
 
@@ -164,6 +178,53 @@ class TestDijkstra2(unittest.TestCase):
         self.assertEqual(algorithm.path(target), path_expected)
         self.assertEqual(algorithm.path_iter(target), path_expected)
 
+    def test_dijkstra_heap(self):
+        algorithm = DijkstraHeap(self.G)
+        algorithm.run(0)
+        distance_expected = {0: 0, 1: 65, 2: 100, 3: 134, 4: 138,
+            5: 172, 6: 154, 7: 169, 8: 106}
+        self.assertEqual(algorithm.distance, distance_expected)
+        self.assertEqual(algorithm.path(7), [0, 1, 8, 3, 6, 7])
+        algorithm.run(2)   # no path to 8
+        self.assertEqual(algorithm.distance,
+            {2: 0, 3: 56, 4: 60, 5: 94, 6: 76, 7: 91})
+        self.assertRaises(ValueError, algorithm.path, 8)
+
+    def test_dijkstra_heap_early_exit(self):
+        algorithm = DijkstraHeap(self.G)
+        algorithm.run(0, 3)   # stop at the target
+        self.assertEqual(algorithm.distance[3], 134)
+        self.assertEqual(algorithm.path(3), [0, 1, 8, 3])
+        self.assertEqual(algorithm.settled, 5)   # 0, 1, 2, 8, 3
+        self.assertFalse(7 in algorithm.distance)
+        algorithm.run(0, targets=[8, 4])
+        self.assertEqual(algorithm.distance[4], 138)
+        self.assertEqual(algorithm.distance[8], 106)
+        self.assertEqual(algorithm.settled, 6)
+        algorithm.run(0, radius=134)
+        self.assertEqual(algorithm.distance,
+            {0: 0, 1: 65, 2: 100, 3: 134, 8: 106})
+        self.assertEqual(algorithm.path(3), [0, 1, 8, 3])
+        algorithm.run(0, 0)
+        self.assertEqual(algorithm.path(0), [0])
+
+    def test_long_path(self):
+        n = 10000   # recursive path() would exceed the recursion limit
+        G = Graph(n=n, directed=True)
+        G.add_edges_from((i, i+1) for i in range(n-1))
+        algorithm = DijkstraHeap(G)
+        algorithm.run(0, n-1)
+        self.assertEqual(algorithm.path(n-1), list(range(n)))
+
+    def test_large_float_weights(self):
+        big = 2.0 ** 60   # big + 1 == big
+        G = Graph(n=3, directed=True)
+        G.add_edges_from([(0, 1, big), (1, 2, 1.0)])
+        algorithm = DijkstraHeap(G)
+        algorithm.run(0)
+        self.assertEqual(algorithm.distance, {0: 0, 1: big, 2: big})
+        self.assertEqual(algorithm.path(2), [0, 1, 2])
+
     def tearDown(self): pass
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+import random
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.dynamic import DynamicDijkstra
+
+#    1
+# 0 --> 1
+# |   / |
+# |5 /1 |3
+# |./.  |.
+# 2 --> 3
+#    1
+
+class TestDynamicDijkstra(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4           # number of nodes
+        self.G = Graph(n=self.N, directed=True, inverse=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 1), Edge(0, 2, 5), Edge(1, 2, 1), Edge(1, 3, 3), 
+            Edge(2, 3, 1)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_updates(self):
+        algorithm = DynamicDijkstra(self.G)
+        algorithm.run(0)
+        self.assertEqual(algorithm.distance, {0: 0, 1: 1, 2: 2, 3: 3})
+        self.assertEqual(algorithm.path(3), [0, 1, 2, 3])
+        algorithm.change_weight((1, 2), 5)   # 1-3 is the new tree edge
+        self.assertEqual(algorithm.distance, {0: 0, 1: 1, 2: 5, 3: 4})
+        self.assertEqual(algorithm.path(3), [0, 1, 3])
+        self.assertEqual(algorithm.path(2), [0, 2])
+        algorithm.change_weight(Edge(1, 2), 1)   # back
+        self.assertEqual(algorithm.distance, {0: 0, 1: 1, 2: 2, 3: 3})
+        self.assertEqual(algorithm.touched, 2)
+        algorithm.change_weight((0, 2), 9)   # not a tree edge
+        self.assertEqual(algorithm.touched, 0)
+        algorithm.del_edge(Edge(0, 1))
+        self.assertEqual(algorithm.distance, {0: 0, 2: 9, 3: 10})
+        self.assertRaises(ValueError, algorithm.path, 1)
+        algorithm.add_edge(Edge(0, 1, 2))
+        self.assertEqual(algorithm.distance, {0: 0, 1: 2, 2: 3, 3: 4})
+        self.assertEqual(algorithm.touched, 3)
+        self.assertEqual(algorithm.updates, 5)
+        self.assertRaises(ValueError, algorithm.change_weight, (3, 0), 1)
+
+    def test_random(self):
+        G = GraphFactory(Graph).make_sparse(n=50, directed=True, m=200,
+            seed=3)
+        H = Graph(n=50, directed=True, inverse=True)
+        H.add_edges_from(G.iteredges())
+        algorithm = DynamicDijkstra(H)
+        algorithm.run(0)
+        rng = random.Random(3)
+        for step in range(300):
+            edges = list(H.iteredges())
+            choice = rng.random()
+            if choice < 0.6:
+                edge = rng.choice(edges)
+                algorithm.change_weight(edge, rng.randrange(0, 100))
+            elif choice < 0.8:
+                algorithm.del_edge(rng.choice(edges))
+            else:
+                source, target = rng.sample(range(50), 2)
+                if not H.has_edge((source, target)):
+                    algorithm.add_edge(Edge(source, target,
+                        rng.randrange(100)))
+            expected = DijkstraHeap(H)
+            expected.run(0)
+            self.assertEqual(algorithm.distance, expected.distance)
+            for node in algorithm.distance:   # the tree is correct
+                path = algorithm.path(node)
+                self.assertEqual(sum(H.weight(edge)
+                    for edge in zip(path, path[1:])), expected.distance[node])
+            for node, children in algorithm.children.items():
+                for child in children:
+                    self.assertEqual(algorithm.parent[child], node)
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+import os
+import shutil
+import tempfile
 import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
@@ -57,6 +60,50 @@ class TestFloydWarshall(unittest.TestCase):
         algorithm = FloydWarshall(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_floydwarshall_numpy(self):
+        expected = FloydWarshallPaths(self.G)
+        expected.run()
+        algorithm = FloydWarshallNumPy(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.to_dict(), expected.distance)
+        self.assertEqual(algorithm.parent_to_dict(), expected.parent)
+        self.assertEqual(algorithm.path(0, 1), [0, 3, 1])
+        self.assertEqual(algorithm.path(4, 4), [4])
+        self.assertRaises(ValueError, algorithm.path, 0, 4)
+        self.assertEqual(algorithm.distance_matrix.shape, (self.N, self.N))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_floydwarshall_numpy_negative_cycle(self):
+        self.G.add_edge(Edge(1, 3, -2))
+        algorithm = FloydWarshallNumPy(self.G)
+        self.assertRaises(ValueError, algorithm.run)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_floydwarshall_blocked(self):
+        expected = FloydWarshall(self.G)
+        expected.run()
+        for block in (1, 2, 3, 5, 8):
+            algorithm = FloydWarshallBlocked(self.G, block=block)
+            algorithm.run()
+            self.assertEqual(algorithm.to_dict(), expected.distance)
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "distance.npy")
+            algorithm = FloydWarshallBlocked(self.G, block=2, path=path)
+            algorithm.run()
+            del algorithm
+            D = numpy.load(path, mmap_mode="r")
+            self.assertEqual(D[0, 1], 4)
+            self.assertEqual(D[0, 4], float("inf"))
+            del D
+        finally:
+            shutil.rmtree(tmpdir)
+        self.G.add_edge(Edge(1, 3, -2))
+        algorithm = FloydWarshallBlocked(self.G, block=2)
+        self.assertRaises(ValueError, algorithm.run)
+        self.assertRaises(ValueError, FloydWarshallBlocked, self.G, block=0)
+
 
 class TestFloydWarshallNegativeEdges(unittest.TestCase):
 
@@ -106,6 +153,24 @@ class TestFloydWarshallNegativeEdges(unittest.TestCase):
         algorithm = FloydWarshall(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_negative_edges_blocked(self):
+        expected = FloydWarshall(self.G)
+        expected.run()
+        algorithm = FloydWarshallBlocked(self.G, block=3)
+        algorithm.run()
+        self.assertEqual(algorithm.to_dict(), expected.distance)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_negative_edges_numpy(self):
+        expected = FloydWarshallPaths(self.G)
+        expected.run()
+        algorithm = FloydWarshallNumPy(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.to_dict(), expected.distance)
+        self.assertEqual(algorithm.parent_to_dict(), expected.parent)
+        self.assertEqual(algorithm.path(0, 3), [0, 1, 3])
+
 #    3     6
 # 1 --- 0 --- 2
 # | \   |   /
@@ -146,6 +211,19 @@ class TestFloydWarshallAllGraphs(unittest.TestCase):
         algorithm = FloydWarshallAllGraphs(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_floydwarshall_numpy(self):
+        expected = FloydWarshallAllGraphs(self.G)
+        expected.run()
+        algorithm = FloydWarshallNumPy(self.G)
+        algorithm.run()
+        self.assertEqual(algorithm.to_dict(), expected.distance)
+        self.assertEqual(algorithm.path(2, 4), [2, 3, 4])
+        self.assertEqual(algorithm.path(4, 2), [4, 3, 2])
+        self.G.add_edge(Edge(2, 4, -1))
+        algorithm = FloydWarshallNumPy(self.G)
+        self.assertRaises(ValueError, algorithm.run)
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 
+import os
+import shutil
+import tempfile
 import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
+from graphtheory.shortestpaths.bellmanford import GoldbergRadzik
 from graphtheory.shortestpaths.johnson import *
 
 
@@ -47,6 +51,18 @@ class TestJohnson(unittest.TestCase):
         algorithm = Johnson(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_johnson_parallel(self):
+        expected = JohnsonFaster(self.G)   # non-negative weights
+        expected.run()
+        for workers in (1, 2):
+            algorithm = JohnsonParallel(self.G, workers=workers, chunk=2)
+            algorithm.run()
+            self.assertEqual(algorithm.to_dict(), expected.distance)
+        self.G.add_edge(Edge(1, 3, -2))
+        algorithm = JohnsonParallel(self.G, workers=1)
+        self.assertRaises(ValueError, algorithm.run)
+
 
 class TestJohnsonNegativeEdges(unittest.TestCase):
 
@@ -87,6 +103,30 @@ class TestJohnsonNegativeEdges(unittest.TestCase):
         algorithm = Johnson(self.G)
         self.assertRaises(ValueError, algorithm.run)
 
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_johnson_parallel(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, "distance.npy")
+            algorithm = JohnsonParallel(self.G, workers=2, path=path)
+            algorithm.run()
+            expected = Johnson(self.G)   # edges are reweighted in place
+            expected.run()
+            self.assertEqual(algorithm.to_dict(), expected.distance)
+            D = numpy.load(path)   # rows streamed to the file
+            self.assertEqual(D[2, 0], -3)
+            self.assertEqual(D.shape, (self.N, self.N))
+            del algorithm, D
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+    def test_goldberg_radzik(self):
+        algorithm = JohnsonFaster(self.G, bellmanford_class=GoldbergRadzik)
+        algorithm.run()
+        self.assertEqual(algorithm.distance[2], {0: -3, 2: 0, 1: -1, 3: 2})
+        self.assertTrue(isinstance(algorithm._bf, GoldbergRadzik))
+
 
 class TestJohnsonWiki(unittest.TestCase):
 
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.shortestpaths.kshortest import YenKShortestPaths
+
+# The graph from Wikipedia (Yen's algorithm), C=0, D=1, E=2, F=3, G=4, H=5.
+
+class TestYenKShortestPaths(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 6           # number of nodes
+        self.G = Graph(n=self.N, directed=True)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 1, 3), Edge(0, 2, 2), Edge(1, 3, 4), Edge(2, 1, 1), 
+            Edge(2, 3, 2), Edge(2, 4, 3), Edge(3, 4, 2), Edge(3, 5, 1), 
+            Edge(4, 5, 2)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_yen(self):
+        algorithm = YenKShortestPaths(self.G)
+        paths = algorithm.run(0, 5, 3)
+        self.assertEqual(paths, [(5, [0, 2, 3, 5]), (7, [0, 2, 4, 5]),
+            (8, [0, 1, 3, 5])])
+        self.assertEqual(len(algorithm.run(0, 5, 100)), 7)   # all paths
+        self.assertEqual(algorithm.run(5, 0, 3), [])
+        self.assertEqual(algorithm.run(1, 1, 3), [(0, [1])])
+
+    def test_generator(self):
+        algorithm = YenKShortestPaths(self.G)
+        paths = algorithm.iterpaths(0, 5)
+        self.assertEqual(next(paths), (5, [0, 2, 3, 5]))
+        searches = algorithm.searches   # lazy, no spur searches yet
+        self.assertEqual(searches, 1)
+        self.assertEqual(next(paths), (7, [0, 2, 4, 5]))
+        self.assertTrue(algorithm.searches > searches)
+        lengths = [length for (length, path) in paths]
+        self.assertEqual(lengths, sorted(lengths))
+        self.assertEqual(self.G.e(), len(self.edges))   # not modified
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
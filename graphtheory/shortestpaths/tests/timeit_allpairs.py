@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+#
+# SlowAllPairs, SlowAllPairsWithPaths and FasterAllPairs,
+# dict loops (without NumPy) and the min-plus product backend.
+# Testing SlowAllPairs (dict) ...
+# 60 1.0810309019998385
+# Testing SlowAllPairsWithPaths (dict) ...
+# 60 0.4184816909996698
+# Testing FasterAllPairs (dict) ...
+# 60 0.5882285420002518
+# Testing SlowAllPairs (numpy) ...
+# 60 0.012606770999809669
+# Testing SlowAllPairsWithPaths (numpy) ...
+# 60 0.030376288999832468
+# Testing FasterAllPairs (numpy) ...
+# 60 0.006666911000138498
+
+import timeit
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths import allpairs
+from graphtheory.shortestpaths.allpairs import SlowAllPairs
+from graphtheory.shortestpaths.allpairs import SlowAllPairsWithPaths
+from graphtheory.shortestpaths.allpairs import FasterAllPairs
+
+N = 60   # number of nodes
+M = 4 * N   # number of edges
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+
+def test(algorithm_class):
+    algorithm = algorithm_class(G)
+    algorithm.run()
+
+old_numpy = allpairs.numpy
+for backend in ("dict", "numpy"):
+    allpairs.numpy = (old_numpy if backend == "numpy" else None)
+    for algorithm_class in (SlowAllPairs, SlowAllPairsWithPaths,
+            FasterAllPairs):
+        print("Testing {} ({}) ...".format(algorithm_class.__name__, backend))
+        t1 = timeit.Timer(lambda: test(algorithm_class))
+        print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+#
+# BellmanFord (with early exit), BellmanFordQueue (SPFA), GoldbergRadzik,
+# and the potential for Johnson (negative weights).
+# Testing BellmanFord (non-negative) ...
+# 2000 0.11693745000002309
+# Testing BellmanFordQueue (non-negative) ...
+# 2000 0.02875674999995681
+# Testing GoldbergRadzik (non-negative) ...
+# 2000 0.05897767400028897
+# Testing BellmanFord (negative) ...
+# 2000 0.1494383989997914
+# Testing BellmanFordQueue (negative) ...
+# 2000 0.026864798000133305
+# Testing GoldbergRadzik (negative) ...
+# 2000 0.051765954000075
+# Without the early exit BellmanFord makes 1999 passes (about 40 s).
+
+import timeit
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.bellmanford import BellmanFord
+from graphtheory.shortestpaths.bellmanford import BellmanFordQueue
+from graphtheory.shortestpaths.bellmanford import GoldbergRadzik
+
+N = 2000   # number of nodes
+M = 8 * N   # number of edges
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+# Negative weights without negative cycles (a random potential).
+random.seed(1)
+potential = dict((node, random.randrange(100)) for node in G.iternodes())
+H = Graph(n=N, directed=True)
+for edge in G.iteredges():
+    H.add_edge(Edge(edge.source, edge.target,
+        edge.weight + potential[edge.source] - potential[edge.target]))
+
+for name, graph in (("non-negative", G), ("negative", H)):
+    for algorithm_class in (BellmanFord, BellmanFordQueue, GoldbergRadzik):
+        print("Testing {} ({}) ...".format(algorithm_class.__name__, name))
+        algorithm = algorithm_class(graph)
+        t1 = timeit.Timer(lambda: algorithm.run(0))
+        print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
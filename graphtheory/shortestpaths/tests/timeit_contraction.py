@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+#
+# Contraction hierarchies: preprocessing time, s-t queries
+# compared with DijkstraHeap and BidirectionalDijkstra.
+# Testing ContractionHierarchy.run() ...
+# 4900 10.719175899999755 shortcuts 34352
+# Testing DijkstraHeap ...
+# 1000 8.190149483999903 settled 2351
+# Testing BidirectionalDijkstra ...
+# 1000 6.645098941000015 settled 1522
+# Testing ContractionHierarchy.query() ...
+# 1000 1.0943367909999324 settled 219
+
+import timeit
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.bidirectional import BidirectionalDijkstra
+from graphtheory.shortestpaths.contraction import ContractionHierarchy
+
+SIZE = 70   # SIZE * SIZE nodes, a grid road network
+Q = 1000   # number of queries
+random.seed(1)
+G = Graph(n=SIZE * SIZE, directed=True, inverse=True)
+for node in range(SIZE * SIZE):
+    G.add_node(node)
+for node in range(SIZE * SIZE):
+    for other in (node + 1, node + SIZE):
+        if other >= SIZE * SIZE or (other == node + 1 and other % SIZE == 0):
+            continue
+        G.add_edge(Edge(node, other, random.randint(10, 100)))
+        G.add_edge(Edge(other, node, random.randint(10, 100)))
+queries = [(random.randrange(SIZE * SIZE), random.randrange(SIZE * SIZE))
+    for _ in range(Q)]
+
+print("Testing ContractionHierarchy.run() ...")
+hierarchy = ContractionHierarchy(G)
+t1 = timeit.Timer(hierarchy.run)
+print("{} {} shortcuts {}".format(G.v(), t1.timeit(1), hierarchy.shortcuts))
+
+def test_dijkstra(algorithm, settled):
+    for (source, target) in queries:
+        algorithm.run(source, target)
+        settled.append(algorithm.settled)
+
+def test_hierarchy(settled):
+    for (source, target) in queries:
+        hierarchy.query(source, target)
+        settled.append(hierarchy.settled)
+
+for algorithm in (DijkstraHeap(G), BidirectionalDijkstra(G)):
+    print("Testing {} ...".format(algorithm.__class__.__name__))
+    settled = []
+    t1 = timeit.Timer(lambda: test_dijkstra(algorithm, settled))
+    print("{} {} settled {}".format(Q, t1.timeit(1), sum(settled) // Q))
+
+print("Testing ContractionHierarchy.query() ...")
+settled = []
+t1 = timeit.Timer(lambda: test_hierarchy(settled))
+print("{} {} settled {}".format(Q, t1.timeit(1), sum(settled) // Q))
+
+# EOF
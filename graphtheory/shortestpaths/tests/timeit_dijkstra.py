@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+# Dijkstra, Dijkstra2, DijkstraMatrix and DijkstraHeap (single source),
+# DijkstraHeap with early exit (point-to-point queries).
+# Testing Dijkstra ...
+# 100 4.192869286000132
+# Testing Dijkstra2 ...
+# 100 3.9735030140000163
+# Testing DijkstraMatrix ...
+# 100 36.21166550099997
+# Testing DijkstraHeap ...
+# 100 1.155544695000117
+# Testing DijkstraHeap with target ...
+# 100 0.6231543760000022
+
+import timeit
+import random
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import Dijkstra
+from graphtheory.shortestpaths.dijkstra import Dijkstra2
+from graphtheory.shortestpaths.dijkstra import DijkstraMatrix
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+
+N = 2000   # number of nodes
+M = 8 * N   # number of edges
+Q = 100   # number of queries
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+random.seed(1)
+queries = [(random.randrange(N), random.randrange(N)) for _ in range(Q)]
+
+def test_full(algorithm_class):
+    for (source, target) in queries:
+        algorithm = algorithm_class(G)
+        algorithm.run(source)
+
+def test_target():
+    algorithm = DijkstraHeap(G)
+    for (source, target) in queries:
+        algorithm.run(source, target)
+
+for algorithm_class in (Dijkstra, Dijkstra2, DijkstraMatrix, DijkstraHeap):
+    print("Testing {} ...".format(algorithm_class.__name__))
+    t1 = timeit.Timer(lambda: test_full(algorithm_class))
+    print("{} {}".format(Q, t1.timeit(1)))
+
+print("Testing DijkstraHeap with target ...")
+t1 = timeit.Timer(test_target)
+print("{} {}".format(Q, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+#
+# Random weight changes, DynamicDijkstra (local repair)
+# and DijkstraHeap from scratch after every change.
+# Testing DynamicDijkstra ...
+# touched per update 3.32
+# 200 0.07715854600019156
+# Testing DijkstraHeap ...
+# 200 11.859880116000113
+
+import timeit
+import random
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.dijkstra import DijkstraHeap
+from graphtheory.shortestpaths.dynamic import DynamicDijkstra
+
+N = 10000   # number of nodes
+M = 4 * N   # number of edges
+Q = 200   # number of updates
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+H = Graph(n=N, directed=True, inverse=True)
+H.add_edges_from(G.iteredges())
+random.seed(1)
+edges = list(H.iteredges())
+updates = [((edge.source, edge.target), random.randrange(1, 2 * edge.weight + 2))
+    for edge in random.sample(edges, Q)]
+
+def test_dynamic():
+    algorithm = DynamicDijkstra(H)
+    algorithm.run(0)
+    for edge, weight in updates:
+        algorithm.change_weight(edge, weight)
+    print("touched per update {}".format(algorithm.total_touched / Q))
+
+def test_scratch():
+    for edge, weight in updates:
+        algorithm = DijkstraHeap(H)
+        algorithm.run(0)
+
+print("Testing DynamicDijkstra ...")
+t1 = timeit.Timer(test_dynamic)
+print("{} {}".format(Q, t1.timeit(1)))
+
+print("Testing DijkstraHeap ...")
+t1 = timeit.Timer(test_scratch)
+print("{} {}".format(Q, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+#
+# FloydWarshall, FloydWarshallPaths, FloydWarshallNumPy,
+# FloydWarshallBlocked, TransitiveClosure and TransitiveClosureNumPy.
+# Testing FloydWarshall ...
+# 200 4.426265665000301
+# Testing FloydWarshallPaths ...
+# 200 2.0078632839999955
+# Testing FloydWarshallNumPy ...
+# 200 0.043106596999678004
+# Testing FloydWarshallBlocked ...
+# 200 0.023559532000035688
+# Testing TransitiveClosure ...
+# 200 1.1074431309998545
+# Testing TransitiveClosureNumPy ...
+# 200 0.006449049000366358
+# Testing FloydWarshallNumPy ...
+# 2000 56.405083017999914
+# Testing FloydWarshallBlocked ...
+# 2000 12.893741579000107
+
+import timeit
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.floydwarshall import FloydWarshall
+from graphtheory.shortestpaths.floydwarshall import FloydWarshallPaths
+from graphtheory.shortestpaths.floydwarshall import FloydWarshallNumPy
+from graphtheory.shortestpaths.floydwarshall import FloydWarshallBlocked
+from graphtheory.algorithms.closure import TransitiveClosure
+from graphtheory.algorithms.closure import TransitiveClosureNumPy
+
+N = 200   # number of nodes
+M = 8 * N   # number of edges
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+
+def test(algorithm_class):
+    algorithm = algorithm_class(G)
+    algorithm.run()
+
+for algorithm_class in (FloydWarshall, FloydWarshallPaths, FloydWarshallNumPy,
+        FloydWarshallBlocked, TransitiveClosure, TransitiveClosureNumPy):
+    print("Testing {} ...".format(algorithm_class.__name__))
+    t1 = timeit.Timer(lambda: test(algorithm_class))
+    print("{} {}".format(N, t1.timeit(1)))
+
+N = 2000   # number of nodes
+M = 8 * N   # number of edges
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+
+for algorithm_class in (FloydWarshallNumPy, FloydWarshallBlocked):
+    print("Testing {} ...".format(algorithm_class.__name__))
+    t1 = timeit.Timer(lambda: test(algorithm_class))
+    print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
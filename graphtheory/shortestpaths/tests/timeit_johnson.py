@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+#
+# JohnsonFaster and JohnsonParallel with 1, 2, 4 worker processes.
+# Rows are independent, the speedup is limited by the number of CPUs
+# (results below are from one CPU, only the CSR Dijkstra gain is seen).
+# CPUs 1
+# Testing JohnsonFaster ...
+# 1000 21.039563956000165
+# Testing JohnsonParallel workers=1 ...
+# 1000 10.166630989999703
+# Testing JohnsonParallel workers=2 ...
+# 1000 10.121868956000071
+# Testing JohnsonParallel workers=4 ...
+# 1000 10.197281569999632
+# Testing JohnsonParallel workers=4 with path ...
+# 1000 10.258505281999987
+
+import os
+import timeit
+import tempfile
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.johnson import JohnsonFaster
+from graphtheory.shortestpaths.johnson import JohnsonParallel
+
+N = 1000   # number of nodes
+M = 8 * N   # number of edges
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+print("CPUs {}".format(os.cpu_count()))
+
+def test_faster():
+    algorithm = JohnsonFaster(G)
+    algorithm.run()
+
+def test_parallel(workers, path=None):
+    algorithm = JohnsonParallel(G, workers=workers, path=path)
+    algorithm.run()
+
+print("Testing JohnsonFaster ...")
+t1 = timeit.Timer(test_faster)
+print("{} {}".format(N, t1.timeit(1)))
+
+for workers in (1, 2, 4):
+    print("Testing JohnsonParallel workers={} ...".format(workers))
+    t1 = timeit.Timer(lambda: test_parallel(workers))
+    print("{} {}".format(N, t1.timeit(1)))
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    print("Testing JohnsonParallel workers=4 with path ...")
+    path = os.path.join(tmpdir, "distance.npy")
+    t1 = timeit.Timer(lambda: test_parallel(4, path))
+    print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+#
+# YenKShortestPaths, the first k paths for random queries.
+# Spur searches are done only for paths taken from the generator.
+# Testing YenKShortestPaths k=1 ...
+# spur searches per query 1.0
+# 10 0.051026147000357014
+# Testing YenKShortestPaths k=5 ...
+# spur searches per query 30.5
+# 10 1.7477782690002641
+# Testing YenKShortestPaths k=20 ...
+# spur searches per query 139.6
+# 10 9.562662799999998
+
+import timeit
+import random
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.shortestpaths.kshortest import YenKShortestPaths
+
+N = 2000   # number of nodes
+M = 4 * N   # number of edges
+Q = 10   # number of queries
+G = GraphFactory(Graph).make_sparse(n=N, directed=True, m=M, seed=1)
+random.seed(1)
+queries = [(random.randrange(N), random.randrange(N)) for _ in range(Q)]
+
+def test(k):
+    algorithm = YenKShortestPaths(G)
+    for (source, target) in queries:
+        algorithm.run(source, target, k)
+    print("spur searches per query {}".format(algorithm.searches / Q))
+
+for k in (1, 5, 20):
+    print("Testing YenKShortestPaths k={} ...".format(k))
+    t1 = timeit.Timer(lambda: test(k))
+    print("{} {}".format(Q, t1.timeit(1)))
+
+# EOF
@@ -2,6 +2,7 @@
 
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.unionfind import UnionFind
+from graphtheory.structures.views import graph_class
 
 
 class BoruvkaMST:
@@ -43,7 +44,7 @@ class BoruvkaMST:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.mst = self.graph.__class__(n=self.graph.v())
+        self.mst = graph_class(self.graph)(n=self.graph.v())
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.mst.add_node(node)
         self._uf = UnionFind()
@@ -6,6 +6,7 @@ except ImportError:   # Python 3
     from queue import PriorityQueue
 
 from graphtheory.structures.unionfind import UnionFind
+from graphtheory.structures.views import graph_class
 
 
 class KruskalMST:
@@ -54,7 +55,7 @@ class KruskalMST:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.mst = self.graph.__class__(n=self.graph.v())
+        self.mst = graph_class(self.graph)(n=self.graph.v())
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.mst.add_node(node)
         self._uf = UnionFind()
@@ -125,7 +126,7 @@ class KruskalMSTSorted:
         if graph.is_directed():
             raise ValueError("the graph is directed")
         self.graph = graph
-        self.mst = self.graph.__class__(n=self.graph.v())
+        self.mst = graph_class(self.graph)(n=self.graph.v())
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.mst.add_node(node)
         self._uf = UnionFind()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+
+from graphtheory.structures.edges import Edge, edges_from
+from graphtheory.structures.basegraphs import BaseGraph
+
+try:
+    integer_types = (int, long)
+    range = xrange
+except NameError:   # Python 3
+    integer_types = (int,)
+
+try:
+    popcount = int.bit_count   # Python 3.10+
+except AttributeError:
+    def popcount(mask):
+        """Return the number of ones in the bitmask."""
+        return bin(mask).count("1")
+
+
+def iterbits(mask):
+    """Generate positions of ones in the bitmask (nodes) on demand."""
+    while mask:
+        low = mask & -mask   # the lowest one
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitsetGraph(BaseGraph):
+    """The class defining a graph with bitset rows.
+
+    The adjacency matrix is stored as a list of Python ints, the bit j
+    of rows[i] is set if the edge (i, j) exists. Nodes are int
+    from range(n), the bit i of nodes is set if the node i exists
+    (del_node clears it, add_node sets it again).
+    Edge weights are not stored (weight 1).
+    Bitwise operations on rows work on whole neighbourhoods at once.
+
+    Examples
+    --------
+    >>> from graphtheory.structures.bitsetgraphs import BitsetGraph, iterbits
+    >>> G = BitsetGraph(n=4)
+    >>> G.add_edges_from([(0, 1), (0, 2), (1, 2), (2, 3)])
+    >>> list(iterbits(G.intersection([0, 1])))   # common neighbours
+    [2]
+    """
+
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
+    def __init__(self, *, n, directed=False):
+        """Load up a BitsetGraph instance.
+
+        Parameters
+        ----------
+        n : int (positive)
+        directed : bool, optional (default=False)
+        """
+        if n < 1:
+            raise ValueError("incorrect number of nodes")
+        self.n = n
+        self.directed = directed  # bool
+        self.rows = [0] * self.n
+        self.nodes = (1 << self.n) - 1   # the bitmask of live nodes
+        self.m = 0   # the number of edges
+
+    def is_directed(self):
+        """Test if the graph is directed."""
+        return self.directed
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return popcount(self.nodes)
+
+    def e(self):
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n^2/w) time (without the counter)."""
+        edges = sum(popcount(row) for row in self.rows)
+        return (edges if self.is_directed() else edges // 2)
+
+    def add_node(self, node):
+        """Add a node to the graph."""
+        if not isinstance(node, integer_types):
+            raise ValueError("node is not int or long")
+        if not (0 <= node < self.n):
+            raise ValueError("node out of range")
+        self.nodes |= 1 << node
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        if not isinstance(node, integer_types):
+            raise ValueError("node is not int or long")
+        return 0 <= node < self.n and (self.nodes >> node) & 1 == 1
+
+    def del_node(self, source):
+        """Remove a node from the graph with edges in O(n) time."""
+        bit = 1 << source
+        self.nodes &= ~bit
+        self.m -= popcount(self.rows[source])
+        self.rows[source] = 0
+        for target in range(self.n):
+            if self.rows[target] & bit:
+                self.rows[target] ^= bit
+                if self.is_directed():
+                    self.m -= 1
+
+    def add_edge(self, edge):
+        """Add an edge to the graph (the weight is ignored)."""
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
+        if source == target:
+            raise ValueError("loops are forbidden")
+        self.add_node(source)
+        self.add_node(target)
+        if (self.rows[source] >> target) & 1:
+            raise ValueError("parallel edges are forbidden")
+        self.rows[source] |= 1 << target
+        if not self.is_directed():
+            if (self.rows[target] >> source) & 1:
+                raise ValueError("parallel edges are forbidden")
+            self.rows[target] |= 1 << source
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (nodes from range(n), weights are ignored).
+
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        rows = self.rows
+        n = self.n
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    source, target = edge[0], edge[1]
+                else:
+                    source, target = edge.source, edge.target
+                if source == target:
+                    raise ValueError("loops are forbidden")
+                if not (isinstance(source, integer_types)
+                        and isinstance(target, integer_types)):
+                    raise ValueError("node is not int or long")
+                if not (0 <= source < n and 0 <= target < n):
+                    raise ValueError("node out of range")
+                self.nodes |= (1 << source) | (1 << target)
+                if (rows[source] >> target) & 1:
+                    raise ValueError("parallel edges are forbidden")
+                rows[source] |= 1 << target
+                if not directed:
+                    if (rows[target] >> source) & 1:
+                        raise ValueError("parallel edges are forbidden")
+                    rows[target] |= 1 << source
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=None, directed=False):
+        """Return a new graph with edges (see add_edges_from).
+
+        If n is not given, nodes are from range(max_node + 1).
+        """
+        if n is None:
+            edges = list(edges_from(edges))
+            n = 1 + max((max(edge[0], edge[1])
+                if isinstance(edge, (tuple, list))
+                else max(edge.source, edge.target) for edge in edges),
+                default=0)
+        new_graph = cls(n=n, directed=directed)
+        new_graph.add_edges_from(edges)
+        return new_graph
+
+    def del_edge(self, edge):
+        """Remove an edge from the graph."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        if (self.rows[source] >> target) & 1:
+            self.m -= 1
+        self.rows[source] &= ~(1 << target)
+        if not self.is_directed():
+            self.rows[target] &= ~(1 << source)
+
+    def has_edge(self, edge):
+        """Test if an edge exists in O(1) time (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return (self.rows[source] >> target) & 1 == 1
+
+    def weight(self, edge):
+        """Return the edge weight (1) or zero."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return (self.rows[source] >> target) & 1
+
+    def iternodes(self):
+        """Generate the nodes from the graph on demand."""
+        return iterbits(self.nodes)
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        return iterbits(self.rows[source])
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        for target in iterbits(self.rows[source]):
+            yield self.edge_class(source, target)
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        if self.is_directed():   # O(n) time
+            for target in range(self.n):
+                if (self.rows[target] >> source) & 1:
+                    yield self.edge_class(target, source)
+        else:
+            for target in iterbits(self.rows[source]):
+                yield self.edge_class(target, source)
+
+    def iteredges(self):
+        """Generate the edges from the graph on demand."""
+        for source in iterbits(self.nodes):
+            row = self.rows[source]
+            if not self.is_directed():
+                row >>= source + 1   # only targets greater than source
+                row <<= source + 1
+            for target in iterbits(row):
+                yield self.edge_class(source, target)
+
+    def show(self):
+        """The graph presentation."""
+        L = []
+        for source in iterbits(self.nodes):
+            L.append("{} : ".format(source))
+            for target in iterbits(self.rows[source]):
+                L.append("{} ".format(target))
+            L.append("\n")
+        print("".join(L))
+
+    def copy(self):
+        """Return the graph copy in O(n) time."""
+        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph.rows = list(self.rows)
+        new_graph.nodes = self.nodes
+        new_graph.m = self.m
+        return new_graph
+
+    def transpose(self):
+        """Return the transpose of the graph."""
+        new_graph = self.__class__(n=self.n, directed=self.directed)
+        for source in range(self.n):
+            bit = 1 << source
+            for target in iterbits(self.rows[source]):
+                new_graph.rows[target] |= bit
+        new_graph.nodes = self.nodes
+        new_graph.m = self.m
+        return new_graph
+
+    def complement(self):
+        """Return the complement of the graph in O(n) bitwise operations."""
+        new_graph = self.__class__(n=self.n, directed=self.directed)
+        full = self.nodes   # edges between live nodes
+        for source in iterbits(full):   # no loops
+            new_graph.rows[source] = full & ~self.rows[source] & ~(1 << source)
+        new_graph.nodes = full
+        k = popcount(full)
+        edges = k * (k - 1)
+        new_graph.m = (edges if self.is_directed() else edges // 2) - self.m
+        return new_graph
+
+    def subgraph(self, nodes):
+        """Return the induced subgraph in O(n) bitwise operations.
+
+        Nodes keep their numbers, other nodes are deleted (masked).
+        """
+        mask = 0
+        for node in nodes:
+            if not self.has_node(node):
+                raise ValueError("node not in the graph")
+            mask |= 1 << node
+        new_graph = self.__class__(n=self.n, directed=self.directed)
+        for source in iterbits(mask):
+            new_graph.rows[source] = self.rows[source] & mask
+        new_graph.nodes = mask
+        new_graph.m = new_graph.count_edges()
+        return new_graph
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        if self.is_directed():
+            raise ValueError("the graph is directed")
+        return popcount(self.rows[source])
+
+    def outdegree(self, source):
+        """Return the outdegree of the node (popcount)."""
+        return popcount(self.rows[source])
+
+    def indegree(self, source):
+        """Return the indegree of the node."""
+        if not self.is_directed():
+            return popcount(self.rows[source])
+        counter = 0
+        for target in range(self.n):
+            counter += (self.rows[target] >> source) & 1
+        return counter
+
+    def neighbors(self, source):
+        """Return the bitmask of the adjacent nodes (outneighbours)."""
+        return self.rows[source]
+
+    def intersection(self, nodes):
+        """Return the bitmask of nodes adjacent to all given nodes."""
+        mask = self.nodes
+        for node in nodes:
+            mask &= self.rows[node]
+        return mask
+
+    def union(self, nodes):
+        """Return the bitmask of nodes adjacent to some given nodes."""
+        mask = 0
+        for node in nodes:
+            mask |= self.rows[node]
+        return mask
+
+    def __eq__(self, other):
+        """Test if the graphs are equal."""
+        if self.is_directed() is not other.is_directed():
+            return False
+        if self.v() != other.v():
+            return False
+        if isinstance(other, BitsetGraph):
+            return self.nodes == other.nodes and self.rows == other.rows
+        if any(not other.has_node(node) for node in self.iternodes()):
+            return False
+        for source in self.iternodes():   # O(n^2) time
+            for target in self.iternodes():
+                if self.has_edge((source, target)) != other.has_edge(
+                        (source, target)):
+                    return False
+        return True
+
+    def __ne__(self, other):
+        """Test if the graphs are not equal."""
+        return not self == other
+
+    def add_graph(self, other):
+        """Add a graph to this graph (the current graph is modified)."""
+        if self.is_directed() is not other.is_directed():
+            raise ValueError("directed vs undirected")
+        if self.v() != other.v():
+            raise ValueError("different numbers of nodes")
+        for node in other.iternodes():
+            self.add_node(node)
+        for edge in other.iteredges():
+            self.add_edge(edge)
+
+# EOF
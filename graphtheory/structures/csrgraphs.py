@@ -0,0 +1,503 @@
+#!/usr/bin/env python3
+
+from array import array
+from bisect import bisect_left
+from graphtheory.structures.edges import Edge, edges_from
+from graphtheory.structures.basegraphs import BaseGraph
+from graphtheory.structures.graphs import Graph
+
+
+def _weight_array(weights):
+    """Return a compact buffer for edge weights (int or float)."""
+    if all(isinstance(weight, int) for weight in weights):
+        return array("q", weights)
+    else:
+        return array("d", weights)
+
+
+class CSRGraph(BaseGraph):
+    """The class defining a compact immutable graph (CSR format).
+
+    Nodes can be numbers, strings, or any hashable objects.
+    Nodes are mapped to dense int ids (the order of insertion).
+    Outedges of the node with id i are stored in
+    targets[offsets[i]:offsets[i+1]] and weights[offsets[i]:offsets[i+1]],
+    target ids are sorted in every row.
+    An undirected edge is stored twice (both directions).
+
+    The graph is built with add_node/add_edge (or from_graph) and
+    it is frozen before the first query. Later modifications are forbidden.
+    Buffers can be array.array or NumPy arrays (any sequences with indexing).
+    The optional planar embedding (edge_next, edge_prev) is kept as buffers
+    of positions, edge_next[k] is the position of the edge following
+    the edge at the position k.
+
+    Internal structure of an exemplary directed graph:
+    nodes = ["A", "B", "C", "D"]
+    node_id = {"A": 0, "B": 1, "C": 2, "D": 3}
+    offsets = array("q", [0, 2, 4, 5, 6])
+    targets = array("q", [1, 2, 2, 3, 3, 2])
+    weights = array("q", [1, 2, 3, 4, 5, 6])
+    """
+
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+
+    def __init__(self, *, n=0, directed=False):
+        """Load up a CSRGraph instance.
+
+        Parameters
+        ----------
+        n : int (positive; not used, for compatibility only)
+        directed : bool, optional (default=False)
+        """
+        self.n = n
+        self.directed = directed
+        self.nodes = []          # id to node
+        self.node_id = dict()    # node to id
+        self.offsets = None
+        self.targets = None
+        self.weights = None
+        # Edges are collected here before freezing.
+        self._staged = dict()
+        # Inverse index (directed graphs), calculated on demand.
+        self._in_offsets = None
+        self._in_sources = None
+        self._in_positions = None
+        # Planar embedding (positions in buffers), optional.
+        self.edge_next = None
+        self.edge_prev = None
+
+    @classmethod
+    def from_arrays(cls, nodes, offsets, targets, weights, directed=False):
+        """Return a frozen graph using given buffers (not copied)."""
+        if len(offsets) != len(nodes) + 1:
+            raise ValueError("offsets and nodes do not match")
+        if len(targets) != len(weights):
+            raise ValueError("targets and weights do not match")
+        new_graph = cls(n=len(nodes), directed=directed)
+        new_graph.nodes = list(nodes)
+        new_graph.node_id = dict((node, i) for i, node in enumerate(nodes))
+        new_graph.offsets = offsets
+        new_graph.targets = targets
+        new_graph.weights = weights
+        new_graph._staged = None
+        return new_graph
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Return a frozen copy of any graph in O(n+m log m) time."""
+        nodes = list(graph.iternodes())
+        node_id = dict((node, i) for i, node in enumerate(nodes))
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = []
+        embedding = getattr(graph, "edge_next", None)
+        arcs = []   # edges in the buffer order (for the planar embedding)
+        for node in nodes:
+            row = sorted(graph.iteroutedges(node),
+                key=lambda edge: node_id[edge.target])
+            for edge in row:
+                targets.append(node_id[edge.target])
+                weights.append(edge.weight)
+            if embedding:
+                arcs.extend(row)
+            offsets.append(len(targets))
+        new_graph = cls.from_arrays(nodes, offsets, targets,
+            _weight_array(weights), graph.is_directed())
+        if embedding:
+            position = dict((edge, k) for k, edge in enumerate(arcs))
+            new_graph.edge_next = array("q",
+                (position[graph.edge_next[edge]] for edge in arcs))
+            if graph.edge_prev:
+                new_graph.edge_prev = array("q",
+                    (position[graph.edge_prev[edge]] for edge in arcs))
+        return new_graph
+
+    def to_graph(self, graph_class=None):
+        """Return a mutable copy (the default class is graphs.Graph)."""
+        self.freeze()
+        if graph_class is None:
+            graph_class = Graph
+        new_graph = graph_class(n=self.v(), directed=self.directed)
+        nodes, offsets = self.nodes, self.offsets
+        targets, weights = self.targets, self.weights
+        if issubclass(graph_class, Graph):   # filling dicts directly
+            arcs = []   # edges in the buffer order (for the planar embedding)
+            for i, source in enumerate(nodes):
+                lo, hi = offsets[i], offsets[i+1]
+                row = [new_graph.edge_class(source, nodes[target], weight)
+                    for target, weight in zip(targets[lo:hi], weights[lo:hi])]
+                new_graph[source] = dict((edge.target, edge) for edge in row)
+                if self.edge_next is not None:
+                    arcs.extend(row)
+            new_graph.m = self.e()
+            if self.edge_next is not None:
+                new_graph.edge_next = dict((arcs[k], arcs[j])
+                    for k, j in enumerate(self.edge_next))
+            if self.edge_prev is not None:
+                new_graph.edge_prev = dict((arcs[k], arcs[j])
+                    for k, j in enumerate(self.edge_prev))
+            return new_graph
+        for node in nodes:
+            new_graph.add_node(node)
+        for edge in self.iteredges():
+            new_graph.add_edge(edge)
+        return new_graph
+
+    def freeze(self):
+        """Build CSR buffers from collected edges in O(n+m log m) time."""
+        if self._staged is None:   # already frozen
+            return
+        node_id = self.node_id
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = []
+        for node in self.nodes:
+            row = sorted((node_id[target], weight)
+                for (target, weight) in self._staged[node].items())
+            for target, weight in row:
+                targets.append(target)
+                weights.append(weight)
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = _weight_array(weights)
+        self._staged = None
+
+    def is_frozen(self):
+        """Test if the graph is frozen."""
+        return self._staged is None
+
+    def is_directed(self):
+        """Test if the graph is directed."""
+        return self.directed
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return len(self.nodes)
+
+    def e(self):
+        """Return the number of edges in O(1) time."""
+        self.freeze()
+        edges = len(self.targets)
+        return (edges if self.is_directed() else edges // 2)
+
+    def add_node(self, node):
+        """Add a node to the graph (before freezing)."""
+        if node in self.node_id:
+            return
+        if self._staged is None:
+            raise ValueError("the graph is frozen")
+        self.node_id[node] = len(self.nodes)
+        self.nodes.append(node)
+        self._staged[node] = dict()
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        return node in self.node_id
+
+    def del_node(self, node):
+        """Remove a node from the graph (before freezing)."""
+        if self._staged is None:
+            raise ValueError("the graph is frozen")
+        for source in self._staged:
+            self._staged[source].pop(node, None)
+        del self._staged[node]
+        self.nodes.remove(node)
+        self.node_id = dict((node, i) for i, node in enumerate(self.nodes))
+
+    def add_edge(self, edge):
+        """Add an edge to the graph (before freezing)."""
+        if self._staged is None:
+            raise ValueError("the graph is frozen")
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+            edge = self.edge_class(source, target)
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
+                edge = self.edge_class(source, target)
+        if source == target:
+            raise ValueError("loops are forbidden")
+        self.add_node(source)
+        self.add_node(target)
+        if target not in self._staged[source]:
+            self._staged[source][target] = edge.weight
+        else:
+            raise ValueError("parallel edges are forbidden")
+        if not self.is_directed():
+            if source not in self._staged[target]:
+                self._staged[target][source] = edge.weight
+            else:
+                raise ValueError("parallel edges are forbidden")
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (before freezing).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        if self._staged is None:
+            raise ValueError("the graph is frozen")
+        staged = self._staged
+        directed = self.directed
+        for edge in edges_from(edges):
+            if isinstance(edge, (tuple, list)):
+                if len(edge) == 2:
+                    (source, target), weight = edge, 1
+                else:
+                    source, target, weight = edge
+            else:
+                source, target = edge.source, edge.target
+                weight = edge.weight
+            if source == target:
+                raise ValueError("loops are forbidden")
+            if source not in staged:
+                self.add_node(source)
+            if target not in staged:
+                self.add_node(target)
+            row = staged[source]
+            if target in row:
+                raise ValueError("parallel edges are forbidden")
+            row[target] = weight
+            if not directed:
+                row = staged[target]
+                if source in row:
+                    raise ValueError("parallel edges are forbidden")
+                row[source] = weight
+
+    @classmethod
+    def from_edge_list(cls, edges, n=0, directed=False):
+        """Return a frozen graph with edges (see add_edges_from)."""
+        new_graph = cls(n=n, directed=directed)
+        new_graph.add_edges_from(edges)
+        new_graph.freeze()
+        return new_graph
+
+    def del_edge(self, edge):
+        """Remove an edge from the graph (before freezing)."""
+        if self._staged is None:
+            raise ValueError("the graph is frozen")
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        del self._staged[source][target]
+        if not self.is_directed():
+            del self._staged[target][source]
+
+    def _find(self, source, target):
+        """Return the position of the edge in buffers or -1, O(log n) time."""
+        self.freeze()
+        if source not in self.node_id or target not in self.node_id:
+            return -1
+        i, j = self.node_id[source], self.node_id[target]
+        hi = self.offsets[i+1]
+        k = bisect_left(self.targets, j, self.offsets[i], hi)
+        if k < hi and self.targets[k] == j:
+            return k
+        return -1
+
+    def has_edge(self, edge):
+        """Test if an edge exists (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return self._find(source, target) >= 0
+
+    def weight(self, edge):
+        """Return the edge weight or zero."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        k = self._find(source, target)
+        return (self.weights[k] if k >= 0 else 0)
+
+    def iternodes(self):
+        """Generate the nodes from the graph on demand."""
+        return iter(self.nodes)
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        self.freeze()
+        i = self.node_id[source]
+        nodes = self.nodes
+        for target in self.targets[self.offsets[i]:self.offsets[i+1]]:
+            yield nodes[target]
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        self.freeze()
+        i = self.node_id[source]
+        lo, hi = self.offsets[i], self.offsets[i+1]
+        nodes = self.nodes
+        for target, weight in zip(self.targets[lo:hi], self.weights[lo:hi]):
+            yield self.edge_class(source, nodes[target], weight)
+
+    def _build_inverse(self):
+        """Build the inverse index (counting sort) in O(n+m) time."""
+        n = len(self.nodes)
+        in_offsets = array("q", [0]) * (n + 1)
+        for target in self.targets:
+            in_offsets[target + 1] += 1
+        for i in range(n):
+            in_offsets[i + 1] += in_offsets[i]
+        free = array("q", in_offsets)   # next free slot for every node
+        in_sources = array("q", [0]) * len(self.targets)
+        in_positions = array("q", [0]) * len(self.targets)
+        for source in range(n):
+            for k in range(self.offsets[source], self.offsets[source+1]):
+                target = self.targets[k]
+                in_sources[free[target]] = source
+                in_positions[free[target]] = k
+                free[target] += 1
+        self._in_offsets = in_offsets
+        self._in_sources = in_sources
+        self._in_positions = in_positions
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        self.freeze()
+        i = self.node_id[source]
+        nodes = self.nodes
+        if self.is_directed():   # O(indegree) time
+            if self._in_offsets is None:
+                self._build_inverse()
+            for k in range(self._in_offsets[i], self._in_offsets[i+1]):
+                yield self.edge_class(nodes[self._in_sources[k]], source,
+                    self.weights[self._in_positions[k]])
+        else:
+            lo, hi = self.offsets[i], self.offsets[i+1]
+            for target, weight in zip(self.targets[lo:hi], self.weights[lo:hi]):
+                yield self.edge_class(nodes[target], source, weight)
+
+    def iteredges(self):
+        """Generate the edges from the graph on demand."""
+        self.freeze()
+        nodes, offsets = self.nodes, self.offsets
+        targets, weights = self.targets, self.weights
+        for i, source in enumerate(nodes):
+            for k in range(offsets[i], offsets[i+1]):
+                if self.is_directed() or i < targets[k]:
+                    yield self.edge_class(source, nodes[targets[k]], weights[k])
+
+    def show(self):
+        """The graph presentation."""
+        L = []
+        for source in self.iternodes():
+            L.append("{} : ".format(source))
+            for edge in self.iteroutedges(source):
+                if edge.weight == 1:
+                    L.append("{} ".format(edge.target))
+                else:
+                    L.append("{}({}) ".format(edge.target, edge.weight))
+            L.append("\n")
+        print("".join(L))
+
+    def copy(self):
+        """Return the graph copy (buffers are shared)."""
+        self.freeze()
+        new_graph = self.from_arrays(self.nodes, self.offsets, self.targets,
+            self.weights, self.directed)
+        new_graph.edge_next = self.edge_next
+        new_graph.edge_prev = self.edge_prev
+        return new_graph
+
+    def transpose(self):
+        """Return the transpose of the graph in O(n+m) time."""
+        if not self.is_directed():
+            return self.copy()
+        self.freeze()
+        if self._in_offsets is None:
+            self._build_inverse()
+        weights = _weight_array([self.weights[k] for k in self._in_positions])
+        return self.from_arrays(self.nodes, self._in_offsets,
+            self._in_sources, weights, self.directed)
+
+    def complement(self):
+        """Return the complement of the graph in O(n^2) time."""
+        self.freeze()
+        new_graph = self.__class__(n=self.n, directed=self.directed)
+        for node in self.iternodes():
+            new_graph.add_node(node)
+        for i, source in enumerate(self.nodes):
+            adjacent = set(self.targets[self.offsets[i]:self.offsets[i+1]])
+            for j, target in enumerate(self.nodes):
+                if i == j or j in adjacent:   # no loops
+                    continue
+                if self.is_directed() or i < j:
+                    new_graph.add_edge(self.edge_class(source, target))
+        new_graph.freeze()
+        return new_graph
+
+    def subgraph(self, nodes):
+        """Return the induced subgraph."""
+        node_set = set(nodes)
+        if any(not self.has_node(node) for node in node_set):
+            raise ValueError("nodes not from the graph")
+        new_graph = self.__class__(n=len(node_set), directed=self.directed)
+        for node in self.iternodes():
+            if node in node_set:
+                new_graph.add_node(node)
+        for edge in self.iteredges():
+            if (edge.source in node_set) and (edge.target in node_set):
+                new_graph.add_edge(edge)
+        new_graph.freeze()
+        return new_graph
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        if self.is_directed():
+            raise ValueError("the graph is directed")
+        return self.outdegree(source)
+
+    def outdegree(self, source):
+        """Return the outdegree of the node in O(1) time."""
+        self.freeze()
+        i = self.node_id[source]
+        return self.offsets[i+1] - self.offsets[i]
+
+    def indegree(self, source):
+        """Return the indegree of the node in O(1) time."""
+        if not self.is_directed():
+            return self.outdegree(source)
+        self.freeze()
+        if self._in_offsets is None:
+            self._build_inverse()
+        i = self.node_id[source]
+        return self._in_offsets[i+1] - self._in_offsets[i]
+
+    def __eq__(self, other):
+        """Test if the graphs are equal."""
+        if self.is_directed() is not other.is_directed():
+            return False
+        if set(self.iternodes()) != set(other.iternodes()):   # checking nodes
+            return False
+        for node in self.iternodes():   # comparing neighbors
+            if (dict((edge.target, edge.weight)
+                    for edge in self.iteroutedges(node)) !=
+                dict((edge.target, edge.weight)
+                    for edge in other.iteroutedges(node))):
+                return False
+        return True
+
+    def __ne__(self, other):
+        """Test if the graphs are not equal."""
+        return not self == other
+
+    def add_graph(self, other):
+        """Add a graph to this graph (before freezing)."""
+        if self.is_directed() is not other.is_directed():
+            raise ValueError("directed vs undirected")
+        for node in other.iternodes():
+            self.add_node(node)
+        for edge in other.iteredges():
+            self.add_edge(edge)
+
+# EOF
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import random
-from graphtheory.structures.edges import Edge
+from graphtheory.structures.edges import Edge, edges_from
 from graphtheory.structures.basegraphs import BaseGraph
 
 
@@ -19,18 +19,28 @@ class Graph(dict):
     "D": {"C": 6}, 
     "E": {"C": 7}, 
     "F": {}}
+    
+    An optional inverse structure for directed graphs (inedges):
+    {"A": {}, "B": {"A": 1, "D": 6}, "C": {"A": 2, "D": 6, "E": 7}, ...}
     """
 
-    def __init__(self, *, n=0, directed=False):
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
+    def __init__(self, *, n=0, directed=False, inverse=False):
         """Load up a Graph instance.
         
         Parameters
         ----------
         n : int (positive; not used, for compatibility only)
         directed : bool, optional (default=False)
+        inverse : bool, optional (default=False),
+            maintain inedges of a directed graph (faster iterinedges)
         """
         self.n = n
         self.directed = directed
+        self.inverse = (dict() if (directed and inverse) else None)
+        self.m = 0   # the number of edges
 
     def is_directed(self):
         """Test if the graph is directed."""
@@ -41,7 +51,13 @@ class Graph(dict):
         return len(self)
 
     def e(self):
-        """Return the number of edges in O(n) time."""
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n) time (without the counter)."""
         edges = sum(len(self[node]) for node in self)
         return (edges if self.is_directed() else edges // 2)
 
@@ -49,6 +65,8 @@ class Graph(dict):
         """Add a node to the graph."""
         if node not in self:
             self[node] = dict()
+            if self.inverse is not None:
+                self.inverse[node] = dict()
 
     def has_node(self, node):
         """Test if a node exists."""
@@ -63,20 +81,28 @@ class Graph(dict):
             for edge in list(self.iteroutedges(node)):
                 self.del_edge(edge)
         del self[node]
+        if self.inverse is not None:
+            del self.inverse[node]
 
     def add_edge(self, edge):
         """Add an edge to the graph (missing nodes are created)."""
-        try:   # checking Edge interface
-            source, target = edge.source, edge.target
-        except AttributeError:
-            source, target = edge   # tuple or list
-            edge = Edge(source, target)
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+            edge = self.edge_class(source, target)
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
+                edge = self.edge_class(source, target)
         if source == target:
             raise ValueError("loops are forbidden")
         self.add_node(source)
         self.add_node(target)
         if target not in self[source]:
             self[source][target] = edge.weight
+            if self.inverse is not None:
+                self.inverse[target][source] = edge.weight
         else:
             raise ValueError("parallel edges are forbidden")
         if not self.is_directed():
@@ -84,6 +110,56 @@ class Graph(dict):
                 self[target][source] = edge.weight
             else:
                 raise ValueError("parallel edges are forbidden")
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (missing nodes are created).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        inverse = self.inverse
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    if len(edge) == 2:
+                        (source, target), weight = edge, 1
+                    else:
+                        source, target, weight = edge
+                else:
+                    source, target = edge.source, edge.target
+                    weight = edge.weight
+                if source == target:
+                    raise ValueError("loops are forbidden")
+                if source not in self:
+                    self.add_node(source)
+                if target not in self:
+                    self.add_node(target)
+                row = self[source]
+                if target in row:
+                    raise ValueError("parallel edges are forbidden")
+                row[target] = weight
+                if inverse is not None:
+                    inverse[target][source] = weight
+                if not directed:
+                    row = self[target]
+                    if source in row:
+                        raise ValueError("parallel edges are forbidden")
+                    row[source] = weight
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=0, directed=False, **kwargs):
+        """Return a new graph with edges (see add_edges_from)."""
+        new_graph = cls(n=n, directed=directed, **kwargs)
+        new_graph.add_edges_from(edges)
+        return new_graph
 
     def del_edge(self, edge):
         """Remove an edge from the graph."""
@@ -92,8 +168,11 @@ class Graph(dict):
         except AttributeError:
             source, target = edge   # tuple or list
         del self[source][target]
+        if self.inverse is not None:
+            del self.inverse[target][source]
         if not self.is_directed():
             del self[target][source]
+        self.m -= 1
 
     def has_edge(self, edge):
         """Test if an edge exists (the weight is not checked)."""
@@ -125,24 +204,28 @@ class Graph(dict):
     def iteroutedges(self, source):
         """Generate the outedges from the graph on demand."""
         for target in self[source]:
-            yield Edge(source, target, self[source][target])
+            yield self.edge_class(source, target, self[source][target])
 
     def iterinedges(self, source):
         """Generate the inedges from the graph on demand."""
-        if self.is_directed():   # O(n) time
+        if self.inverse is not None:   # O(indegree) time
+            for target in self.inverse[source]:
+                yield self.edge_class(
+                    target, source, self.inverse[source][target])
+        elif self.is_directed():   # O(n) time
             for target in self.iternodes():
                 if source in self[target]:
-                    yield Edge(target, source, self[target][source])
+                    yield self.edge_class(target, source, self[target][source])
         else:
             for target in self[source]:
-                yield Edge(target, source, self[target][source])
+                yield self.edge_class(target, source, self[target][source])
 
     def iteredges(self):
         """Generate the edges from the graph on demand."""
         for source in self.iternodes():
             for target in self[source]:
                 if self.is_directed() or source < target:
-                    yield Edge(source, target, self[source][target])
+                    yield self.edge_class(source, target, self[source][target])
 
     def show(self):
         """The graph presentation."""
@@ -159,14 +242,20 @@ class Graph(dict):
 
     def copy(self):
         """Return the graph copy."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
         for node in self.iternodes():
             new_graph[node] = dict(self[node])
+        new_graph.m = self.m
+        if self.inverse is not None:
+            for node in self.iternodes():
+                new_graph.inverse[node] = dict(self.inverse[node])
         return new_graph
 
     def transpose(self):
         """Return the transpose of the graph."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
         for node in self.iternodes():
             new_graph.add_node(node)
         for edge in self.iteredges():
@@ -181,7 +270,7 @@ class Graph(dict):
         for source in self.iternodes():
             for target in self.iternodes():
                 if source != target:
-                    edge = Edge(source, target)
+                    edge = self.edge_class(source, target)
                     if not self.has_edge(edge) and not new_graph.has_edge(edge):
                         new_graph.add_edge(edge)
         return new_graph
@@ -211,7 +300,9 @@ class Graph(dict):
 
     def indegree(self, source):
         """Return the indegree of the node."""
-        if self.is_directed():   # O(n) time
+        if self.inverse is not None:   # O(1) time
+            return len(self.inverse[source])
+        elif self.is_directed():   # O(n) time
             counter = 0
             for target in self.iternodes():
                 if source in self[target]:
@@ -73,4 +73,179 @@ class Edge:
 
     inverted = __invert__
 
+
+class SlottedEdge:
+    """The class defining a lightweight directed edge (no __dict__).
+    
+    The interface is the same as for the Edge class.
+    Comparisons are written by hand (no tuples are created).
+    
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import SlottedEdge
+    >>> edge = SlottedEdge(1, 2, 5)
+    >>> ~edge
+    SlottedEdge(2, 1, 5)
+    """
+
+    __slots__ = ("source", "target", "weight")
+
+    def __init__(self, source, target, weight=1):
+        """Load up a directed edge instance.
+        
+        Parameters
+        ----------
+        source : starting node
+        target : ending node
+        weight : number, optional (default=1)
+        """
+        self.source = source
+        self.target = target
+        self.weight = weight
+
+    def __repr__(self):
+        """Compute the string representation of the edge."""
+        if self.weight == 1:
+            return "{0}({1!r}, {2!r})".format(
+                self.__class__.__name__, self.source, self.target)
+        else:
+            return "{0}({1!r}, {2!r}, {3!r})".format(
+                self.__class__.__name__, self.source, self.target, self.weight)
+
+    def __reduce__(self):
+        """Support for pickle and copy."""
+        return (self.__class__, (self.source, self.target, self.weight))
+
+    def __eq__(self, other):
+        """Comparing of edges (the weight first)."""
+        return (self.source == other.source and self.target == other.target
+            and self.weight == other.weight)
+
+    def __ne__(self, other):
+        """Comparing of edges (the weight first)."""
+        return not self == other
+
+    def __lt__(self, other):
+        """Comparing of edges (the weight first)."""
+        if self.weight != other.weight:
+            return self.weight < other.weight
+        if self.source != other.source:
+            return self.source < other.source
+        return self.target < other.target
+
+    def __le__(self, other):
+        """Comparing of edges (the weight first)."""
+        return not other < self
+
+    def __gt__(self, other):
+        """Comparing of edges (the weight first)."""
+        return other < self
+
+    def __ge__(self, other):
+        """Comparing of edges (the weight first)."""
+        return not self < other
+
+    def __hash__(self):
+        """Hashable edges (the same hash as for Edge)."""
+        return hash((self.source, self.target, self.weight))
+
+    def __invert__(self):
+        """Return the edge with the opposite direction."""
+        return self.__class__(self.target, self.source, self.weight)
+
+    inverted = __invert__
+
+
+# Slot descriptors of SlottedEdge, FrozenEdge writes fields through them
+# (no Python-level __setattr__ calls in __init__).
+_set_source = SlottedEdge.source.__set__
+_set_target = SlottedEdge.target.__set__
+_set_weight = SlottedEdge.weight.__set__
+
+
+class FrozenEdge(SlottedEdge):
+    """The class defining an immutable directed edge with a cached hash.
+    
+    Attributes can not be changed after creation (AttributeError).
+    The hash is computed on the first hash() call and cached.
+    
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import FrozenEdge
+    >>> edge = FrozenEdge(1, 2, 5)
+    >>> edge.weight = 7   # AttributeError
+    """
+
+    __slots__ = ("_hash",)
+
+    def __init__(self, source, target, weight=1):
+        """Load up an immutable directed edge instance.
+        
+        Parameters
+        ----------
+        source : starting node
+        target : ending node
+        weight : number, optional (default=1)
+        """
+        _set_source(self, source)
+        _set_target(self, target)
+        _set_weight(self, weight)
+
+    def __setattr__(self, name, value):
+        """Immutable edges."""
+        raise AttributeError("the edge is immutable")
+
+    def __delattr__(self, name):
+        """Immutable edges."""
+        raise AttributeError("the edge is immutable")
+
+    def __eq__(self, other):
+        """Comparing of edges (the weight first)."""
+        if self is other:
+            return True
+        return (self.source == other.source and self.target == other.target
+            and self.weight == other.weight)
+
+    def __hash__(self):
+        """Hashable edges (computed once, the same hash as for Edge)."""
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.source, self.target, self.weight))
+            _set_hash(self, value)
+            return value
+
+
+_set_hash = FrozenEdge._hash.__set__
+
+
+def edges_from(edges):
+    """Return an iterable of edges for bulk loading.
+    
+    Parameters
+    ----------
+    edges : iterable of edges (Edge interface), tuples (source, target)
+        or (source, target, weight), or a NumPy array of shape (m, 2)
+        or (m, 3) (nodes in the first two columns)
+    
+    Returns
+    -------
+    iterable of edges and tuples (NumPy arrays are converted to tuples
+    with Python numbers in O(m) time, float node columns must be integral)
+    """
+    if getattr(edges, "ndim", None) is None:   # not a NumPy array
+        return edges
+    if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+        raise ValueError("an array of shape (m, 2) or (m, 3) expected")
+    nodes = edges[:, :2]
+    if nodes.dtype.kind == "f":   # float weights in the same array
+        nodes = nodes.astype("int64")
+        if (nodes != edges[:, :2]).any():
+            raise ValueError("nodes are not integers")
+    sources = nodes[:, 0].tolist()
+    targets = nodes[:, 1].tolist()
+    if edges.shape[1] == 2:
+        return zip(sources, targets)
+    return zip(sources, targets, edges[:, 2].tolist())
+
 # EOF
@@ -6,9 +6,74 @@ try:
 except NameError:   # Python 3
     integer_types = (int,)
 
+import math
 import random
 from graphtheory.structures.edges import Edge
 
+try:
+    import numpy
+except ImportError:   # generators use the random module
+    numpy = None
+
+
+def _make_rng(seed=None):
+    """Return a random generator (NumPy if available) for the seed."""
+    if numpy is not None:
+        return numpy.random.default_rng(seed)
+    return (random if seed is None else random.Random(seed))
+
+
+def _sample_cells(rng, total, probability):
+    """Return sorted cells from range(total), each cell is chosen
+    with the probability. Batagelj-Brandes geometric skipping,
+    O(1 + chosen cells) time, gaps are sampled in NumPy batches.
+    """
+    if total <= 0 or probability <= 0:
+        return (numpy.zeros(0, dtype=numpy.int64) if numpy else [])
+    if probability >= 1:
+        return (numpy.arange(total) if numpy else range(total))
+    if numpy is not None:
+        chunks = []
+        position = -1
+        batch = int(total * probability * 1.05) + 64
+        while True:
+            cells = position + numpy.cumsum(rng.geometric(probability, batch))
+            chunks.append(cells[cells < total])
+            if cells[-1] >= total:
+                break
+            position = cells[-1]
+        return numpy.concatenate(chunks)
+    log_q = math.log(1.0 - probability)
+    cells = []
+    position = -1
+    while True:
+        position += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if position >= total:
+            break
+        cells.append(position)
+    return cells
+
+
+def _cells_to_pairs(cells):
+    """Map cells k to pairs (v, w), w < v, k = v*(v-1)/2 + w."""
+    if numpy is not None:
+        cells = numpy.asarray(cells, dtype=numpy.int64)
+        v = ((1 + numpy.sqrt(1 + 8 * cells.astype(numpy.float64))) // 2)
+        v = v.astype(numpy.int64)
+        v -= (v * (v-1) // 2 > cells)   # rounding errors
+        v += ((v + 1) * v // 2 <= cells)
+        return v, cells - v * (v-1) // 2
+    sources, targets = [], []
+    for k in cells:
+        v = int((1 + math.sqrt(1 + 8 * k)) // 2)   # no isqrt in Python 3.7
+        while v * (v-1) // 2 > k:   # rounding errors
+            v -= 1
+        while (v + 1) * v // 2 <= k:
+            v += 1
+        sources.append(v)
+        targets.append(k - v * (v-1) // 2)
+    return sources, targets
+
 
 class GraphFactory:
     """The class for graph generators."""
@@ -16,6 +81,22 @@ class GraphFactory:
     def __init__(self, graph_class):
         """Get a graph class."""
         self.cls = graph_class
+        self.edge_class = getattr(graph_class, "edge_class", Edge)
+
+    def make_from_edges(self, edges, n=None, directed=False):
+        """Create a graph from edges in one pass (bulk loading).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        n : int, optional (required for matrixgraphs if nodes are
+            not from range(max_node + 1))
+        directed : bool, optional (default=False)
+        """
+        if n is None:
+            return self.cls.from_edge_list(edges, directed=directed)
+        return self.cls.from_edge_list(edges, n=n, directed=directed)
 
     def make_complete(self, n=1, directed=False):
         """Create a weighted complete graph."""
@@ -24,12 +105,14 @@ class GraphFactory:
         random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
+        edges = []
         for source in range(n):
             for target in range(source + 1, n):   # no loops
                 if random.random() > 0.5:   # random direction
-                    graph.add_edge(Edge(source, target, weights.pop()))
+                    edges.append((source, target, weights.pop()))
                 else:
-                    graph.add_edge(Edge(target, source, weights.pop()))
+                    edges.append((target, source, weights.pop()))
+        graph.add_edges_from(edges)
         return graph
 
     def make_path(self, n=1, directed=False):
@@ -39,8 +122,7 @@ class GraphFactory:
         random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        for i in range(n-1):
-            graph.add_edge(Edge(i, i+1, weights.pop()))
+        graph.add_edges_from((i, i+1, weights.pop()) for i in range(n-1))
         return graph
 
     def make_cyclic(self, n=1, directed=False):
@@ -52,26 +134,23 @@ class GraphFactory:
         random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        for i in range(n):
-            graph.add_edge(Edge(i, (i+1) % n, weights.pop()))
+        graph.add_edges_from((i, (i+1) % n, weights.pop()) for i in range(n))
         return graph
 
-    def make_sparse(self, n=1, directed=False, m=0):
-        """Create a weighted sparse graph."""
+    def make_sparse(self, n=1, directed=False, m=0, seed=None):
+        """Create a weighted sparse graph with m edges in O(n + m) time."""
         if m >= n*(n-1) // 2:
             raise ValueError("too mamy edges")
         graph = self.cls(n=n, directed=directed)
-        weights = list(range(1, 1 + m))   # different weights
-        random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        nodes = list(range(n))
-        n_edges = 0
-        while n_edges < m:
-            source, target = random.sample(nodes, 2)
-            if not graph.has_edge(Edge(source, target)):
-                graph.add_edge(Edge(source, target, weights.pop()))
-                n_edges += 1
+        rng = _make_rng(seed)
+        if numpy is not None:
+            cells = rng.choice(n * (n-1) // 2, size=m, replace=False)
+        else:
+            cells = rng.sample(range(n * (n-1) // 2), m)
+        sources, targets = _cells_to_pairs(cells)
+        self._add_random_edges(graph, sources, targets, rng)
         return graph
 
     def make_tree(self, n=1, directed=False):
@@ -85,7 +164,7 @@ class GraphFactory:
         for node in range(1, n):
             parent = random.sample(nodes, 1)[0]
             nodes.append(node)
-            graph.add_edge(Edge(parent, node, weights.pop()))
+            graph.add_edge(self.edge_class(parent, node, weights.pop()))
         return graph
 
     def make_connected(self, n=1, directed=False, m=0):
@@ -102,48 +181,156 @@ class GraphFactory:
         for node in range(1, n):
             parent = random.sample(nodes, 1)[0]
             nodes.append(node)
-            graph.add_edge(Edge(parent, node, weights.pop()))
+            graph.add_edge(self.edge_class(parent, node, weights.pop()))
         # the rest of edges
         n_edges = n - 1
         while n_edges < m:
             source, target = random.sample(nodes, 2)
-            if not graph.has_edge(Edge(source, target)):
-                graph.add_edge(Edge(source, target, weights.pop()))
+            if not graph.has_edge((source, target)):
+                graph.add_edge(self.edge_class(source, target, weights.pop()))
                 n_edges += 1
         return graph
 
-    def make_random(self, n=1, directed=False, edge_probability=0.5):
-        """Create a weighted random graph."""
+    def make_random(self, n=1, directed=False, edge_probability=0.5,
+                    seed=None):
+        """Create a weighted random graph G(n, p) in O(n + m) time.
+        
+        Batagelj and Brandes, Efficient generation of large random
+        networks, Phys. Rev. E 71, 036113 (2005).
+        """
         graph = self.cls(n=n, directed=directed)
-        weights = list(range(1, 1 + n * (n-1) // 2))   # different weights
-        random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        for source in range(n):
-            for target in range(source + 1, n):   # no loops
-                if random.random() > edge_probability:
-                    continue
-                if random.random() > 0.5:   # random direction
-                    graph.add_edge(Edge(source, target, weights.pop()))
-                else:
-                    graph.add_edge(Edge(target, source, weights.pop()))
+        rng = _make_rng(seed)
+        cells = _sample_cells(rng, n * (n-1) // 2, edge_probability)
+        sources, targets = _cells_to_pairs(cells)
+        self._add_random_edges(graph, sources, targets, rng)
         return graph
 
-    def make_bipartite(self, n1=1, n2=1, directed=False, edge_probability=0.5):
-        """Create a weighted random bipartite graph."""
+    def make_bipartite(self, n1=1, n2=1, directed=False, edge_probability=0.5,
+                       seed=None):
+        """Create a weighted random bipartite graph in O(n + m) time."""
         graph = self.cls(n=(n1 + n2), directed=directed)
-        weights = list(range(1, n1 * n2 + 1))   # different weights
-        random.shuffle(weights)
         for node in range(n1 + n2):
             graph.add_node(node)
-        for source in range(n1):
-            for target in range(n1, n1 + n2):   # no loops
-                if random.random() > edge_probability:
+        rng = _make_rng(seed)
+        cells = _sample_cells(rng, n1 * n2, edge_probability)
+        if numpy is not None:
+            sources, targets = cells // n2, n1 + cells % n2
+        else:
+            sources = [k // n2 for k in cells]
+            targets = [n1 + k % n2 for k in cells]
+        self._add_random_edges(graph, sources, targets, rng)
+        return graph
+
+    def _add_random_edges(self, graph, sources, targets, rng,
+                          random_direction=True):
+        """Add edges with different weights from 1 to m (bulk loading)."""
+        if numpy is not None:
+            sources = numpy.asarray(sources, dtype=numpy.int64)
+            targets = numpy.asarray(targets, dtype=numpy.int64)
+            if random_direction:
+                swap = rng.random(len(sources)) < 0.5
+                sources, targets = (numpy.where(swap, targets, sources),
+                    numpy.where(swap, sources, targets))
+            weights = rng.permutation(len(sources)) + 1
+            graph.add_edges_from(numpy.column_stack((sources, targets, weights)))
+            return
+        weights = list(range(1, 1 + len(sources)))   # different weights
+        rng.shuffle(weights)
+        edges = []
+        for source, target, weight in zip(sources, targets, weights):
+            if random_direction and rng.random() < 0.5:
+                source, target = target, source
+            edges.append((source, target, weight))
+        graph.add_edges_from(edges)
+
+    def make_barabasi_albert(self, n=1, m=1, directed=False, seed=None):
+        """Create a weighted Barabasi-Albert graph (preferential attachment).
+        
+        Every new node is joined to m different older nodes, chosen with
+        probability proportional to their degrees. Edges go from new nodes
+        to old nodes. |E| = m * (n-m).
+        """
+        if m < 1 or m >= n:
+            raise ValueError("bad number of edges per node")
+        graph = self.cls(n=n, directed=directed)
+        for node in range(n):
+            graph.add_node(node)
+        rng = (random if seed is None else random.Random(seed))
+        edges = []
+        repeated = []   # nodes repeated as many times as their degree
+        targets = list(range(m))   # the first node is joined to 0..m-1
+        for source in range(m, n):
+            for target in targets:
+                edges.append((source, target))
+            repeated.extend(targets)
+            repeated.extend([source] * m)
+            chosen = set()
+            while len(chosen) < m:
+                chosen.add(rng.choice(repeated))
+            targets = list(chosen)
+        weights = list(range(1, 1 + len(edges)))   # different weights
+        rng.shuffle(weights)
+        graph.add_edges_from((source, target, weight)
+            for ((source, target), weight) in zip(edges, weights))
+        return graph
+
+    def make_rmat(self, scale=10, edge_factor=16, a=0.57, b=0.19, c=0.19,
+                  directed=False, seed=None):
+        """Create a weighted R-MAT graph with 2**scale nodes.
+        
+        edge_factor * 2**scale edges are sampled by recursive choice
+        of adjacency matrix quadrants with probabilities a, b, c, d=1-a-b-c
+        (Graph500 defaults). Loops and parallel edges are removed,
+        so the graph has at most edge_factor * 2**scale edges.
+        
+        Chakrabarti, Zhan, Faloutsos, R-MAT: A Recursive Model
+        for Graph Mining, SDM 2004.
+        """
+        if min(a, b, c) < 0 or a + b + c > 1:
+            raise ValueError("bad quadrant probabilities")
+        n = 1 << scale
+        graph = self.cls(n=n, directed=directed)
+        for node in range(n):
+            graph.add_node(node)
+        rng = _make_rng(seed)
+        m = edge_factor * n
+        if numpy is not None:
+            sources = numpy.zeros(m, dtype=numpy.int64)
+            targets = numpy.zeros(m, dtype=numpy.int64)
+            for level in range(scale):   # one bit per level for all edges
+                r = rng.random(m)
+                sources |= (r >= a + b).astype(numpy.int64) << level
+                targets |= (((r >= a) & (r < a + b)) | (r >= a + b + c)
+                    ).astype(numpy.int64) << level
+            keep = (sources != targets)   # no loops
+            sources, targets = sources[keep], targets[keep]
+            if not directed:
+                sources, targets = (numpy.minimum(sources, targets),
+                    numpy.maximum(sources, targets))
+            codes = numpy.unique(sources * n + targets)   # no parallel edges
+            sources, targets = codes // n, codes % n
+        else:
+            pairs = set()
+            for _ in range(m):
+                source = target = 0
+                for level in range(scale):
+                    r = rng.random()
+                    if r >= a + b:
+                        source |= 1 << level
+                    if a <= r < a + b or r >= a + b + c:
+                        target |= 1 << level
+                if source == target:
                     continue
-                if random.random() > 0.5:   # random direction
-                    graph.add_edge(Edge(source, target, weights.pop()))
-                else:
-                    graph.add_edge(Edge(target, source, weights.pop()))
+                if not directed and source > target:
+                    source, target = target, source
+                pairs.add((source, target))
+            pairs = sorted(pairs)
+            sources = [pair[0] for pair in pairs]
+            targets = [pair[1] for pair in pairs]
+        self._add_random_edges(graph, sources, targets, rng,
+            random_direction=False)
         return graph
 
 # |     |     |            |
@@ -153,7 +340,7 @@ class GraphFactory:
 # |     |     |            |
 # 0-----1-----2-----...--(s-1)
 
-    def make_grid(self, size=3):
+    def make_grid(self, size=3, seed=None):
         """Create a weighted grid graph with boundary
             |V|= size * size, |E| = 2 * size * (size-1).
         """
@@ -161,17 +348,14 @@ class GraphFactory:
             raise ValueError("size too small")
         n = size * size
         graph = self.cls(n=n, directed=False)
-        weights = list(range(1, 1 + 2 * size * (size-1)))   # different weights
-        random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        for node in range(n):
-            row = node // size
-            col = node % size
-            if col != size-1:
-                graph.add_edge(Edge(node, node + 1, weights.pop()))  # line ---
-            if row != size-1:
-                graph.add_edge(Edge(node, node + size, weights.pop()))  # line |
+        sources = [node for node in range(n) if node % size != size-1]
+        targets = [node + 1 for node in sources]   # line ---
+        sources.extend(range(n - size))
+        targets.extend(range(size, n))   # line |
+        self._add_random_edges(graph, sources, targets, _make_rng(seed),
+            random_direction=False)
         return graph
 
 #   |     |     |
@@ -197,8 +381,8 @@ class GraphFactory:
         for node in range(n):
             row = node // size
             col = node % size
-            graph.add_edge(Edge(node, row * size + (col + 1) % size, weights.pop())) # line ---
-            graph.add_edge(Edge(node, ((row + 1) % size) * size + col, weights.pop())) # line |
+            graph.add_edge(self.edge_class(node, row * size + (col + 1) % size, weights.pop())) # line ---
+            graph.add_edge(self.edge_class(node, ((row + 1) % size) * size + col, weights.pop())) # line |
         return graph
 
 # |  /  |  /  |  /     /  |
@@ -224,11 +408,11 @@ class GraphFactory:
             row = node // size
             col = node % size
             if col != size-1:
-                graph.add_edge(Edge(node, node + 1, weights.pop()))  # line ---
+                graph.add_edge(self.edge_class(node, node + 1, weights.pop()))  # line ---
             if row != size-1:
-                graph.add_edge(Edge(node, node + size, weights.pop()))  # line |
+                graph.add_edge(self.edge_class(node, node + size, weights.pop()))  # line |
             if col != size-1 and row != size-1:
-                graph.add_edge(Edge(node, node + 1 + size, weights.pop())) # line /
+                graph.add_edge(self.edge_class(node, node + 1 + size, weights.pop())) # line /
         return graph
 
 #   |  /  |  /  | /
@@ -254,9 +438,9 @@ class GraphFactory:
         for node in range(n):
             row = node // size
             col = node % size
-            graph.add_edge(Edge(node, row * size + (col + 1) % size, weights.pop())) # line ---
-            graph.add_edge(Edge(node, ((row + 1) % size) * size + col, weights.pop())) # line |
-            graph.add_edge(Edge(node, ((row + 1) % size) * size + (col + 1) % size, weights.pop())) # line /
+            graph.add_edge(self.edge_class(node, row * size + (col + 1) % size, weights.pop())) # line ---
+            graph.add_edge(self.edge_class(node, ((row + 1) % size) * size + col, weights.pop())) # line |
+            graph.add_edge(self.edge_class(node, ((row + 1) % size) * size + (col + 1) % size, weights.pop())) # line /
         return graph
 
 # 1--3--5--...--(2s-1)
@@ -277,10 +461,10 @@ class GraphFactory:
             graph.add_node(node)
         for i in range(size):
             node = 2 * i
-            graph.add_edge(Edge(node, node + 1, weights.pop())) # line |
+            graph.add_edge(self.edge_class(node, node + 1, weights.pop())) # line |
             if i != size-1:
-                graph.add_edge(Edge(node, (node + 2) % n, weights.pop())) # line ---
-                graph.add_edge(Edge(node + 1, (node + 3) % n, weights.pop())) # line ---
+                graph.add_edge(self.edge_class(node, (node + 2) % n, weights.pop())) # line ---
+                graph.add_edge(self.edge_class(node + 1, (node + 3) % n, weights.pop())) # line ---
         return graph
 
 # --1--3--5--...--(2s-1)-
@@ -304,9 +488,9 @@ class GraphFactory:
             graph.add_node(node)
         for i in range(size):
             node = 2 * i
-            graph.add_edge(Edge(node, node + 1, weights.pop())) # line |
-            graph.add_edge(Edge(node, (node + 2) % n, weights.pop())) # line ---
-            graph.add_edge(Edge(node + 1, (node + 3) % n, weights.pop())) # line ---
+            graph.add_edge(self.edge_class(node, node + 1, weights.pop())) # line |
+            graph.add_edge(self.edge_class(node, (node + 2) % n, weights.pop())) # line ---
+            graph.add_edge(self.edge_class(node + 1, (node + 3) % n, weights.pop())) # line ---
         return graph
 
     make_ladder_periodic = make_prism
@@ -326,8 +510,8 @@ class GraphFactory:
         for node in range(n):
             graph.add_node(node)
         for node in range(n):
-            graph.add_edge(Edge(node, (node + 1) % n, weights.pop())) # line /
-            graph.add_edge(Edge(node, (node + 2) % n, weights.pop())) # line ---
+            graph.add_edge(self.edge_class(node, (node + 1) % n, weights.pop())) # line /
+            graph.add_edge(self.edge_class(node, (node + 2) % n, weights.pop())) # line ---
         return graph
 
     def make_flow_network(self, n=1):
@@ -345,7 +529,7 @@ class GraphFactory:
             random.shuffle(node_list)
             start = source
             for target in node_list:
-                edge = Edge(start, target, random.randint(1, n))
+                edge = self.edge_class(start, target, random.randint(1, n))
                 if not (graph.has_edge(edge) or graph.has_edge(~edge)):
                     graph.add_edge(edge)
                     used[target] = True
@@ -377,15 +561,15 @@ class GraphFactory:
         random.shuffle(weights)
         for node in range(n):
             graph.add_node(node)
-        graph.add_edge(Edge(0, 1, weights.pop()))
-        graph.add_edge(Edge(0, 2, weights.pop()))
-        graph.add_edge(Edge(0, n-1, weights.pop()))
-        graph.add_edge(Edge(n-2, n-1, weights.pop()))
-        graph.add_edge(Edge(n-3, n-1, weights.pop()))
+        graph.add_edge(self.edge_class(0, 1, weights.pop()))
+        graph.add_edge(self.edge_class(0, 2, weights.pop()))
+        graph.add_edge(self.edge_class(0, n-1, weights.pop()))
+        graph.add_edge(self.edge_class(n-2, n-1, weights.pop()))
+        graph.add_edge(self.edge_class(n-3, n-1, weights.pop()))
         for i in range(1, n-3):
-            graph.add_edge(Edge(i, i+2, weights.pop())) # ---
+            graph.add_edge(self.edge_class(i, i+2, weights.pop())) # ---
         for i in range(1, n-1, 2):
-            graph.add_edge(Edge(i, i+1, weights.pop())) # |
+            graph.add_edge(self.edge_class(i, i+1, weights.pop())) # |
         return graph
 
     def make_wheel(self, n=4, directed=False):
@@ -399,8 +583,8 @@ class GraphFactory:
             graph.add_node(node)
         hub = 0
         for i in range(1, n):
-            graph.add_edge(Edge(hub, i, weights.pop()))
-            graph.add_edge(Edge(i, i+1 if (i < n-1) else 1, weights.pop()))
+            graph.add_edge(self.edge_class(hub, i, weights.pop()))
+            graph.add_edge(self.edge_class(i, i+1 if (i < n-1) else 1, weights.pop()))
         return graph
 
     def make_fake_wheel(self, n=7, directed=False):
@@ -423,8 +607,8 @@ class GraphFactory:
                 break
         graph.del_edge(edge1)
         graph.del_edge(edge2)
-        graph.add_edge(Edge(3, 1, edge1.weight))
-        graph.add_edge(Edge(n-1, 4, edge2.weight))
+        graph.add_edge(self.edge_class(3, 1, edge1.weight))
+        graph.add_edge(self.edge_class(n-1, 4, edge2.weight))
         #graph.show()
         return graph
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import random
-from graphtheory.structures.edges import Edge
+from graphtheory.structures.edges import Edge, edges_from
 from graphtheory.structures.basegraphs import BaseGraph
 
 try:
@@ -18,6 +18,9 @@ class Graph(BaseGraph):
     representation). Nodes are int from range(n).
     """
 
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
     def __init__(self, *, n, directed=False):
         """Load up a Graph instance.
         
@@ -31,6 +34,7 @@ class Graph(BaseGraph):
         self.n = n
         self.directed = directed  # bool
         self.data = [[0] * self.n for node in range(self.n)]
+        self.m = 0   # the number of edges
 
     def is_directed(self):
         """Test if the graph is directed."""
@@ -41,7 +45,13 @@ class Graph(BaseGraph):
         return self.n
 
     def e(self):
-        """Return the number of edges in O(n^2) time."""
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n^2) time (without the counter)."""
         counter = 0
         for source in range(self.n):
             for target in range(self.n):
@@ -66,16 +76,24 @@ class Graph(BaseGraph):
         """Remove a node from the graph with edges.
         In fact, the node become isolated. It takes O(n) time."""
         for target in range(self.n):
+            if self.data[source][target] != 0:
+                self.m -= 1
+            if self.is_directed() and self.data[target][source] != 0:
+                self.m -= 1
             self.data[source][target] = 0
             self.data[target][source] = 0
 
     def add_edge(self, edge):
         """Add an edge to the graph."""
-        try:   # checking Edge interface
-            source, target = edge.source, edge.target
-        except AttributeError:
-            source, target = edge   # tuple or list
-            edge = Edge(source, target)
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+            edge = self.edge_class(source, target)
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
+                edge = self.edge_class(source, target)
         if source == target:
             raise ValueError("loops are forbidden")
         self.add_node(source)
@@ -89,6 +107,63 @@ class Graph(BaseGraph):
                 self.data[target][source] = edge.weight
             else:
                 raise ValueError("parallel edges are forbidden")
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (nodes from range(n)).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        data = self.data
+        n = self.n
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    if len(edge) == 2:
+                        (source, target), weight = edge, 1
+                    else:
+                        source, target, weight = edge
+                else:
+                    source, target = edge.source, edge.target
+                    weight = edge.weight
+                if source == target:
+                    raise ValueError("loops are forbidden")
+                if not (isinstance(source, integer_types)
+                        and isinstance(target, integer_types)):
+                    raise ValueError("node is not int or long")
+                if not (0 <= source < n and 0 <= target < n):
+                    raise ValueError("node out of range")
+                if data[source][target] != 0:
+                    raise ValueError("parallel edges are forbidden")
+                data[source][target] = weight
+                if not directed:
+                    if data[target][source] != 0:
+                        raise ValueError("parallel edges are forbidden")
+                    data[target][source] = weight
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=None, directed=False):
+        """Return a new graph with edges (see add_edges_from).
+        
+        If n is not given, nodes are from range(max_node + 1).
+        """
+        if n is None:
+            edges = list(edges_from(edges))
+            n = 1 + max((max(edge[0], edge[1])
+                if isinstance(edge, (tuple, list))
+                else max(edge.source, edge.target) for edge in edges),
+                default=0)
+        new_graph = cls(n=n, directed=directed)
+        new_graph.add_edges_from(edges)
+        return new_graph
 
     def del_edge(self, edge):
         """Remove an edge from the graph."""
@@ -96,6 +171,8 @@ class Graph(BaseGraph):
             source, target = edge.source, edge.target
         except AttributeError:
             source, target = edge   # tuple or list
+        if self.data[source][target] != 0:
+            self.m -= 1
         self.data[source][target] = 0
         if not self.is_directed():
             self.data[target][source] = 0
@@ -130,13 +207,13 @@ class Graph(BaseGraph):
         """Generate the outedges from the graph on demand."""
         for target in range(self.n):
             if self.data[source][target] != 0:
-                yield Edge(source, target, self.data[source][target])
+                yield self.edge_class(source, target, self.data[source][target])
 
     def iterinedges(self, source):   # O(n) time
         """Generate the inedges from the graph on demand."""
         for target in range(self.n):
             if self.data[target][source] != 0:
-                yield Edge(target, source, self.data[target][source])
+                yield self.edge_class(target, source, self.data[target][source])
 
     def iteredges(self):   # O(n^2) time
         """Generate the edges from the graph on demand."""
@@ -144,7 +221,8 @@ class Graph(BaseGraph):
             for target in range(self.n):
                 if self.data[source][target] != 0 and (
                     self.is_directed() or source < target):
-                    yield Edge(source, target, self.data[source][target])
+                    yield self.edge_class(
+                        source, target, self.data[source][target])
 
     def show(self):
         """The graph presentation in O(n^2) time."""
@@ -165,6 +243,7 @@ class Graph(BaseGraph):
         for source in range(self.n):
             for target in range(self.n):
                 new_graph.data[source][target] = self.data[source][target]
+        new_graph.m = self.m
         return new_graph
 
     def transpose(self):
@@ -173,6 +252,7 @@ class Graph(BaseGraph):
         for source in range(self.n):
             for target in range(self.n):
                 new_graph.data[source][target] = self.data[target][source]
+        new_graph.m = self.m
         return new_graph
 
     def complement(self):
@@ -182,6 +262,8 @@ class Graph(BaseGraph):
             for target in range(self.n):   # no loops
                 if self.data[source][target] == 0 and source != target:
                     new_graph.data[source][target] = 1
+        edges = self.n * (self.n - 1)
+        new_graph.m = (edges if self.is_directed() else edges // 2) - self.m
         return new_graph
 
     def subgraph(self, nodes):
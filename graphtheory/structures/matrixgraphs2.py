@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import random
-from graphtheory.structures.edges import Edge
+from graphtheory.structures.edges import Edge, edges_from
 from graphtheory.structures.basegraphs import BaseGraph
 
 try:
@@ -18,6 +18,9 @@ class Graph(BaseGraph):
     representation). Nodes are int from range(n).
     """
 
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
     def __init__(self, *, n, directed=False):
         """Load up a Graph instance.
         
@@ -31,6 +34,7 @@ class Graph(BaseGraph):
         self.n = n
         self.directed = directed  # bool
         self.data = [[None] * self.n for node in range(self.n)]
+        self.m = 0   # the number of edges
 
     def is_directed(self):
         """Test if the graph is directed."""
@@ -41,7 +45,13 @@ class Graph(BaseGraph):
         return self.n
 
     def e(self):
-        """Return the number of edges in O(n^2) time."""
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n^2) time (without the counter)."""
         counter = 0
         for source in range(self.n):
             for target in range(self.n):
@@ -66,16 +76,24 @@ class Graph(BaseGraph):
         """Remove a node from the graph with edges.
         In fact, the node become isolated. It takes O(n) time."""
         for target in range(self.n):
+            if self.data[source][target] is not None:
+                self.m -= 1
+            if self.is_directed() and self.data[target][source] is not None:
+                self.m -= 1
             self.data[source][target] = None
             self.data[target][source] = None
 
     def add_edge(self, edge):
         """Add an edge to the graph."""
-        try:   # checking Edge interface
-            source, target = edge.source, edge.target
-        except AttributeError:
-            source, target = edge   # tuple or list
-            edge = Edge(source, target)
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+            edge = self.edge_class(source, target)
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
+                edge = self.edge_class(source, target)
         if source == target:
             raise ValueError("loops are forbidden")
         self.add_node(source)
@@ -89,6 +107,59 @@ class Graph(BaseGraph):
                 self.data[target][source] = ~edge
             else:
                 raise ValueError("parallel edges are forbidden")
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (nodes from range(n)).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        edge_class = self.edge_class
+        data = self.data
+        n = self.n
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    edge = edge_class(*edge)
+                source, target = edge.source, edge.target
+                if source == target:
+                    raise ValueError("loops are forbidden")
+                if not (isinstance(source, integer_types)
+                        and isinstance(target, integer_types)):
+                    raise ValueError("node is not int or long")
+                if not (0 <= source < n and 0 <= target < n):
+                    raise ValueError("node out of range")
+                if data[source][target] is not None:
+                    raise ValueError("parallel edges are forbidden")
+                data[source][target] = edge
+                if not directed:
+                    if data[target][source] is not None:
+                        raise ValueError("parallel edges are forbidden")
+                    data[target][source] = ~edge
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=None, directed=False):
+        """Return a new graph with edges (see add_edges_from).
+        
+        If n is not given, nodes are from range(max_node + 1).
+        """
+        if n is None:
+            edges = list(edges_from(edges))
+            n = 1 + max((max(edge[0], edge[1])
+                if isinstance(edge, (tuple, list))
+                else max(edge.source, edge.target) for edge in edges),
+                default=0)
+        new_graph = cls(n=n, directed=directed)
+        new_graph.add_edges_from(edges)
+        return new_graph
 
     def del_edge(self, edge):
         """Remove an edge from the graph."""
@@ -96,6 +167,8 @@ class Graph(BaseGraph):
             source, target = edge.source, edge.target
         except AttributeError:
             source, target = edge   # tuple or list
+        if self.data[source][target] is not None:
+            self.m -= 1
         self.data[source][target] = None
         if not self.is_directed():
             self.data[target][source] = None
@@ -170,6 +243,7 @@ class Graph(BaseGraph):
         for source in range(self.n):
             for target in range(self.n):
                 new_graph.data[source][target] = self.data[source][target]
+        new_graph.m = self.m
         return new_graph
 
     def transpose(self):
@@ -179,6 +253,7 @@ class Graph(BaseGraph):
             for target in range(self.n):
                 if self.data[source][target] is not None:
                     new_graph.data[target][source] = ~self.data[source][target]
+        new_graph.m = self.m
         return new_graph
 
     def complement(self):
@@ -187,7 +262,10 @@ class Graph(BaseGraph):
         for source in range(self.n):
             for target in range(self.n):   # no loops
                 if self.data[source][target] is None and source != target:
-                    new_graph.data[source][target] = Edge(source, target)
+                    new_graph.data[source][target] = self.edge_class(
+                        source, target)
+        edges = self.n * (self.n - 1)
+        new_graph.m = (edges if self.is_directed() else edges // 2) - self.m
         return new_graph
 
     def subgraph(self, nodes):
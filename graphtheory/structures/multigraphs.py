@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from graphtheory.structures.edges import Edge
+from graphtheory.structures.edges import Edge, SlottedEdge, edges_from
 from graphtheory.structures.basegraphs import BaseGraph
 
 
@@ -20,25 +20,42 @@ class MultiGraph(dict):
     "D": {"C": [Edge("D", "C", 6), Edge("D", "D", 10)]}, 
     "E": {"C": [Edge("E", "C", 7), Edge("E", "C", 8)]}, 
     "F": {}}
+    
+    An optional inverse structure for directed multigraphs (inedges),
+    lists are shared with the main structure:
+    {"A": {}, "B": {"A": [Edge("A", "B", 1)]}, ...}
     """
 
-    def __init__(self, *, n=0, directed=False):
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
+    def __init__(self, *, n=0, directed=False, inverse=False):
         """Load up a MultiGraph instance.
         
         Parameters
         ----------
         n : int (positive; not used, for compatibility only)
         directed : bool, optional (default=False)
+        inverse : bool, optional (default=False),
+            maintain inedges of a directed multigraph (faster iterinedges)
         """
         self.n = n
         self.directed = directed
+        self.inverse = (dict() if (directed and inverse) else None)
+        self.m = 0   # the number of edges
 
     def v(self):
         """Return the number of nodes (the multigraph order)."""
         return len(self)
 
     def e(self):
-        """Return the number of edges."""
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n+m) time (without the counter)."""
         loops = 0
         for node in self:
             if node in self[node]:
@@ -60,6 +77,8 @@ class MultiGraph(dict):
         """Add a node to the multigraph."""
         if node not in self:
             self[node] = dict()
+            if self.inverse is not None:
+                self.inverse[node] = dict()
 
     def has_node(self, node):
         """Test if a node exists."""
@@ -74,12 +93,14 @@ class MultiGraph(dict):
             for edge in list(self.iteroutedges(node)):
                 self.del_edge(edge)
         del self[node]
+        if self.inverse is not None:
+            del self.inverse[node]
 
     def add_edge(self, edge):
         """Add an edge to the multigraph (missing nodes are created)."""
-        if not isinstance(edge, Edge):
+        if not isinstance(edge, (Edge, SlottedEdge)):
             source, target = edge   # tuple or list
-            edge = Edge(source, target)
+            edge = self.edge_class(source, target)
         if edge.source in self and edge.target in self[edge.source]:
             if edge in self[edge.source][edge.target]:
                 raise ValueError("the same parallel edge")
@@ -87,6 +108,9 @@ class MultiGraph(dict):
         self.add_node(edge.target)
         if edge.target not in self[edge.source]:
             self[edge.source][edge.target] = list()
+            if self.inverse is not None:   # the same list
+                self.inverse[edge.target][edge.source] = \
+                    self[edge.source][edge.target]
         if not self.is_directed() and edge.source not in self[edge.target]:
             self[edge.target][edge.source] = list()
         # Increase the number of parallel edges.
@@ -94,31 +118,81 @@ class MultiGraph(dict):
         # A loop is added only once.
         if not self.is_directed() and edge.source != edge.target:
             self[edge.target][edge.source].append(~edge)
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (missing nodes are created).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight), or a NumPy array (m, 2) or (m, 3)
+        """
+        edge_class = self.edge_class
+        inverse = self.inverse
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    edge = edge_class(*edge)
+                source, target = edge.source, edge.target
+                if source not in self:
+                    self.add_node(source)
+                if target not in self:
+                    self.add_node(target)
+                row = self[source]
+                if target in row:
+                    if edge in row[target]:
+                        raise ValueError("the same parallel edge")
+                else:
+                    row[target] = list()
+                    if inverse is not None:   # the same list
+                        inverse[target][source] = row[target]
+                row[target].append(edge)
+                if not directed and source != target:   # a loop only once
+                    row = self[target]
+                    if source not in row:
+                        row[source] = list()
+                    row[source].append(~edge)
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=0, directed=False, **kwargs):
+        """Return a new multigraph with edges (see add_edges_from)."""
+        new_graph = cls(n=n, directed=directed, **kwargs)
+        new_graph.add_edges_from(edges)
+        return new_graph
 
     def del_edge(self, edge):
         """Remove an edge from the multigraph."""
-        if not isinstance(edge, Edge):
+        if not isinstance(edge, (Edge, SlottedEdge)):
             source, target = edge   # tuple or list
-            edge = Edge(source, target)
+            edge = self.edge_class(source, target)
         self[edge.source][edge.target].remove(edge)
         if len(self[edge.source][edge.target]) == 0:
             del self[edge.source][edge.target]
+            if self.inverse is not None:
+                del self.inverse[edge.target][edge.source]
         # A loop is deleted only once.
         if not self.is_directed() and edge.source != edge.target:
             self[edge.target][edge.source].remove(~edge)
             if len(self[edge.target][edge.source]) == 0:
                 del self[edge.target][edge.source]
+        self.m -= 1
 
     def has_edge(self, edge):
         """Test if an edge exists. The weight is not checked."""
-        if not isinstance(edge, Edge):
+        if not isinstance(edge, (Edge, SlottedEdge)):
             source, target = edge   # tuple or list
-            edge = Edge(source, target)
+            edge = self.edge_class(source, target)
         return edge.source in self and edge.target in self[edge.source]
 
     def weight(self, edge):
         """Return the number of parallel edges."""
-        if isinstance(edge, Edge):
+        if isinstance(edge, (Edge, SlottedEdge)):
             source, target = edge.source, edge.target
         else:
             source, target = edge   # tuple or list
@@ -143,7 +217,11 @@ class MultiGraph(dict):
 
     def iterinedges(self, source):
         """Generate inedges from the multigraph on demand."""
-        if self.is_directed():
+        if self.inverse is not None:   # O(indegree) time
+            for target in self.inverse[source]:
+                for edge in self.inverse[source][target]:
+                    yield edge
+        elif self.is_directed():
             for target in self.iternodes():
                 if source in self[target]:
                     for edge in self[target][source]:
@@ -174,16 +252,23 @@ class MultiGraph(dict):
 
     def copy(self):
         """Return the multigraph copy."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
+        for node in self.iternodes():
+            new_graph.add_node(node)
         for source in self.iternodes():
-            new_graph[source] = dict()
             for target in self[source]:
                 new_graph[source][target] = list(self[source][target])
+                if new_graph.inverse is not None:
+                    new_graph.inverse[target][source] = \
+                        new_graph[source][target]
+        new_graph.m = self.m
         return new_graph
 
     def transpose(self):
         """Return the transpose of the multigraph."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
         for node in self.iternodes():
             new_graph.add_node(node)
         for edge in self.iteredges():
@@ -198,7 +283,7 @@ class MultiGraph(dict):
         for source in self.iternodes():
             for target in self.iternodes():
                 if source != target:
-                    edge = Edge(source, target)
+                    edge = self.edge_class(source, target)
                     # no loops and parallel edges
                     if not self.has_edge(edge) and not new_graph.has_edge(edge):
                         new_graph.add_edge(edge)
@@ -246,7 +331,12 @@ class MultiGraph(dict):
 
     def indegree(self, source):
         """Return the indegree of the node."""
-        if self.is_directed():
+        if self.inverse is not None:
+            edges = 0
+            for target in self.inverse[source]:
+                edges += len(self.inverse[source][target])
+            return edges
+        elif self.is_directed():
             edges = 0
             for target in self.iternodes():
                 if source in self[target]:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import random
-from graphtheory.structures.edges import Edge
+from graphtheory.structures.edges import Edge, edges_from
 from graphtheory.structures.basegraphs import BaseGraph
 
 
@@ -19,18 +19,28 @@ class Graph(dict):
     "D": set(["C"]), 
     "E": set(["C"]), 
     "F": set()}
+    
+    An optional inverse structure for directed graphs (inedges):
+    {"A": set(), "B": set(["A", "D"]), "C": set(["A", "D", "E"]), ...}
     """
 
-    def __init__(self, *, n=0, directed=False):
+    edge_class = Edge   # Edge, SlottedEdge or FrozenEdge
+    check_edges = False   # compare the edge counter with count_edges()
+
+    def __init__(self, *, n=0, directed=False, inverse=False):
         """Load up a Graph instance.
         
         Parameters
         ----------
         n : int (positive; not used, for compatibility only)
         directed : bool, optional (default=False)
+        inverse : bool, optional (default=False),
+            maintain inedges of a directed graph (faster iterinedges)
         """
         self.n = n
         self.directed = directed
+        self.inverse = (dict() if (directed and inverse) else None)
+        self.m = 0   # the number of edges
 
     def is_directed(self):
         """Test if the graph is directed."""
@@ -41,7 +51,13 @@ class Graph(dict):
         return len(self)
 
     def e(self):
-        """Return the number of edges in O(n) time."""
+        """Return the number of edges in O(1) time."""
+        if self.check_edges and self.m != self.count_edges():
+            raise ValueError("the edge counter is inconsistent")
+        return self.m
+
+    def count_edges(self):
+        """Return the number of edges in O(n) time (without the counter)."""
         edges = sum(len(self[node]) for node in self)
         return (edges if self.is_directed() else edges // 2)
 
@@ -49,6 +65,8 @@ class Graph(dict):
         """Add a node to the graph."""
         if node not in self:
             self[node] = set()
+            if self.inverse is not None:
+                self.inverse[node] = set()
 
     def has_node(self, node):
         """Test if a node exists."""
@@ -56,22 +74,39 @@ class Graph(dict):
 
     def del_node(self, node):
         """Remove a node from the graph (with edges)."""
-        for source in self:
-            self[source].discard(node)
+        if self.inverse is not None:   # O(degree) time
+            for source in self.inverse[node]:
+                self[source].discard(node)
+            for target in self[node]:
+                self.inverse[target].discard(node)
+            self.m -= len(self.inverse[node]) + len(self[node])
+            del self.inverse[node]
+        else:   # O(n) time
+            self.m -= len(self[node])   # outedges or edges
+            for source in self:
+                if node in self[source]:
+                    self[source].remove(node)
+                    if self.is_directed():   # inedges
+                        self.m -= 1
         del self[node]
 
     def add_edge(self, edge):
         """Add an edge to the graph (missing nodes are created)."""
-        try:   # checking Edge interface
-            source, target = edge.source, edge.target
-        except AttributeError:
-            source, target = edge   # tuple or list
+        if isinstance(edge, tuple):   # fast path, no exception
+            source, target = edge
+        else:
+            try:   # checking Edge interface
+                source, target = edge.source, edge.target
+            except AttributeError:
+                source, target = edge   # list
         if source == target:
             raise ValueError("loops are forbidden")
         self.add_node(source)
         self.add_node(target)
         if target not in self[source]:
             self[source].add(target)
+            if self.inverse is not None:
+                self.inverse[target].add(source)
         else:
             raise ValueError("parallel edges are forbidden")
         if not self.is_directed():
@@ -79,6 +114,53 @@ class Graph(dict):
                 self[target].add(source)
             else:
                 raise ValueError("parallel edges are forbidden")
+        self.m += 1
+
+    def add_edges_from(self, edges):
+        """Add edges in one pass (missing nodes are created).
+        
+        Parameters
+        ----------
+        edges : iterable of edges, tuples (source, target) or
+            (source, target, weight) (weights are ignored),
+            or a NumPy array (m, 2) or (m, 3)
+        """
+        inverse = self.inverse
+        directed = self.directed
+        added = 0
+        try:
+            for edge in edges_from(edges):
+                if isinstance(edge, (tuple, list)):
+                    source, target = edge[0], edge[1]
+                else:
+                    source, target = edge.source, edge.target
+                if source == target:
+                    raise ValueError("loops are forbidden")
+                if source not in self:
+                    self.add_node(source)
+                if target not in self:
+                    self.add_node(target)
+                row = self[source]
+                if target in row:
+                    raise ValueError("parallel edges are forbidden")
+                row.add(target)
+                if inverse is not None:
+                    inverse[target].add(source)
+                if not directed:
+                    row = self[target]
+                    if source in row:
+                        raise ValueError("parallel edges are forbidden")
+                    row.add(source)
+                added += 1
+        finally:   # the counter is correct after an error
+            self.m += added
+
+    @classmethod
+    def from_edge_list(cls, edges, n=0, directed=False, **kwargs):
+        """Return a new graph with edges (see add_edges_from)."""
+        new_graph = cls(n=n, directed=directed, **kwargs)
+        new_graph.add_edges_from(edges)
+        return new_graph
 
     def del_edge(self, edge):
         """Remove an edge from the graph."""
@@ -87,8 +169,11 @@ class Graph(dict):
         except AttributeError:
             source, target = edge   # tuple or list
         self[source].remove(target)
+        if self.inverse is not None:
+            self.inverse[target].remove(source)
         if not self.is_directed():
             self[target].remove(source)
+        self.m -= 1
 
     def has_edge(self, edge):
         """Test if an edge exists (the weight is not checked)."""
@@ -120,24 +205,27 @@ class Graph(dict):
     def iteroutedges(self, source):
         """Generate the outedges from the graph on demand."""
         for target in self[source]:
-            yield Edge(source, target)
+            yield self.edge_class(source, target)
 
     def iterinedges(self, source):
         """Generate the inedges from the graph on demand."""
-        if self.is_directed():   # O(n) time
+        if self.inverse is not None:   # O(indegree) time
+            for target in self.inverse[source]:
+                yield self.edge_class(target, source)
+        elif self.is_directed():   # O(n) time
             for target in self.iternodes():
                 if source in self[target]:
-                    yield Edge(target, source)
+                    yield self.edge_class(target, source)
         else:
             for target in self[source]:
-                yield Edge(target, source)
+                yield self.edge_class(target, source)
 
     def iteredges(self):
         """Generate the edges from the graph on demand."""
         for source in self.iternodes():
             for target in self[source]:
                 if self.is_directed() or source < target:
-                    yield Edge(source, target)
+                    yield self.edge_class(source, target)
 
     def show(self):
         """The graph presentation."""
@@ -151,14 +239,20 @@ class Graph(dict):
 
     def copy(self):
         """Return the graph copy."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
         for node in self.iternodes():
             new_graph[node] = set(self[node])
+        new_graph.m = self.m
+        if self.inverse is not None:
+            for node in self.iternodes():
+                new_graph.inverse[node] = set(self.inverse[node])
         return new_graph
 
     def transpose(self):
         """Return the transpose of the graph."""
-        new_graph = self.__class__(n=self.n, directed=self.directed)
+        new_graph = self.__class__(n=self.n, directed=self.directed,
+            inverse=self.inverse is not None)
         for node in self.iternodes():
             new_graph.add_node(node)
         for edge in self.iteredges():
@@ -173,7 +267,7 @@ class Graph(dict):
         for source in self.iternodes():
             for target in self.iternodes():
                 if source != target:
-                    edge = Edge(source, target)
+                    edge = self.edge_class(source, target)
                     if not self.has_edge(edge) and not new_graph.has_edge(edge):
                         new_graph.add_edge(edge)
         return new_graph
@@ -203,7 +297,9 @@ class Graph(dict):
 
     def indegree(self, source):
         """Return the indegree of the node."""
-        if self.is_directed():   # O(n) time
+        if self.inverse is not None:   # O(1) time
+            return len(self.inverse[source])
+        elif self.is_directed():   # O(n) time
             counter = 0
             for target in self.iternodes():
                 if source in self[target]:
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.bitsetgraphs import BitsetGraph, iterbits, popcount
+from graphtheory.cliques.bronkerbosch import BronKerboschClassic
+from graphtheory.independentsets.isetbt import BacktrackingIndependentSet
+from graphtheory.dominatingsets.dsetbt import BacktrackingDominatingSet
+from graphtheory.coloring.nodecolorus import UnorderedSequentialNodeColoring
+from graphtheory.coloring.nodecolorgis import GISNodeColoring1
+from graphtheory.coloring.nodecolorgis import GISNodeColoring2
+from graphtheory.coloring.nodecolorrlf import RLFNodeColoring1
+from graphtheory.coloring.nodecolorrlf import RLFNodeColoring2
+from graphtheory.connectivity.cutnodes import TrivialCutNode
+from graphtheory.chordality.mcsm import MCS_M
+
+# 0 --o 1
+# o   / o
+# |  /  |
+# | o   |
+# 2 --o 3
+
+class TestBitsetGraphDirected(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4           # number of nodes
+        self.G = BitsetGraph(n=self.N, directed=True)
+        self.G.check_edges = True
+        self.edges = [
+            Edge(0, 1), Edge(1, 2), Edge(2, 0), Edge(2, 3), Edge(3, 1)]
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_directed(self):
+        self.assertTrue(self.G.is_directed())
+        self.assertEqual(self.G.v(), self.N)
+        self.assertEqual(self.G.e(), 5)
+        self.assertTrue(self.G.has_edge((2, 0)))
+        self.assertFalse(self.G.has_edge((0, 2)))
+        self.assertEqual(self.G.weight((2, 0)), 1)
+        self.assertEqual(self.G.weight((0, 2)), 0)
+        self.assertRaises(ValueError, self.G.add_edge, (0, 1))
+        self.assertRaises(ValueError, self.G.add_edge, (0, 0))
+        self.assertRaises(ValueError, self.G.add_edge, (0, 4))
+        self.G.del_node(1)
+        self.assertEqual(self.G.v(), self.N - 1)
+        self.assertFalse(self.G.has_node(1))
+        self.assertEqual(list(self.G.iternodes()), [0, 2, 3])
+        self.assertEqual(self.G.e(), 2)
+        self.G.del_edge((2, 0))
+        self.assertFalse(self.G.has_edge((2, 0)))
+        self.assertEqual(self.G.e(), 1)
+
+    def test_iteredges(self):
+        self.assertEqual(sorted(self.G.iteredges()), sorted(self.edges))
+        self.assertEqual(sorted(self.G.iterinedges(1)),
+            [Edge(0, 1), Edge(3, 1)])
+        self.assertEqual(list(self.G.iteroutedges(2)),
+            [Edge(2, 0), Edge(2, 3)])
+        self.assertEqual(list(self.G.iteradjacent(2)), [0, 3])
+
+    def test_degree(self):
+        self.assertEqual(self.G.outdegree(2), 2)
+        self.assertEqual(self.G.indegree(1), 2)
+        self.assertRaises(ValueError, self.G.degree, 1)
+
+    def test_copy_transpose_complement(self):
+        T = self.G.copy()
+        self.assertEqual(T, self.G)
+        T = self.G.transpose()
+        self.assertEqual(T.e(), 5)
+        for edge in self.edges:
+            self.assertTrue(T.has_edge(~edge))
+        self.assertEqual(T.transpose(), self.G)
+        T = self.G.complement()
+        self.assertEqual(T.e(), self.N * (self.N-1) - 5)
+        for edge in T.iteredges():
+            self.assertFalse(self.G.has_edge(edge))
+
+    def test_cmp(self):
+        T = Graph(n=self.N, directed=True)
+        for edge in self.edges:
+            T.add_edge(edge)
+        self.assertTrue(self.G == T)
+        T.del_edge((2, 3))
+        self.assertTrue(self.G != T)
+
+    def tearDown(self): pass
+
+# 0---1---2---3   maximum clique {2, 3, 5}
+#     |   | /
+#     4---5
+
+class TestBitsetGraphUndirected(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 6           # number of nodes
+        self.edges = [Edge(0, 1), Edge(1, 2), Edge(1, 4), Edge(2, 3),
+            Edge(2, 5), Edge(3, 5), Edge(4, 5)]
+        self.G = BitsetGraph.from_edge_list(self.edges)
+        self.G.check_edges = True
+        self.H = Graph.from_edge_list(self.edges)
+
+    def test_undirected(self):
+        self.assertFalse(self.G.is_directed())
+        self.assertEqual(self.G.v(), self.N)
+        self.assertEqual(self.G.e(), 7)
+        self.assertEqual(sorted(self.G.iteredges()), sorted(self.edges))
+        self.assertEqual(self.G.degree(5), 3)
+        self.assertEqual(self.G.indegree(5), 3)
+        self.assertTrue(self.G.has_edge((5, 2)))
+        self.G.del_node(2)
+        self.assertEqual(self.G.e(), 4)
+        self.assertEqual(self.G.v(), self.N - 1)
+        self.G.add_node(2)   # isolated
+        self.assertEqual(self.G.v(), self.N)
+        self.assertEqual(self.G.degree(2), 0)
+
+    def test_subgraph(self):
+        S = self.G.subgraph([1, 2, 3, 5])
+        self.assertEqual(S.v(), 4)
+        self.assertEqual(S.e(), 4)
+        self.assertEqual(S, self.H.subgraph([1, 2, 3, 5]))
+        self.assertEqual(sorted(S.iteredges()),
+            [Edge(1, 2), Edge(2, 3), Edge(2, 5), Edge(3, 5)])
+        C = S.complement()   # only live nodes
+        self.assertEqual(C.v(), 4)
+        self.assertEqual(sorted(C.iteredges()), [Edge(1, 3), Edge(1, 5)])
+        self.assertRaises(ValueError, S.subgraph, [0, 1])
+
+    def test_bitsets(self):
+        self.assertEqual(self.G.neighbors(2), 0b101010)
+        self.assertEqual(list(iterbits(self.G.intersection([2, 5]))), [3])
+        self.assertEqual(list(iterbits(self.G.union([0, 3]))), [1, 2, 5])
+        self.assertEqual(popcount(self.G.union([1, 5])), 4)
+        self.assertEqual(list(iterbits(0)), [])
+
+    def test_algorithms(self):
+        algorithm = BronKerboschClassic(self.G)
+        algorithm.run()
+        cliques = sorted(algorithm.cliques, key=len)
+        self.assertEqual(cliques, [{0, 1}, {1, 2}, {1, 4}, {4, 5}, {2, 3, 5}])
+        algorithm = BacktrackingIndependentSet(self.G)
+        algorithm.run()
+        expected = BacktrackingIndependentSet(self.H)
+        expected.run()
+        self.assertEqual(algorithm.cardinality, expected.cardinality)
+        algorithm = BacktrackingDominatingSet(self.G)
+        algorithm.run()
+        expected = BacktrackingDominatingSet(self.H)
+        expected.run()
+        self.assertEqual(algorithm.cardinality, expected.cardinality)
+        algorithm = UnorderedSequentialNodeColoring(self.G)
+        algorithm.run()
+        for edge in self.G.iteredges():
+            self.assertNotEqual(algorithm.color[edge.source],
+                algorithm.color[edge.target])
+
+    def test_del_node_algorithms(self):
+        # GIS, RLF and MCS-M delete nodes from a copy of the graph.
+        for algorithm_class in (GISNodeColoring1, GISNodeColoring2,
+                RLFNodeColoring1, RLFNodeColoring2):
+            algorithm = algorithm_class(self.G)
+            algorithm.run()
+            self.assertEqual(len(algorithm.color), self.N)
+            for edge in self.G.iteredges():
+                self.assertNotEqual(algorithm.color[edge.source],
+                    algorithm.color[edge.target])
+        algorithm = TrivialCutNode(self.G)
+        algorithm.run()
+        self.assertEqual(sorted(algorithm.cut_nodes), [1])
+        algorithm = MCS_M(self.G.copy())
+        algorithm.run()
+        self.assertEqual(sorted(algorithm.order), list(range(self.N)))
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
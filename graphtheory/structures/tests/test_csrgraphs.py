@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.shortestpaths.dijkstra import Dijkstra
+from graphtheory.traversing.bfs import SimpleBFS
+from graphtheory.spanningtrees.kruskal import KruskalMST
+
+# A --o B
+# o   / o
+# |  /  |
+# | o   |
+# C --o D
+
+class TestCSRGraphDirected(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4           # number of nodes
+        self.G = CSRGraph(n=self.N, directed=True)
+        self.nodes = ["A", "B", "C", "D"]
+        self.edges = [
+            Edge("A", "B", 2), Edge("B", "C", 4), Edge("C", "A", 6),
+            Edge("C", "D", 3), Edge("D", "B", 5)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_directed(self):
+        self.assertTrue(self.G.is_directed())
+        self.assertFalse(self.G.is_frozen())
+        self.assertEqual(self.G.v(), self.N)
+        self.assertEqual(self.G.e(), 5)
+        self.assertTrue(self.G.is_frozen())
+        self.assertTrue(self.G.has_edge(("C", "A")))
+        self.assertFalse(self.G.has_edge(("A", "C")))
+        self.assertFalse(self.G.has_edge(("A", "X")))
+        self.assertEqual(self.G.weight(("C", "A")), 6)
+        self.assertEqual(self.G.weight(("A", "C")), 0)
+        self.assertEqual(list(self.G.iternodes()), self.nodes)
+        self.assertEqual(sorted(self.G.iteredges()), sorted(self.edges))
+
+    def test_frozen(self):
+        self.G.freeze()
+        self.assertRaises(ValueError, self.G.add_node, "X")
+        self.assertRaises(ValueError, self.G.add_edge, Edge("A", "D"))
+        self.assertRaises(ValueError, self.G.del_edge, Edge("A", "B"))
+        self.assertRaises(ValueError, self.G.del_node, "A")
+        self.G.add_node("A")   # existing node is ignored
+
+    def test_iteredges(self):
+        inedges_B = list(self.G.iterinedges("B"))
+        outedges_B = list(self.G.iteroutedges("B"))
+        self.assertEqual(sorted(inedges_B), [Edge("A", "B", 2), Edge("D", "B", 5)])
+        self.assertEqual(outedges_B, [Edge("B", "C", 4)])
+        self.assertEqual(sorted(self.G.iteradjacent("C")), ["A", "D"])
+
+    def test_degree(self):
+        self.assertEqual(self.G.indegree("A"), 1)
+        self.assertEqual(self.G.indegree("B"), 2)
+        self.assertEqual(self.G.outdegree("C"), 2)
+        self.assertEqual(self.G.outdegree("D"), 1)
+        self.assertRaises(ValueError, self.G.degree, "A")
+
+    def test_copy_transpose(self):
+        T = self.G.copy()
+        self.assertEqual(T, self.G)
+        T = self.G.transpose()
+        self.assertEqual(T.e(), self.G.e())
+        for edge in T.iteredges():
+            self.assertTrue(self.G.has_edge(~edge))
+        self.assertEqual(T.transpose(), self.G)
+
+    def test_complement(self):
+        T = self.G.complement()
+        self.assertEqual(T.v(), self.G.v())
+        self.assertEqual(T.e(), self.N*(self.N-1) - self.G.e())
+        for edge in T.iteredges():
+            self.assertFalse(self.G.has_edge(edge))
+
+    def test_subgraph(self):
+        T = self.G.subgraph(["A", "B", "C"])
+        self.assertEqual(T.v(), 3)
+        self.assertEqual(T.e(), 3)
+        for edge in T.iteredges():
+            self.assertTrue(self.G.has_edge(edge))
+
+    def test_round_trip(self):
+        G = self.G.to_graph()
+        self.assertTrue(isinstance(G, Graph))
+        self.assertEqual(G.e(), self.G.e())
+        self.assertEqual(G["A"]["B"], Edge("A", "B", 2))
+        T = CSRGraph.from_graph(G)
+        self.assertTrue(T.is_frozen())
+        self.assertEqual(T, self.G)
+        self.assertEqual(self.G, G)
+
+    def test_from_edge_list(self):
+        T = CSRGraph.from_edge_list(self.edges, directed=True)
+        self.assertTrue(T.is_frozen())
+        self.assertEqual(T, self.G)
+        self.assertRaises(ValueError, T.add_edges_from, [("A", "D")])
+        T = CSRGraph(directed=True)
+        self.assertRaises(ValueError, T.add_edges_from, [("A", "B"), ("A", "B")])
+
+    def tearDown(self): pass
+
+# 0-2-4-6
+# | | | |  ladder
+# 1-3-5-7
+
+class TestCSRGraphLadder(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 8           # number of nodes
+        self.G = Graph(n=self.N)
+        self.edges = [
+            Edge(0, 1, 2), Edge(0, 2, 1), Edge(2, 3, 5),
+            Edge(1, 3, 3), Edge(2, 4, 4), Edge(3, 5, 6), Edge(4, 6, 7),
+            Edge(4, 5, 8), Edge(5, 7, 9), Edge(6, 7, 10)]
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        self.C = CSRGraph.from_graph(self.G)
+
+    def test_basic(self):
+        self.assertFalse(self.C.is_directed())
+        self.assertEqual(self.C.v(), self.N)
+        self.assertEqual(self.C.e(), len(self.edges))
+        self.assertEqual(self.C.degree(2), 3)
+        self.assertEqual(self.C.indegree(2), 3)
+        self.assertEqual(len(list(self.C.iterinedges(2))), 3)
+        for edge in self.edges:
+            self.assertTrue(self.C.has_edge(edge))
+            self.assertTrue(self.C.has_edge(~edge))
+            self.assertEqual(self.C.weight(~edge), edge.weight)
+        self.assertEqual(self.C.to_graph(), self.G)
+
+    def test_kruskal(self):
+        algorithm = KruskalMST(self.C)
+        algorithm.run()
+        expected = KruskalMST(self.G)
+        expected.run()
+        self.assertEqual(algorithm.mst.e(), self.N-1)
+        self.assertEqual(algorithm.mst, expected.mst)
+
+    def test_bfs(self):
+        algorithm = SimpleBFS(self.C)
+        algorithm.run(0)
+        self.assertEqual(algorithm.path(0, 7), [0, 1, 3, 5, 7])
+        self.assertEqual(algorithm.dag.e(), self.N-1)
+
+    def test_dijkstra(self):
+        D = CSRGraph(directed=True)
+        for edge in self.edges:
+            D.add_edge(edge)
+            D.add_edge(~edge)
+        algorithm = Dijkstra(D)
+        algorithm.run(0)
+        expected = Dijkstra(D.to_graph())
+        expected.run(0)
+        self.assertEqual(algorithm.distance, expected.distance)
+        self.assertEqual(algorithm.path(7), [0, 1, 3, 5, 7])
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
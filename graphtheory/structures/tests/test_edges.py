@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 import unittest
-from graphtheory.structures.edges import Edge
+import copy
+import pickle
+from graphtheory.structures.edges import Edge, SlottedEdge, FrozenEdge
+from graphtheory.structures.graphs import Graph
 
 
 class TestDirectedEdge(unittest.TestCase):
@@ -47,6 +50,72 @@ class TestDirectedEdge(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestSlottedEdge(unittest.TestCase):
+
+    def setUp(self):
+        self.edge1 = SlottedEdge(2, 4)
+        self.edge2 = FrozenEdge("A", "B", 5)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.edge1), "SlottedEdge(2, 4)")
+        self.assertEqual(repr(~self.edge1), "SlottedEdge(4, 2)")
+        self.assertEqual(repr(self.edge2), "FrozenEdge('A', 'B', 5)")
+        self.assertEqual(repr(~self.edge2), "FrozenEdge('B', 'A', 5)")
+
+    def test_cmp(self):
+        self.assertTrue(self.edge1 == SlottedEdge(2, 4))
+        self.assertTrue(self.edge1 == Edge(2, 4))
+        self.assertTrue(self.edge2 == Edge("A", "B", 5))
+        self.assertTrue(self.edge1 != SlottedEdge(2, 4, 3))
+        self.assertTrue(self.edge1 < SlottedEdge(1, 3, 2))
+        self.assertTrue(FrozenEdge(1, 2) <= FrozenEdge(1, 3))
+        self.assertEqual(sorted([FrozenEdge(1, 3, 2), FrozenEdge(1, 2)]),
+            [FrozenEdge(1, 2), FrozenEdge(1, 3, 2)])
+
+    def test_hash(self):
+        # Compatible with Edge, all classes can be mixed in sets.
+        self.assertEqual(hash(self.edge1), hash(Edge(2, 4)))
+        self.assertEqual(hash(self.edge2), hash(Edge("A", "B", 5)))
+        aset = set([self.edge1, Edge(2, 4), self.edge2, ~self.edge2])
+        self.assertEqual(len(aset), 3)
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.edge1, "__dict__"))
+        self.assertFalse(hasattr(self.edge2, "__dict__"))
+        self.edge1.weight = 7
+        self.assertEqual(self.edge1, SlottedEdge(2, 4, 7))
+        self.assertRaises(AttributeError, setattr, self.edge1, "color", 1)
+
+    def test_frozen(self):
+        self.assertRaises(AttributeError, setattr, self.edge2, "weight", 1)
+        self.assertRaises(AttributeError, delattr, self.edge2, "source")
+        self.assertEqual(self.edge2.weight, 5)
+
+    def test_pickle(self):
+        for edge in (self.edge1, self.edge2):
+            self.assertEqual(pickle.loads(pickle.dumps(edge)), edge)
+            self.assertEqual(copy.copy(edge), edge)
+            self.assertEqual(copy.deepcopy(edge), edge)
+        self.assertTrue(isinstance(
+            pickle.loads(pickle.dumps(self.edge2)), FrozenEdge))
+
+    def test_graph(self):
+        class FrozenGraph(Graph):
+            edge_class = FrozenEdge
+        G = FrozenGraph(n=3)
+        G.add_edge((0, 1))   # tuple fast path
+        G.add_edge(Edge(1, 2, 3))
+        self.assertTrue(isinstance(G[0][1], FrozenEdge))
+        self.assertTrue(isinstance(G[1][0], FrozenEdge))   # ~edge
+        self.assertEqual(G[2][1], Edge(2, 1, 3))
+        self.assertEqual(G.e(), 2)
+        T = G.copy()
+        self.assertTrue(isinstance(T, FrozenGraph))
+        self.assertTrue(isinstance(T[1][0], FrozenEdge))
+
+    def tearDown(self): pass
+
 if __name__ == "__main__":
 
     unittest.main()
@@ -3,6 +3,8 @@
 import unittest
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.graphs import Graph
+from graphtheory.structures.matrixgraphs import Graph as MatrixGraph
+from graphtheory.structures import factory
 from graphtheory.structures.factory import GraphFactory
 from graphtheory.planarity.wheels import is_wheel
 
@@ -212,6 +214,80 @@ class TestGraphFactory(unittest.TestCase):
         self.assertRaises(ValueError, self.graph_factory.make_fake_wheel, 5)
         self.assertRaises(ValueError, self.graph_factory.make_fake_wheel, 6)
 
+    def test_from_edges(self):
+        rows = [(0, 1, 5), (1, 2, 6), (2, 3, 7)]
+        G = self.graph_factory.make_from_edges(rows)
+        self.assertEqual(G.e(), 3)
+        self.assertEqual(G.weight((2, 1)), 6)
+        G = GraphFactory(MatrixGraph).make_from_edges(rows, directed=True)
+        self.assertEqual(G.v(), 4)
+        self.assertEqual(G.e(), 3)
+        self.assertEqual(G.weight((2, 3)), 7)
+
+    def test_edge_counter(self):
+        class CheckedGraph(Graph):
+            check_edges = True   # e() compares the counter with count_edges()
+        gf = GraphFactory(CheckedGraph)
+        for G in [gf.make_complete(n=self.N), gf.make_sparse(n=self.N, m=15),
+                gf.make_connected(n=self.N, m=15), gf.make_random(n=self.N),
+                gf.make_grid_periodic(size=4), gf.make_flow_network(n=self.N),
+                gf.make_fake_wheel(n=7)]:
+            self.assertEqual(G.e(), G.count_edges())
+
+    def test_seed(self):
+        gf = self.graph_factory
+        G1 = gf.make_random(n=100, edge_probability=0.1, seed=7)
+        G2 = gf.make_random(n=100, edge_probability=0.1, seed=7)
+        self.assertEqual(G1, G2)
+        self.assertEqual(gf.make_sparse(n=100, m=300, seed=1),
+            gf.make_sparse(n=100, m=300, seed=1))
+        self.assertEqual(gf.make_random(n=self.N, edge_probability=1).e(),
+            self.N * (self.N-1) // 2)
+        self.assertEqual(gf.make_random(n=self.N, edge_probability=0).e(), 0)
+
+    def test_barabasi_albert(self):
+        n, m = 100, 3
+        G = self.graph_factory.make_barabasi_albert(n=n, m=m, seed=5)
+        self.assertEqual(G.v(), n)
+        self.assertEqual(G.e(), m * (n-m))
+        aset = set(edge.weight for edge in G.iteredges())
+        self.assertEqual(G.e(), len(aset))
+        self.assertTrue(all(G.degree(node) >= m for node in G.iternodes()))
+        self.assertRaises(ValueError,
+            self.graph_factory.make_barabasi_albert, 3, 3)
+
+    def test_rmat(self):
+        scale, edge_factor = 8, 4
+        G = self.graph_factory.make_rmat(scale=scale, edge_factor=edge_factor,
+            directed=True, seed=3)
+        self.assertTrue(G.is_directed())
+        self.assertEqual(G.v(), 2 ** scale)
+        self.assertTrue(0 < G.e() <= edge_factor * 2 ** scale)
+        aset = set(edge.weight for edge in G.iteredges())
+        self.assertEqual(G.e(), len(aset))
+        # Skewed degrees, node 0 is in the quadrant a.
+        self.assertTrue(G.outdegree(0) > 2 * edge_factor)
+        self.assertRaises(ValueError, self.graph_factory.make_rmat, 4, 4, 0.9)
+
+    def test_without_numpy(self):
+        old_numpy, factory.numpy = factory.numpy, None
+        try:
+            gf = self.graph_factory
+            G = gf.make_random(n=50, edge_probability=0.2, seed=2)
+            self.assertEqual(G, gf.make_random(n=50, edge_probability=0.2,
+                seed=2))
+            aset = set(edge.weight for edge in G.iteredges())
+            self.assertEqual(G.e(), len(aset))
+            self.assertEqual(gf.make_sparse(n=50, m=100).e(), 100)
+            G = gf.make_bipartite(5, 6, edge_probability=0.5)
+            for edge in G.iteredges():
+                self.assertEqual(edge.source < 5, edge.target >= 5)
+            self.assertEqual(gf.make_grid(4).e(), 2 * 4 * 3)
+            G = gf.make_rmat(scale=6, edge_factor=4, seed=1)
+            self.assertTrue(0 < G.e() <= 4 * 2 ** 6)
+        finally:
+            factory.numpy = old_numpy
+
     def tearDown(self): pass
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import unittest
+import numpy
 from graphtheory.structures.edges import Edge
 from graphtheory.structures.matrixgraphs2 import Graph
 
@@ -270,6 +271,89 @@ class TestGraphLadder(unittest.TestCase):
 
     def tearDown(self): pass
 
+class TestEdgeCounter(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 6           # number of nodes
+        self.edges = [
+            Edge(0, 1, 2), Edge(1, 2, 3), Edge(2, 0, 4), Edge(2, 3, 5),
+            Edge(3, 4, 6), Edge(4, 5, 7), Edge(5, 3, 8)]
+
+    def make_graph(self, **kwargs):
+        G = Graph(n=self.N, **kwargs)
+        G.check_edges = True   # e() compares the counter with count_edges()
+        for edge in self.edges:
+            G.add_edge(edge)
+        return G
+
+    def test_counter(self):
+        for kwargs in [{}, {"directed": True}]:
+            G = self.make_graph(**kwargs)
+            self.assertEqual(G.e(), 7)
+            self.assertRaises(ValueError, G.add_edge, Edge(0, 1))
+            self.assertEqual(G.e(), 7)
+            G.del_edge((3, 4))
+            self.assertEqual(G.e(), 6)
+            G.del_node(2)   # three edges are removed
+            self.assertEqual(G.e(), 3)
+            for T in (G.copy(), G.transpose(), G.complement()):
+                T.check_edges = True
+                T.e()
+            H = Graph(n=self.N, directed=G.is_directed())
+            H.add_edge(Edge(0, 4))
+            G.add_graph(H)
+            self.assertEqual(G.e(), 4)
+
+    def test_inconsistent(self):
+        G = self.make_graph()
+        G.m = 0
+        self.assertRaises(ValueError, G.e)
+
+    def tearDown(self): pass
+
+class TestBulkLoading(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 6           # number of nodes
+        self.edges = [
+            Edge(0, 1, 2), Edge(1, 2, 3), Edge(2, 0, 4), Edge(2, 3, 5),
+            Edge(3, 4, 6), Edge(4, 5, 7), Edge(5, 3, 8)]
+
+    def test_add_edges_from(self):
+        for directed in (False, True):
+            G = Graph(n=self.N, directed=directed)
+            for edge in self.edges:
+                G.add_edge(edge)
+            T = Graph(n=self.N, directed=directed)
+            T.check_edges = True
+            T.add_edges_from(self.edges)
+            self.assertEqual(T, G)
+            self.assertEqual(T.e(), len(self.edges))
+            rows = [(edge.source, edge.target, edge.weight)
+                for edge in self.edges]
+            T = Graph.from_edge_list(rows, n=self.N, directed=directed)
+            self.assertEqual(T, G)
+            T = Graph.from_edge_list(numpy.array(rows), directed=directed)
+            self.assertEqual(T, G)
+            T = Graph.from_edge_list(numpy.array(rows, dtype=float),
+                directed=directed)
+            self.assertEqual(T, G)
+            T = Graph.from_edge_list(numpy.array(rows)[:, :2],
+                n=self.N, directed=directed)
+            self.assertEqual(T.e(), len(self.edges))
+            self.assertTrue(T.has_edge((2, 3)))
+            self.assertEqual(T.weight((2, 3)), 1)
+
+    def test_errors(self):
+        G = Graph(n=self.N)
+        G.check_edges = True
+        self.assertRaises(ValueError, G.add_edges_from, [(0, 1), (1, 1)])
+        self.assertRaises(ValueError, G.add_edges_from, [(1, 2), (2, 1)])
+        self.assertEqual(G.e(), 2)   # edges before the error are added
+        self.assertRaises(ValueError, G.add_edges_from, numpy.zeros((2, 4)))
+
+    def tearDown(self): pass
+
 if __name__ == "__main__":
 
     unittest.main()
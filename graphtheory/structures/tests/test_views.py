@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+import unittest
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.structures.views import SubgraphView
+from graphtheory.structures.views import TransposeView
+from graphtheory.structures.views import ComplementView
+from graphtheory.structures.views import MaskedView
+from graphtheory.structures.views import graph_class
+from graphtheory.traversing.bfs import SimpleBFS
+from graphtheory.traversing.dobfs import DirectionOptimizingBFS
+from graphtheory.traversing.msbfs import BatchedBFS
+from graphtheory.connectivity.connected import ConnectedComponentsParallel
+
+# 0 --o 1 --o 2
+# o     |
+# |     o
+# 3 o-- 4     5
+
+class TestViewsDirected(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 6           # number of nodes
+        self.G = Graph(n=self.N, directed=True, inverse=True)
+        for node in range(self.N):
+            self.G.add_node(node)
+        self.edges = [Edge(0, 1, 5), Edge(1, 2, 3), Edge(1, 4),
+            Edge(4, 3, 2), Edge(3, 0)]
+        for edge in self.edges:
+            self.G.add_edge(edge)
+
+    def test_transpose(self):
+        T = TransposeView(self.G)
+        self.assertTrue(T.is_directed())
+        self.assertEqual(T.v(), self.N)
+        self.assertEqual(T.e(), 5)
+        self.assertTrue(T.has_edge((1, 0)))
+        self.assertFalse(T.has_edge((0, 1)))
+        self.assertEqual(T.weight((1, 0)), 5)
+        self.assertEqual(sorted(T.iteradjacent(1)), [0])
+        self.assertEqual(sorted(T.iterinedges(1)), [Edge(4, 1), Edge(2, 1, 3)])
+        self.assertEqual(T.outdegree(1), 1)
+        self.assertEqual(T.indegree(1), 2)
+        self.assertEqual(T, self.G.transpose())
+        self.assertEqual(T.materialize(), self.G.transpose())
+        self.assertTrue(T.transpose() is self.G)
+        self.assertRaises(ValueError, T.add_edge, Edge(0, 5))
+        self.assertRaises(ValueError, T.del_edge, Edge(1, 0))
+
+    def test_subgraph(self):
+        S = SubgraphView(self.G, [0, 1, 4, 5])
+        self.assertEqual(S.v(), 4)
+        self.assertEqual(S.e(), 2)
+        self.assertTrue(S.has_node(5))
+        self.assertFalse(S.has_node(2))
+        self.assertFalse(S.has_edge((1, 2)))
+        self.assertEqual(S.weight((1, 2)), 0)
+        self.assertEqual(sorted(S.iteredges()), [Edge(1, 4), Edge(0, 1, 5)])
+        self.assertEqual(S.indegree(0), 0)
+        self.assertEqual(S, self.G.subgraph([0, 1, 4, 5]))
+        self.assertRaises(ValueError, SubgraphView, self.G, [0, 7])
+        self.G.add_edge(Edge(5, 0))   # changes are visible in the view
+        self.assertEqual(S.e(), 3)
+        self.assertEqual(S.materialize().e(), 3)
+
+    def test_complement(self):
+        C = ComplementView(self.G)
+        self.assertEqual(C.e(), self.N * (self.N-1) - 5)
+        self.assertFalse(C.has_edge((0, 1)))
+        self.assertTrue(C.has_edge((1, 0)))
+        self.assertFalse(C.has_edge((2, 2)))
+        self.assertEqual(C.outdegree(1), 3)
+        self.assertEqual(C.indegree(0), 4)
+        self.assertEqual(sorted(C.iterinedges(1)),
+            [Edge(2, 1), Edge(3, 1), Edge(4, 1), Edge(5, 1)])
+        self.assertEqual(C, self.G.complement())
+        self.assertEqual(C.materialize(), self.G.complement())
+
+    def test_masked(self):
+        H = MaskedView(self.G, hidden_nodes=[5], hidden_edges=[(1, 4)])
+        self.assertEqual(H.v(), self.N - 1)
+        self.assertEqual(H.e(), 4)
+        self.assertFalse(H.has_node(5))
+        self.assertFalse(H.has_edge((1, 4)))
+        self.assertEqual(H.weight((0, 1)), 5)
+        self.assertEqual(sorted(H.iteradjacent(1)), [2])
+        self.assertEqual(list(H.iterinedges(4)), [])
+        H.hidden_nodes.add(0)
+        self.assertEqual(H.e(), 2)
+        self.assertEqual(list(H.iteroutedges(0)), [])
+        H.hidden_edges.clear()
+        self.assertEqual(H.outdegree(1), 2)
+        self.assertEqual(H.materialize(), self.G.subgraph([1, 2, 3, 4]))
+
+    def test_algorithms(self):
+        S = SubgraphView(TransposeView(self.G), [0, 1, 2, 3, 4])
+        algorithm = SimpleBFS(S)   # the BFS tree is Graph
+        algorithm.run(2)
+        self.assertEqual(algorithm.parent,
+            {2: None, 1: 2, 0: 1, 3: 0, 4: 3})
+        self.assertTrue(isinstance(algorithm.dag, Graph))
+
+    def tearDown(self): pass
+
+
+class TestViewsUndirected(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 5           # number of nodes
+        self.edges = [Edge(0, 1), Edge(1, 2), Edge(2, 3), Edge(3, 4)]
+        self.G = CSRGraph.from_edge_list(self.edges)
+
+    def test_views(self):
+        H = self.G.to_graph()
+        T = TransposeView(self.G)
+        self.assertEqual(T, H)
+        self.assertEqual(T.degree(2), 2)
+        C = ComplementView(self.G)
+        self.assertEqual(C.e(), 6)
+        self.assertEqual(C.degree(0), 3)
+        self.assertEqual(sorted(C.iteradjacent(2)), [0, 4])
+        self.assertEqual(C, H.complement())
+        S = C.subgraph([0, 2, 4])   # the view of the view
+        self.assertEqual(S.e(), 3)
+        self.assertEqual(S.materialize(graph_class=Graph),
+            H.complement().subgraph([0, 2, 4]))
+        self.assertRaises(ValueError, S.add_node, 5)
+        M = MaskedView(self.G, hidden_edges=[(2, 1)])   # both directions
+        self.assertEqual(M.e(), 3)
+        self.assertFalse(M.has_edge((1, 2)))
+        self.assertEqual(M.degree(1), 1)
+
+    def test_class(self):
+        S = SubgraphView(self.G, [0, 1, 2])
+        self.assertFalse(isinstance(S, CSRGraph))   # no spoofing
+        self.assertEqual(graph_class(S), CSRGraph)
+        self.assertEqual(graph_class(S.complement()), CSRGraph)
+        self.assertEqual(graph_class(self.G), CSRGraph)
+
+    def test_csr_algorithms(self):
+        # CSR arrays are built from views (CSRGraph.from_graph).
+        S = SubgraphView(self.G, [0, 1, 2, 3])   # the path 0-1-2-3
+        algorithm = DirectionOptimizingBFS(S)
+        algorithm.run(0)
+        self.assertEqual(algorithm.get_level(3), 3)
+        self.assertEqual(algorithm.path(0, 3), [0, 1, 2, 3])
+        M = MaskedView(self.G, hidden_edges=[(1, 2)])
+        algorithm = ConnectedComponentsParallel(M, workers=1)
+        algorithm.run()
+        self.assertEqual(algorithm.n_cc, 2)
+        algorithm = BatchedBFS(M)
+        algorithm.run([0])
+        self.assertEqual(list(algorithm.distance[0]), [0, 1, -1, -1, -1])
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+#
+# Dense graphs: matrixgraphs.Graph vs BitsetGraph.
+# Testing test_has_edge Graph ...
+# 1000 0.0011117409999314987
+# Testing test_has_edge BitsetGraph ...
+# 1000 0.0009347719999368564
+# Testing test_degree Graph ...
+# 1000 0.06084588099997745
+# Testing test_degree BitsetGraph ...
+# 1000 0.00019023000004381174
+# Testing test_common_neighbors Graph ...
+# 1000 0.17936694200011516
+# Testing test_common_neighbors BitsetGraph ...
+# 1000 0.27812562799999796
+# Testing test_common_neighbors_bitset BitsetGraph ...
+# 1000 0.00045801399983247393
+
+import timeit
+import random
+from graphtheory.structures.matrixgraphs import Graph as MatrixGraph
+from graphtheory.structures.bitsetgraphs import BitsetGraph, popcount
+
+N = 1000   # number of nodes
+p = 0.5   # edge probability
+
+edges = [(source, target) for source in range(N)
+    for target in range(source + 1, N) if random.random() < p]
+queries = [(random.randrange(N), random.randrange(N)) for _ in range(N)]
+
+G1 = MatrixGraph.from_edge_list(edges, n=N)
+G2 = BitsetGraph.from_edge_list(edges, n=N)
+
+def test_has_edge(graph):
+    for (source, target) in queries:
+        graph.has_edge((source, target))
+
+def test_degree(graph):
+    for node in range(N):
+        graph.degree(node)
+
+def test_common_neighbors(graph):
+    for (source, target) in queries:
+        len(set(graph.iteradjacent(source)) & set(graph.iteradjacent(target)))
+
+def test_common_neighbors_bitset(graph):
+    for (source, target) in queries:
+        popcount(graph.intersection([source, target]))
+
+for func, graph in ((test_has_edge, G1), (test_has_edge, G2),
+                    (test_degree, G1), (test_degree, G2),
+                    (test_common_neighbors, G1), (test_common_neighbors, G2),
+                    (test_common_neighbors_bitset, G2)):
+    print("Testing {} {} ...".format(func.__name__, graph.__class__.__name__))
+    t1 = timeit.Timer(lambda: func(graph))
+    print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+#
+# Loading edges with add_edge() and add_edges_from().
+# Testing test_add_edge graphtheory.structures.graphs ...
+# 1000000 5.1653530500000215
+# Testing test_add_edges_from_tuples graphtheory.structures.graphs ...
+# 1000000 4.0435402890000205
+# Testing test_add_edges_from_array graphtheory.structures.graphs ...
+# 1000000 3.634296994999886
+# Testing test_add_edge graphtheory.structures.dictgraphs ...
+# 1000000 3.733857733999912
+# Testing test_add_edges_from_tuples graphtheory.structures.dictgraphs ...
+# 1000000 2.435084183000072
+# Testing test_add_edges_from_array graphtheory.structures.dictgraphs ...
+# 1000000 2.635146034000172
+# Testing test_add_edge graphtheory.structures.setgraphs ...
+# 1000000 2.547390564000125
+# Testing test_add_edges_from_tuples graphtheory.structures.setgraphs ...
+# 1000000 1.7446592050000618
+# Testing test_add_edges_from_array graphtheory.structures.setgraphs ...
+# 1000000 1.7047014050001508
+
+import timeit
+import random
+import numpy
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.dictgraphs import Graph as DictGraph
+from graphtheory.structures.setgraphs import Graph as SetGraph
+
+N = 100000   # number of nodes
+M = 1000000   # number of edges
+
+rows = set()
+while len(rows) < M:
+    source, target = random.randrange(N), random.randrange(N)
+    if source != target:
+        rows.add((source, target))
+rows = [(source, target, random.random()) for (source, target) in rows]
+array = numpy.array(rows)
+
+def test_add_edge(graph_class):
+    G = graph_class(directed=True)
+    for row in rows:
+        G.add_edge(row[:2])
+
+def test_add_edges_from_tuples(graph_class):
+    G = graph_class(directed=True)
+    G.add_edges_from(rows)
+
+def test_add_edges_from_array(graph_class):
+    G = graph_class(directed=True)
+    G.add_edges_from(array)
+
+for graph_class in (Graph, DictGraph, SetGraph):
+    for func in (test_add_edge,
+                test_add_edges_from_tuples, test_add_edges_from_array):
+        print("Testing {} {} ...".format(func.__name__, graph_class.__module__))
+        t1 = timeit.Timer(lambda: func(graph_class))
+        print("{} {}".format(M, t1.timeit(1)))
+
+# EOF
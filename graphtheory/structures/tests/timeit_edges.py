@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+#
+# Memory per edge (tracemalloc) and add_edge() throughput.
+# Memory per Edge [bytes] 96.0
+# Memory per SlottedEdge [bytes] 56.0
+# Memory per FrozenEdge [bytes] 64.0
+# Testing constructor Edge ...
+# 100000 0.02573730800031626
+# Testing constructor SlottedEdge ...
+# 100000 0.020528202000605233
+# Testing constructor FrozenEdge ...
+# 100000 0.03814127700024983
+# Testing test_add_edge_objects Graph ...
+# 100000 0.13764510799956042
+# Testing test_add_edge_tuples Graph ...
+# 100000 0.14731893299995136
+# Testing test_add_edge_objects SlottedGraph ...
+# 100000 0.15051778099950752
+# Testing test_add_edge_tuples SlottedGraph ...
+# 100000 0.13404947800063383
+# Testing test_add_edge_objects FrozenGraph ...
+# 100000 0.18733642600000167
+# Testing test_add_edge_tuples FrozenGraph ...
+# 100000 0.1722971819999657
+#
+# SlottedEdge saves 40 bytes per edge and is the fastest to create.
+# FrozenEdge saves 32 bytes (the hash is computed on demand), it is
+# created about 1.5 times slower than Edge (slot descriptors are used,
+# __setattr__ is blocked). add_edge() time is dominated by the dict
+# operations in Graph, differences between edge classes are small
+# (the best of 3 runs, the noise is about 20%).
+
+import timeit
+import tracemalloc
+from graphtheory.structures.edges import Edge, SlottedEdge, FrozenEdge
+from graphtheory.structures.graphs import Graph
+
+N = 100000   # number of edges
+
+class SlottedGraph(Graph):
+    edge_class = SlottedEdge
+
+class FrozenGraph(Graph):
+    edge_class = FrozenEdge
+
+def memory_per_edge(edge_class):
+    tracemalloc.start()
+    snapshot1 = tracemalloc.take_snapshot()
+    L = [edge_class(0, 1) for i in range(N)]
+    snapshot2 = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot2.compare_to(snapshot1, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    return float(size - 8 * N) / N   # without list pointers
+
+def test_add_edge_objects(graph_class):
+    G = graph_class(n=N, directed=True)
+    for i in range(N):
+        G.add_edge(graph_class.edge_class(i, i+1))
+
+def test_add_edge_tuples(graph_class):
+    G = graph_class(n=N, directed=True)
+    for i in range(N):
+        G.add_edge((i, i+1))
+
+for edge_class in (Edge, SlottedEdge, FrozenEdge):
+    print("Memory per {} [bytes] {:.1f}".format(
+        edge_class.__name__, memory_per_edge(edge_class)))
+
+for edge_class in (Edge, SlottedEdge, FrozenEdge):
+    print("Testing constructor {} ...".format(edge_class.__name__))
+    t1 = timeit.Timer(lambda: [edge_class(0, 1) for i in range(N)])
+    print("{} {}".format(N, min(t1.repeat(3, 1))))   # the best of 3
+
+for graph_class in (Graph, SlottedGraph, FrozenGraph):
+    for func in (test_add_edge_objects, test_add_edge_tuples):
+        print("Testing {} {} ...".format(func.__name__, graph_class.__name__))
+        t1 = timeit.Timer(lambda: func(graph_class))
+        print("{} {}".format(N, min(t1.repeat(3, 1))))   # the best of 3
+
+# EOF
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+# Random graph generators with one million nodes (bulk loading).
+# Most of the time is spent in Graph.add_edges_from().
+# The old make_random() would check 5 * 10**11 pairs.
+# Testing test_make_random ...
+# 1000000 10.446209042999726
+# Testing test_make_sparse ...
+# 1000000 12.419672081000044
+# Testing test_make_bipartite ...
+# 1000000 9.22389743299982
+# Testing test_make_grid ...
+# 1000000 5.735119692999888
+# Testing test_make_barabasi_albert ...
+# 1000000 14.993789958999969
+# Testing test_make_rmat ...
+# 1000000 11.648735662000036
+
+import timeit
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+
+N = 1000000   # number of nodes
+M = 2000000   # number of edges (expected)
+gf = GraphFactory(Graph)
+
+def test_make_random():
+    gf.make_random(n=N, edge_probability=2.0 * M / (N * (N-1)), seed=1)
+
+def test_make_sparse():
+    gf.make_sparse(n=N, m=M, seed=1)
+
+def test_make_bipartite():
+    gf.make_bipartite(N // 2, N // 2, edge_probability=4.0 * M / (N * N), seed=1)
+
+def test_make_grid():
+    gf.make_grid(size=1000, seed=1)
+
+def test_make_barabasi_albert():
+    gf.make_barabasi_albert(n=N, m=2, seed=1)
+
+def test_make_rmat():
+    gf.make_rmat(scale=20, edge_factor=2, seed=1)
+
+for func in (test_make_random, test_make_sparse, test_make_bipartite,
+            test_make_grid, test_make_barabasi_albert, test_make_rmat):
+    print("Testing {} ...".format(func.__name__))
+    t1 = timeit.Timer(func)
+    print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+# Building new graphs vs graph views (one pass over all edges).
+# Testing test_transpose ...
+# 500 0.0398105519998353
+# Testing test_transpose_view ...
+# 500 0.013106872000207659
+# Testing test_complement ...
+# 500 0.5920247470003233
+# Testing test_complement_view ...
+# 500 0.18578559900015534
+# Testing test_subgraph ...
+# 500 0.01135624500011545
+# Testing test_subgraph_view ...
+# 500 0.0032867129998521705
+
+import timeit
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.factory import GraphFactory
+from graphtheory.structures.views import SubgraphView
+from graphtheory.structures.views import TransposeView
+from graphtheory.structures.views import ComplementView
+
+N = 500   # number of nodes
+graph_factory = GraphFactory(Graph)
+G = graph_factory.make_random(n=N, directed=True, edge_probability=0.1)
+H = Graph(n=N, directed=True, inverse=True)
+H.add_graph(G)
+nodes = list(range(0, N, 2))
+
+def test_transpose():
+    for edge in G.transpose().iteredges(): pass
+
+def test_transpose_view():
+    for edge in TransposeView(H).iteredges(): pass
+
+def test_complement():
+    for edge in G.complement().iteredges(): pass
+
+def test_complement_view():
+    for edge in ComplementView(G).iteredges(): pass
+
+def test_subgraph():
+    for edge in G.subgraph(nodes).iteredges(): pass
+
+def test_subgraph_view():
+    for edge in SubgraphView(G, nodes).iteredges(): pass
+
+for func in (test_transpose, test_transpose_view,
+            test_complement, test_complement_view,
+            test_subgraph, test_subgraph_view):
+    print("Testing {} ...".format(func.__name__))
+    t1 = timeit.Timer(func)
+    print("{} {}".format(N, t1.timeit(1)))
+
+# EOF
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.basegraphs import BaseGraph
+
+
+def graph_class(graph):
+    """Return the class for new graphs made from graph.
+
+    Algorithms create results with graph_class(graph)(n=..., directed=...).
+    For views it is the class of the underlying graph.
+    """
+    return getattr(graph, "graph_class", graph.__class__)
+
+
+class GraphView(BaseGraph):
+    """The base class for read-only graph views.
+
+    A view keeps a reference to the underlying graph and computes
+    nodes and edges on demand, nothing is copied. Changes
+    of the underlying graph are visible in the view.
+    Use materialize() to get a new independent graph.
+    Views of graphs.Graph can not be used as dicts (G[node]).
+    """
+
+    def __init__(self, graph):
+        """Load up a GraphView instance."""
+        self.graph = graph
+        self.edge_class = getattr(graph, "edge_class", Edge)
+        self.graph_class = graph_class(graph)   # for new graphs
+
+    def is_directed(self):
+        """Test if the graph is directed."""
+        return self.graph.is_directed()
+
+    def _read_only(self, *arguments):
+        """Modifications are forbidden."""
+        raise ValueError("the view is read-only")
+
+    add_node = _read_only
+    del_node = _read_only
+    add_edge = _read_only
+    del_edge = _read_only
+    add_graph = _read_only
+
+    def materialize(self, graph_class=None):
+        """Return a new graph with nodes and edges from the view.
+
+        Parameters
+        ----------
+        graph_class : class, optional (default: the underlying graph class)
+        """
+        if graph_class is None:
+            graph_class = self.graph_class
+        new_graph = graph_class(n=self.graph.v(), directed=self.is_directed())
+        for node in self.iternodes():
+            new_graph.add_node(node)
+        new_graph.add_edges_from(self.iteredges())
+        return new_graph
+
+    def copy(self):
+        """Return the graph copy (a new graph, not a view)."""
+        return self.materialize()
+
+    def transpose(self):
+        """Return the transpose view."""
+        return TransposeView(self)
+
+    def complement(self):
+        """Return the complement view."""
+        return ComplementView(self)
+
+    def subgraph(self, nodes):
+        """Return the induced subgraph view."""
+        return SubgraphView(self, nodes)
+
+    def show(self):
+        """The graph presentation."""
+        L = []
+        for source in self.iternodes():
+            L.append("{} : ".format(source))
+            for edge in self.iteroutedges(source):
+                if edge.weight == 1:
+                    L.append("{} ".format(edge.target))
+                else:
+                    L.append("{}({}) ".format(edge.target, edge.weight))
+            L.append("\n")
+        print("".join(L))
+
+    def __eq__(self, other):
+        """Test if the graphs are equal."""
+        if self.is_directed() is not other.is_directed():
+            return False
+        if self.v() != other.v() or self.e() != other.e():
+            return False
+        if any(not other.has_node(node) for node in self.iternodes()):
+            return False
+        for edge in self.iteredges():
+            if not other.has_edge(edge):
+                return False
+            if other.weight(edge) != edge.weight:
+                return False
+        return True
+
+    def __ne__(self, other):
+        """Test if the graphs are not equal."""
+        return not self == other
+
+
+class SubgraphView(GraphView):
+    """The induced subgraph view (edges with both ends in nodes).
+
+    Examples
+    --------
+    >>> from graphtheory.structures.views import SubgraphView
+    >>> H = SubgraphView(G, [0, 1, 2])
+    >>> H.has_edge((0, 3))   # False, 3 is not in H
+    >>> H = H.materialize()   # a new graph
+    """
+
+    def __init__(self, graph, nodes):
+        """Load up a SubgraphView instance.
+
+        Parameters
+        ----------
+        graph : the underlying graph
+        nodes : iterable of nodes from the graph
+        """
+        GraphView.__init__(self, graph)
+        self.node_set = set(nodes)
+        if any(not graph.has_node(node) for node in self.node_set):
+            raise ValueError("nodes not from the graph")
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return len(self.node_set)
+
+    def e(self):
+        """Return the number of edges in O(V+E) time."""
+        edges = sum(self.outdegree(node) for node in self.node_set)
+        return (edges if self.is_directed() else edges // 2)
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        return node in self.node_set
+
+    def has_edge(self, edge):
+        """Test if an edge exists (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return (source in self.node_set and target in self.node_set
+            and self.graph.has_edge(edge))
+
+    def weight(self, edge):
+        """Return the edge weight or zero."""
+        if self.has_edge(edge):
+            return self.graph.weight(edge)
+        return 0
+
+    def iternodes(self):
+        """Generate all nodes from the graph on demand."""
+        return iter(self.node_set)
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        for target in self.graph.iteradjacent(source):
+            if target in self.node_set:
+                yield target
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        for edge in self.graph.iteroutedges(source):
+            if edge.target in self.node_set:
+                yield edge
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        for edge in self.graph.iterinedges(source):
+            if edge.source in self.node_set:
+                yield edge
+
+    def iteredges(self):
+        """Generate all edges from the graph on demand."""
+        for source in self.node_set:
+            for edge in self.iteroutedges(source):
+                if self.is_directed() or edge.source < edge.target:
+                    yield edge
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        if self.is_directed():
+            raise ValueError("the graph is directed")
+        return self.outdegree(source)
+
+    def outdegree(self, source):
+        """Return the outdegree of the node."""
+        return sum(1 for _ in self.iteradjacent(source))
+
+    def indegree(self, source):
+        """Return the indegree of the node."""
+        return sum(1 for _ in self.iterinedges(source))
+
+
+class MaskedView(GraphView):
+    """The view without hidden nodes and edges (a masked graph).
+
+    Sets of hidden nodes and edges can be changed between queries,
+    so one view can be reused by many searches (e.g. spur searches
+    in the Yen algorithm).
+
+    Examples
+    --------
+    >>> from graphtheory.structures.views import MaskedView
+    >>> H = MaskedView(G, hidden_nodes=[0], hidden_edges=[(1, 2)])
+    >>> H.has_edge((1, 2))   # False
+    >>> H.hidden_edges.clear()   # (1, 2) is visible again
+    """
+
+    def __init__(self, graph, hidden_nodes=(), hidden_edges=()):
+        """Load up a MaskedView instance.
+
+        Parameters
+        ----------
+        graph : the underlying graph
+        hidden_nodes : iterable of nodes
+        hidden_edges : iterable of pairs (source, target), both directions
+            are hidden for undirected graphs
+        """
+        GraphView.__init__(self, graph)
+        self.hidden_nodes = set(hidden_nodes)
+        self.hidden_edges = set(hidden_edges)
+
+    def _is_visible(self, source, target):
+        """Test if the edge (source, target) is not hidden."""
+        if source in self.hidden_nodes or target in self.hidden_nodes:
+            return False
+        if (source, target) in self.hidden_edges:
+            return False
+        return self.is_directed() or (target, source) not in self.hidden_edges
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return sum(1 for _ in self.iternodes())
+
+    def e(self):
+        """Return the number of edges in O(V+E) time."""
+        return sum(1 for _ in self.iteredges())
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        return node not in self.hidden_nodes and self.graph.has_node(node)
+
+    def has_edge(self, edge):
+        """Test if an edge exists (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return self._is_visible(source, target) and self.graph.has_edge(edge)
+
+    def weight(self, edge):
+        """Return the edge weight or zero."""
+        if self.has_edge(edge):
+            return self.graph.weight(edge)
+        return 0
+
+    def iternodes(self):
+        """Generate all nodes from the graph on demand."""
+        for node in self.graph.iternodes():
+            if node not in self.hidden_nodes:
+                yield node
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        for target in self.graph.iteradjacent(source):
+            if self._is_visible(source, target):
+                yield target
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        for edge in self.graph.iteroutedges(source):
+            if self._is_visible(source, edge.target):
+                yield edge
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        for edge in self.graph.iterinedges(source):
+            if self._is_visible(edge.source, source):
+                yield edge
+
+    def iteredges(self):
+        """Generate all edges from the graph on demand."""
+        for edge in self.graph.iteredges():
+            if self._is_visible(edge.source, edge.target):
+                yield edge
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        if self.is_directed():
+            raise ValueError("the graph is directed")
+        return self.outdegree(source)
+
+    def outdegree(self, source):
+        """Return the outdegree of the node."""
+        return sum(1 for _ in self.iteradjacent(source))
+
+    def indegree(self, source):
+        """Return the indegree of the node."""
+        return sum(1 for _ in self.iterinedges(source))
+
+
+class TransposeView(GraphView):
+    """The transpose view (edges are reversed on demand).
+
+    Outedges of the view are inedges of the underlying graph,
+    so the view is fast for graphs with fast iterinedges
+    (graphs.Graph with inverse=True, CSRGraph).
+    """
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return self.graph.v()
+
+    def e(self):
+        """Return the number of edges."""
+        return self.graph.e()
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        return self.graph.has_node(node)
+
+    def has_edge(self, edge):
+        """Test if an edge exists (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return self.graph.has_edge((target, source))
+
+    def weight(self, edge):
+        """Return the edge weight or zero."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return self.graph.weight((target, source))
+
+    def iternodes(self):
+        """Generate all nodes from the graph on demand."""
+        return self.graph.iternodes()
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        if not self.is_directed():
+            return self.graph.iteradjacent(source)
+        return (edge.source for edge in self.graph.iterinedges(source))
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        for edge in self.graph.iterinedges(source):
+            yield ~edge
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        for edge in self.graph.iteroutedges(source):
+            yield ~edge
+
+    def iteredges(self):
+        """Generate all edges from the graph on demand."""
+        for edge in self.graph.iteredges():
+            yield ~edge
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        return self.graph.degree(source)
+
+    def outdegree(self, source):
+        """Return the outdegree of the node."""
+        return self.graph.indegree(source)
+
+    def indegree(self, source):
+        """Return the indegree of the node."""
+        return self.graph.outdegree(source)
+
+    def transpose(self):
+        """Return the underlying graph (the transpose of the transpose)."""
+        return self.graph
+
+
+class ComplementView(GraphView):
+    """The complement view (edges missing in the graph, no loops).
+
+    Edges have weight 1. The view uses O(n) time per node instead of
+    O(n^2) has_edge() calls needed to build the complement.
+    """
+
+    def v(self):
+        """Return the number of nodes (the graph order)."""
+        return self.graph.v()
+
+    def e(self):
+        """Return the number of edges."""
+        n = self.graph.v()
+        edges = n * (n - 1)
+        return (edges if self.is_directed() else edges // 2) - self.graph.e()
+
+    def has_node(self, node):
+        """Test if a node exists."""
+        return self.graph.has_node(node)
+
+    def has_edge(self, edge):
+        """Test if an edge exists (the weight is not checked)."""
+        try:   # checking Edge interface
+            source, target = edge.source, edge.target
+        except AttributeError:
+            source, target = edge   # tuple or list
+        return (source != target and self.graph.has_node(source)
+            and self.graph.has_node(target)
+            and not self.graph.has_edge((source, target)))
+
+    def weight(self, edge):
+        """Return the edge weight (1) or zero."""
+        return (1 if self.has_edge(edge) else 0)
+
+    def iternodes(self):
+        """Generate all nodes from the graph on demand."""
+        return self.graph.iternodes()
+
+    def iteradjacent(self, source):
+        """Generate the adjacent nodes from the graph on demand."""
+        adjacent = set(self.graph.iteradjacent(source))
+        adjacent.add(source)
+        for target in self.graph.iternodes():
+            if target not in adjacent:
+                yield target
+
+    def iteroutedges(self, source):
+        """Generate the outedges from the graph on demand."""
+        for target in self.iteradjacent(source):
+            yield self.edge_class(source, target)
+
+    def iterinedges(self, source):
+        """Generate the inedges from the graph on demand."""
+        adjacent = set(edge.source for edge in self.graph.iterinedges(source))
+        adjacent.add(source)
+        for target in self.graph.iternodes():
+            if target not in adjacent:
+                yield self.edge_class(target, source)
+
+    def iteredges(self):
+        """Generate all edges from the graph on demand."""
+        for source in self.graph.iternodes():
+            for edge in self.iteroutedges(source):
+                if self.is_directed() or edge.source < edge.target:
+                    yield edge
+
+    def degree(self, source):
+        """Return the degree of the node in the undirected graph."""
+        return self.graph.v() - 1 - self.graph.degree(source)
+
+    def outdegree(self, source):
+        """Return the outdegree of the node."""
+        return self.graph.v() - 1 - self.graph.outdegree(source)
+
+    def indegree(self, source):
+        """Return the indegree of the node."""
+        return self.graph.v() - 1 - self.graph.indegree(source)
+
+# EOF
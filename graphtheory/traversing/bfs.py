@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import collections
+from graphtheory.structures.views import graph_class
 
 class BFSWithQueue:
     """Breadth-First Search.
@@ -46,7 +47,7 @@ class BFSWithQueue:
         self.color = dict(((node, "WHITE") for node in self.graph.iternodes()))
         self.distance = dict(((node, float("inf")) for node in self.graph.iternodes()))
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
 
@@ -143,7 +144,7 @@ class SimpleBFS:
         """The algorithm initialization."""
         self.graph = graph
         self.parent = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
 
@@ -231,7 +232,7 @@ class BFSWithDepthTracker:
         """The algorithm initialization."""
         self.graph = graph
         self.parent = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
 
@@ -1,7 +1,160 @@
 #!/usr/bin/env python3
 
-import sys
 import collections
+from array import array
+from graphtheory.structures.views import graph_class
+
+# Node states in DFSEngine.state.
+WHITE, GREY, BLACK = 0, 1, 2
+
+# Event kinds from DFSEngine.iterevents().
+PRE, POST, TREE, BACK, FORWARD, CROSS = range(6)
+EVENT_NAMES = ("PRE", "POST", "TREE", "BACK", "FORWARD", "CROSS")
+
+
+class DFSEngine:
+    """Iterative Depth-First Search engine with events.
+    
+    A stack of (node id, edge iterator) pairs is used instead of
+    a recursion, so very deep DFS trees (long paths) are allowed.
+    Node states and time stamps are kept in integer arrays indexed
+    by node ids. The engine generates events (kind, item):
+    (PRE, node) when node becomes GREY, (POST, node) when node
+    becomes BLACK, and (TREE, edge), (BACK, edge), (FORWARD, edge),
+    (CROSS, edge) for classified edges.
+    
+    Attributes
+    ----------
+    graph : input graph
+    nodes : list of nodes (node id -> node)
+    node_id : dict, node -> node id
+    state : bytearray with node ids (WHITE, GREY, BLACK)
+    time : number (time stamp)
+    dd : array with node ids ('GREY' time, 0 for WHITE nodes)
+    ff : array with node ids ('BLACK' time, 0 for not BLACK nodes)
+    parent : array with node ids (parent id in DFS tree, -1 for roots)
+    stack : list of node ids (GREY nodes, the current DFS path)
+    
+    Examples
+    --------
+    >>> from graphtheory.traversing.dfs import DFSEngine, PRE, POST, BACK
+    >>> engine = DFSEngine(G)
+    >>> for kind, item in engine.iterevents(source):
+    ...     if kind == BACK:
+    ...         print("cycle closed by {}".format(item))
+    >>> engine.run(source, post_action=lambda node: order.append(node))
+    
+    Notes
+    -----
+    In undirected graphs edges to the parent and edges to BLACK nodes
+    (back edges seen from the other end) are not reported,
+    FORWARD and CROSS edges are possible only in directed graphs.
+    
+    Cormen, T. H., Leiserson, C. E., Rivest, R. L., and Stein, C., 2009, 
+        Introduction to Algorithms, third edition, The MIT Press, 
+        Cambridge, London.
+    """
+
+    def __init__(self, graph):
+        """The algorithm initialization."""
+        self.graph = graph
+        self.nodes = list(graph.iternodes())
+        self.node_id = dict((node, i) for (i, node) in enumerate(self.nodes))
+        n = len(self.nodes)
+        self.state = bytearray(n)   # all WHITE
+        self.time = 0    # time stamp
+        self.dd = array("q", [0]) * n
+        self.ff = array("q", [0]) * n
+        self.parent = array("q", [-1]) * n
+        self.stack = []
+
+    def iterevents(self, source=None, classify=True):
+        """Generate DFS events (kind, item).
+        
+        Parameters
+        ----------
+        source : node, optional (all WHITE nodes are roots if None)
+        classify : bool, if False, only PRE, TREE, POST events are
+            generated (faster)
+        """
+        if source is not None:
+            roots = [self.node_id[source]]
+        else:
+            roots = range(len(self.nodes))
+        for root in roots:
+            if self.state[root] == WHITE:
+                for event in self._explore(root, classify):
+                    yield event
+
+    def _explore(self, root, classify):
+        """Generate events for the DFS tree from root."""
+        graph = self.graph
+        nodes = self.nodes
+        node_id = self.node_id
+        state = self.state
+        dd = self.dd
+        ff = self.ff
+        parent = self.parent
+        stack = self.stack
+        directed = graph.is_directed()
+        iters = [iter(graph.iteroutedges(nodes[root]))]
+        self.time += 1
+        dd[root] = self.time
+        state[root] = GREY
+        stack.append(root)
+        yield PRE, nodes[root]
+        while iters:
+            source = stack[-1]
+            for edge in iters[-1]:
+                target = node_id[edge.target]
+                color = state[target]
+                if color == WHITE:
+                    parent[target] = source
+                    yield TREE, edge
+                    self.time += 1
+                    dd[target] = self.time
+                    state[target] = GREY
+                    stack.append(target)
+                    iters.append(iter(graph.iteroutedges(edge.target)))
+                    yield PRE, edge.target
+                    break
+                elif not classify:
+                    continue
+                elif color == GREY:
+                    if directed or target != parent[source]:
+                        yield BACK, edge
+                elif directed:
+                    if dd[source] < dd[target]:
+                        yield FORWARD, edge
+                    else:
+                        yield CROSS, edge
+            else:   # all edges from source are processed
+                self.time += 1
+                ff[source] = self.time
+                state[source] = BLACK
+                yield POST, nodes[source]
+                stack.pop()
+                iters.pop()
+
+    def run(self, source=None, pre_action=None, post_action=None):
+        """Executable pseudocode."""
+        for kind, item in self.iterevents(source, classify=False):
+            if kind == PRE:
+                if pre_action:
+                    pre_action(item)
+            elif kind == POST:
+                if post_action:
+                    post_action(item)
+
+    def depth(self):
+        """Return the depth of the current node (the last GREY node)."""
+        return len(self.stack) - 1
+
+    def get_parent(self, node):
+        """Return the parent of the node in the DFS tree or None."""
+        i = self.parent[self.node_id[node]]
+        return None if i < 0 else self.nodes[i]
+
 
 class DFSWithStack:
     """Depth-First Search with a stack.
@@ -51,7 +204,7 @@ class DFSWithStack:
         self.time = 0    # time stamp
         self.dd = dict()
         self.ff = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
 
@@ -113,12 +266,14 @@ class DFSWithStack:
 
 
 class DFSWithRecursion:
-    """Depth-First Search with a recursion.
+    """Depth-First Search (recursion simulated by DFSEngine).
+    
+    The recursive order of nodes is kept, but the engine stack is used,
+    so the recursion limit is not important.
     
     Attributes
     ----------
     graph : input graph
-    color : dict with nodes, private ('WHITE', 'GREY', 'BLACK')
     time : number, private
     dd : dict with nodes ('GREY' time)
     ff : dict with nodes ('BLACK' time)
@@ -155,43 +310,31 @@ class DFSWithRecursion:
     def __init__(self, graph):
         """The algorithm initialization."""
         self.graph = graph
-        self.color = dict(((node, "WHITE") for node in self.graph.iternodes()))
         self.parent = dict(((node, None) for node in self.graph.iternodes()))
         self.time = 0    # time stamp
         self.dd = dict()
         self.ff = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None, pre_action=None, post_action=None):
         """Executable pseudocode."""
-        if source is not None:
-            self._visit(source, pre_action, post_action)
-        else:
-            for node in self.graph.iternodes():
-                if self.color[node] == "WHITE":
-                    self._visit(node, pre_action, post_action)
-
-    def _visit(self, node, pre_action=None, post_action=None):
-        """Explore recursively the connected component."""
-        self.time = self.time + 1
-        self.dd[node] = self.time
-        self.color[node] = "GREY"
-        if pre_action:   # _visit started
-            pre_action(node)
-        for edge in self.graph.iteroutedges(node):
-            if self.color[edge.target] == "WHITE":
-                self.parent[edge.target] = node
-                self.dag.add_edge(edge)
-                self._visit(edge.target, pre_action, post_action)
-        self.time = self.time + 1
-        self.ff[node] = self.time
-        self.color[node] = "BLACK"
-        if post_action:   # node became BLACK
-            post_action(node)
+        engine = self._engine
+        for kind, item in engine.iterevents(source, classify=False):
+            if kind == PRE:
+                self.dd[item] = engine.time
+                if pre_action:   # _visit started
+                    pre_action(item)
+            elif kind == TREE:
+                self.parent[item.target] = item.source
+                self.dag.add_edge(item)
+            else:   # POST, node became BLACK
+                self.ff[item] = engine.time
+                if post_action:
+                    post_action(item)
+        self.time = engine.time
 
     def path(self, source, target):
         """Construct a path from source to target."""
@@ -215,7 +358,7 @@ class DFSWithRecursion:
 
 
 class SimpleDFS:
-    """Depth-First Search with a recursion.
+    """Depth-First Search (recursion simulated by DFSEngine).
     
     Attributes
     ----------
@@ -252,34 +395,24 @@ class SimpleDFS:
         """The algorithm initialization."""
         self.graph = graph
         self.parent = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None, pre_action=None, post_action=None):
         """Executable pseudocode."""
-        if source is not None:
-            self.parent[source] = None   # before _visit
-            self._visit(source, pre_action, post_action)
-        else:
-            for node in self.graph.iternodes():
-                if node not in self.parent:
-                    self.parent[node] = None   # before _visit
-                    self._visit(node, pre_action, post_action)
-
-    def _visit(self, node, pre_action=None, post_action=None):
-        """Explore recursively the connected component."""
-        if pre_action:
-            pre_action(node)
-        for edge in self.graph.iteroutedges(node):
-            if edge.target not in self.parent:
-                self.parent[edge.target] = node   # before _visit
-                self.dag.add_edge(edge)
-                self._visit(edge.target, pre_action, post_action)
-        if post_action:
-            post_action(node)
+        for kind, item in self._engine.iterevents(source, classify=False):
+            if kind == PRE:
+                if item not in self.parent:   # a root
+                    self.parent[item] = None
+                if pre_action:
+                    pre_action(item)
+            elif kind == TREE:
+                self.parent[item.target] = item.source
+                self.dag.add_edge(item)
+            elif post_action:   # POST
+                post_action(item)
 
     def path(self, source, target):
         """Construct a path from source to target."""
@@ -303,7 +436,7 @@ class SimpleDFS:
 
 
 class DFSWithDepthTracker:
-    """Depth-First Search with a recursion and a depth tracker.
+    """Depth-First Search with a depth tracker (DFSEngine).
     
     Attributes
     ----------
@@ -336,34 +469,25 @@ class DFSWithDepthTracker:
         """The algorithm initialization."""
         self.graph = graph
         self.parent = dict()
-        self.dag = self.graph.__class__(n=self.graph.v(), directed=True)
+        self.dag = graph_class(self.graph)(n=self.graph.v(), directed=True)
         for node in self.graph.iternodes():   # isolated nodes are possible
             self.dag.add_node(node)
-        recursionlimit = sys.getrecursionlimit()
-        sys.setrecursionlimit(max(self.graph.v() * 2, recursionlimit))
+        self._engine = DFSEngine(self.graph)
 
     def run(self, source=None, pre_action=None, post_action=None):
         """Executable pseudocode."""
-        if source is not None:
-            self.parent[source] = None   # before _visit
-            self._visit(source, pre_action, post_action)
-        else:
-            for node in self.graph.iternodes():
-                if node not in self.parent:
-                    self.parent[node] = None   # before _visit
-                    self._visit(node, pre_action, post_action)
-
-    def _visit(self, node, pre_action=None, post_action=None, depth=0):
-        """Explore recursively the connected component."""
-        if pre_action:
-            pre_action((node, depth))
-        for edge in self.graph.iteroutedges(node):
-            if edge.target not in self.parent:
-                self.parent[edge.target] = node   # before _visit
-                self.dag.add_edge(edge)
-                self._visit(edge.target, pre_action, post_action, depth + 1)
-        if post_action:
-            post_action((node, depth))
+        engine = self._engine
+        for kind, item in engine.iterevents(source, classify=False):
+            if kind == PRE:
+                if item not in self.parent:   # a root
+                    self.parent[item] = None
+                if pre_action:
+                    pre_action((item, engine.depth()))
+            elif kind == TREE:
+                self.parent[item.target] = item.source
+                self.dag.add_edge(item)
+            elif post_action:   # POST
+                post_action((item, engine.depth()))
 
     def path(self, source, target):
         """Construct a path from source to target."""
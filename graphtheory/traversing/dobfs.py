@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+
+from array import array
+from graphtheory.structures.csrgraphs import CSRGraph
+
+
+def csr_arrays(graph):
+    """Return (nodes, node_id, offsets, targets) for any graph.
+
+    CSRGraph buffers are used directly (not copied), other graphs
+    are converted with CSRGraph.from_graph.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_graph(graph)
+    graph.freeze()
+    return graph.nodes, graph.node_id, graph.offsets, graph.targets
+
+
+def inverse_arrays(offsets, targets):
+    """Return (in_offsets, in_sources), inedges in CSR (counting sort)."""
+    n = len(offsets) - 1
+    in_offsets = array("q", [0]) * (n + 1)
+    for target in targets:
+        in_offsets[target + 1] += 1
+    for i in range(n):
+        in_offsets[i + 1] += in_offsets[i]
+    free = array("q", in_offsets)   # next free slot for every node
+    in_sources = array("q", [0]) * len(targets)
+    for source in range(n):
+        for k in range(offsets[source], offsets[source + 1]):
+            target = targets[k]
+            in_sources[free[target]] = source
+            free[target] += 1
+    return in_offsets, in_sources
+
+
+class DirectionOptimizingBFS:
+    """Direction-optimizing Breadth-First Search (top-down/bottom-up).
+
+    BFS is done level by level over CSR arrays. A top-down step scans
+    outedges of frontier nodes. A bottom-up step scans inedges of
+    unvisited nodes and stops at the first parent in the frontier
+    (a bytearray bitmap), it is cheap when the frontier is large.
+    The direction is switched with the Beamer heuristic:
+    top-down -> bottom-up if m_f > m_u / alpha,
+    bottom-up -> top-down if n_f < n / beta and the frontier shrinks,
+    where m_f is the number of edges from the frontier,
+    m_u is the number of edges to unvisited nodes,
+    n_f is the number of frontier nodes.
+
+    Attributes
+    ----------
+    graph : input graph
+    nodes : list of nodes (node id -> node)
+    node_id : dict, node -> node id
+    level : array with node ids (distance from source, -1 if not reached)
+    parent : array with node ids (parent id in BFS tree, -1 for source)
+    source : node
+    edges_checked : number of edge inspections in the last run
+    directions : list of steps ('top-down' or 'bottom-up') in the last run
+
+    Examples
+    --------
+    >>> from graphtheory.structures.edges import Edge
+    >>> from graphtheory.structures.graphs import Graph
+    >>> from graphtheory.traversing.dobfs import DirectionOptimizingBFS
+    >>> G = Graph(n=10, directed=False)   # an exemplary undirected graph
+    # Add nodes and edges here.
+    >>> algorithm = DirectionOptimizingBFS(G)   # CSR arrays are built
+    >>> algorithm.run(source=0)
+    >>> algorithm.get_level(target)   # distance from source to target
+    >>> algorithm.path(source, target)
+    >>> algorithm.edges_checked, algorithm.directions
+
+    Notes
+    -----
+    The BFS tree can differ from SimpleBFS, but levels are the same.
+    CSRGraph is used without copying, directed graphs need
+    the inverse index (built once).
+
+    Beamer, S., Asanovic, K., Patterson, D., 2012,
+        Direction-optimizing breadth-first search,
+        SC '12, 1-10.
+    """
+
+    def __init__(self, graph, alpha=14, beta=24):
+        """The algorithm initialization.
+
+        Parameters
+        ----------
+        graph : directed or undirected graph
+        alpha : number, optional (default=14), top-down -> bottom-up
+        beta : number, optional (default=24), bottom-up -> top-down
+        """
+        self.graph = graph
+        self.alpha = alpha
+        self.beta = beta
+        self.nodes, self.node_id, self.offsets, self.targets = csr_arrays(
+            graph)
+        if graph.is_directed():
+            self.in_offsets, self.in_sources = inverse_arrays(
+                self.offsets, self.targets)
+        else:   # inedges are outedges
+            self.in_offsets, self.in_sources = self.offsets, self.targets
+        n = len(self.nodes)
+        self.level = array("q", [-1]) * n
+        self.parent = array("q", [-1]) * n
+        self.source = None
+        self.edges_checked = 0
+        self.directions = []
+
+    def run(self, source):
+        """Executable pseudocode."""
+        n = len(self.nodes)
+        offsets = self.offsets
+        in_offsets = self.in_offsets
+        self.level = level = array("q", [-1]) * n
+        self.parent = array("q", [-1]) * n
+        self.source = source
+        self.edges_checked = 0
+        self.directions = []
+        start = self.node_id[source]
+        level[start] = 0
+        frontier = [start]
+        edges_from_frontier = offsets[start + 1] - offsets[start]
+        edges_to_unvisited = (len(self.in_sources)
+            - (in_offsets[start + 1] - in_offsets[start]))
+        unvisited = None   # built for the first bottom-up step
+        bottom_up = False
+        old_size = 1
+        depth = 0
+        while frontier:
+            if not bottom_up:
+                if edges_from_frontier > edges_to_unvisited / self.alpha:
+                    bottom_up = True
+            elif len(frontier) < n / self.beta and len(frontier) < old_size:
+                bottom_up = False
+            old_size = len(frontier)
+            depth += 1
+            if bottom_up:
+                if unvisited is None:
+                    unvisited = [i for i in range(n) if level[i] < 0]
+                new_frontier = self._bottom_up_step(frontier, unvisited, depth)
+                unvisited = [i for i in unvisited if level[i] < 0]
+                self.directions.append("bottom-up")
+            else:
+                new_frontier = self._top_down_step(frontier, depth)
+                unvisited = None
+                self.directions.append("top-down")
+            frontier = new_frontier
+            edges_from_frontier = 0
+            for i in frontier:
+                edges_from_frontier += offsets[i + 1] - offsets[i]
+                edges_to_unvisited -= in_offsets[i + 1] - in_offsets[i]
+
+    def _top_down_step(self, frontier, depth):
+        """Scan outedges from the frontier, return the next frontier."""
+        offsets = self.offsets
+        targets = self.targets
+        level = self.level
+        parent = self.parent
+        new_frontier = []
+        for source in frontier:
+            lo, hi = offsets[source], offsets[source + 1]
+            self.edges_checked += hi - lo
+            for k in range(lo, hi):
+                target = targets[k]
+                if level[target] < 0:
+                    level[target] = depth
+                    parent[target] = source
+                    new_frontier.append(target)
+        return new_frontier
+
+    def _bottom_up_step(self, frontier, unvisited, depth):
+        """Scan inedges of unvisited nodes, return the next frontier."""
+        in_offsets = self.in_offsets
+        in_sources = self.in_sources
+        level = self.level
+        parent = self.parent
+        bitmap = bytearray(len(self.nodes))
+        for source in frontier:
+            bitmap[source] = 1
+        new_frontier = []
+        checked = 0
+        for target in unvisited:
+            lo, hi = in_offsets[target], in_offsets[target + 1]
+            for k in range(lo, hi):
+                source = in_sources[k]
+                if bitmap[source]:
+                    level[target] = depth
+                    parent[target] = source
+                    new_frontier.append(target)
+                    checked += k - lo + 1
+                    break
+            else:
+                checked += hi - lo
+        self.edges_checked += checked
+        return new_frontier
+
+    def get_level(self, node):
+        """Return the distance from source to node or None."""
+        depth = self.level[self.node_id[node]]
+        return None if depth < 0 else depth
+
+    def get_parent(self, node):
+        """Return the parent of the node in the BFS tree or None."""
+        i = self.parent[self.node_id[node]]
+        return None if i < 0 else self.nodes[i]
+
+    def path(self, source, target):
+        """Construct a path from source to target."""
+        if source == target:
+            return [source]
+        i = self.node_id[target]
+        if self.level[i] < 0:
+            raise ValueError("no path to target")
+        stop = self.node_id[source]
+        # iterative solution
+        result = [target]
+        while i != stop:
+            i = self.parent[i]
+            if i < 0:
+                raise ValueError("no path to target")
+            result.append(self.nodes[i])
+        result.reverse()
+        return result
+
+# EOF
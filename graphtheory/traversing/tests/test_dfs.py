@@ -7,6 +7,8 @@ from graphtheory.traversing.dfs import DFSWithStack
 from graphtheory.traversing.dfs import DFSWithRecursion
 from graphtheory.traversing.dfs import SimpleDFS
 from graphtheory.traversing.dfs import DFSWithDepthTracker
+from graphtheory.traversing.dfs import DFSEngine, EVENT_NAMES
+from graphtheory.traversing.dfs import PRE, POST, TREE, BACK, FORWARD, CROSS
 
 # 0---1   2---3
 # |   | / | / |
@@ -128,6 +130,68 @@ class TestDFS(unittest.TestCase):
 
     def tearDown(self): pass
 
+
+class TestDFSEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.N = 4           # number of nodes
+        self.G = Graph(n=self.N, directed=True)
+        self.nodes = range(self.N)
+        self.edges = [Edge(0, 1), Edge(0, 2), Edge(1, 2), Edge(2, 0),
+            Edge(3, 1)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+
+    def test_events(self):
+        engine = DFSEngine(self.G)
+        events = [(EVENT_NAMES[kind], item)
+            for (kind, item) in engine.iterevents()]
+        events_expected = [("PRE", 0),
+            ("TREE", Edge(0, 1)), ("PRE", 1),
+            ("TREE", Edge(1, 2)), ("PRE", 2),
+            ("BACK", Edge(2, 0)), ("POST", 2), ("POST", 1),
+            ("FORWARD", Edge(0, 2)), ("POST", 0),
+            ("PRE", 3), ("CROSS", Edge(3, 1)), ("POST", 3)]
+        self.assertEqual(events, events_expected)
+        self.assertEqual(list(engine.state), [2] * self.N)   # all BLACK
+        self.assertEqual(list(engine.dd), [1, 2, 3, 7])
+        self.assertEqual(list(engine.ff), [6, 5, 4, 8])
+        self.assertEqual(list(engine.parent), [-1, 0, 1, -1])
+        self.assertEqual(engine.get_parent(2), 1)
+        self.assertEqual(engine.get_parent(3), None)
+        self.assertEqual(engine.stack, [])
+
+    def test_without_classification(self):
+        engine = DFSEngine(self.G)
+        kinds = set(kind for (kind, item) in
+            engine.iterevents(0, classify=False))
+        self.assertEqual(kinds, set([PRE, POST, TREE]))
+        self.assertEqual(list(engine.state), [2, 2, 2, 0])   # 3 is WHITE
+        post_order = []
+        engine.run(post_action=lambda node: post_order.append(node))
+        self.assertEqual(post_order, [3])
+
+    def test_long_path(self):
+        # The recursion limit is not important.
+        N = 20000
+        G = Graph(n=N)
+        for node in range(N-1):
+            G.add_edge(Edge(node, node+1))
+        for algorithm_class in (DFSWithRecursion, SimpleDFS):
+            algorithm = algorithm_class(G)
+            post_order = []
+            algorithm.run(0, post_action=lambda node: post_order.append(node))
+            self.assertEqual(post_order, list(range(N-1, -1, -1)))
+            self.assertEqual(len(algorithm.path(0, N-1)), N)
+        algorithm = DFSWithDepthTracker(G)
+        pre_order = []
+        algorithm.run(0, pre_action=lambda pair: pre_order.append(pair))
+        self.assertEqual(pre_order[-1], (N-1, N-1))
+
+    def tearDown(self): pass
+
 if __name__ == "__main__":
 
     unittest.main()
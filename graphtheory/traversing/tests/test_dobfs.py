@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import unittest
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.traversing.bfs import BFSWithQueue
+from graphtheory.traversing.dobfs import DirectionOptimizingBFS
+
+# 0---1   2---3
+# |   | / | / |
+# 4   5---6---7
+
+class TestDirectionOptimizingBFS(unittest.TestCase):
+
+    def setUp(self):
+        # The graph from Cormen p.607
+        self.N = 8           # number of nodes
+        self.G = Graph(n=self.N)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 4, 2), Edge(0, 1, 3), Edge(1, 5, 4), Edge(5, 2, 5),
+            Edge(5, 6, 6), Edge(2, 6, 7), Edge(2, 3, 8), Edge(6, 3, 9),
+            Edge(6, 7, 10), Edge(3, 7, 11)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_top_down(self):
+        algorithm = DirectionOptimizingBFS(self.G, alpha=0.01, beta=1)
+        algorithm.run(1)
+        levels = dict((node, algorithm.get_level(node)) for node in self.nodes)
+        levels_expected = {0: 1, 1: 0, 2: 2, 3: 3, 4: 2, 5: 1, 6: 2, 7: 3}
+        self.assertEqual(levels, levels_expected)
+        # The last frontier has no unvisited neighbors (m_u = 0).
+        self.assertEqual(algorithm.directions[:3], ["top-down"] * 3)
+        self.assertTrue(algorithm.edges_checked <= 2 * len(self.edges))
+        self.assertEqual(algorithm.path(1, 7), [1, 5, 6, 7])
+        self.assertEqual(algorithm.path(1, 4), [1, 0, 4])
+        self.assertEqual(algorithm.get_parent(1), None)
+        self.assertEqual(algorithm.get_parent(4), 0)
+
+    def test_bottom_up(self):
+        algorithm = DirectionOptimizingBFS(self.G, alpha=1000, beta=1000)
+        algorithm.run(1)
+        levels = [algorithm.get_level(node) for node in self.nodes]
+        self.assertEqual(levels, [1, 0, 2, 3, 2, 1, 2, 3])
+        self.assertEqual(algorithm.directions, ["bottom-up"] * 4)
+        self.assertEqual(algorithm.path(1, 3), [1, 5, 2, 3])
+
+    def test_no_path(self):
+        self.G.add_node(8)
+        algorithm = DirectionOptimizingBFS(self.G)
+        algorithm.run(0)
+        self.assertEqual(algorithm.get_level(8), None)
+        self.assertEqual(list(algorithm.level)[8], -1)
+        self.assertRaises(ValueError, algorithm.path, 0, 8)
+        self.assertEqual(algorithm.path(0, 0), [0])
+
+    def test_csr_graph(self):
+        csr = CSRGraph.from_graph(self.G)
+        algorithm = DirectionOptimizingBFS(csr)
+        self.assertTrue(algorithm.targets is csr.targets)   # not copied
+        algorithm.run(4)
+        self.assertEqual(algorithm.get_level(7), 5)
+
+    def test_random_graphs(self):
+        random.seed(7)
+        for directed in (False, True):
+            for step in range(20):
+                n = random.randint(2, 40)
+                G = Graph(n=n, directed=directed)
+                for node in range(n):
+                    G.add_node(node)
+                for _ in range(random.randint(0, 5 * n)):
+                    source, target = random.sample(range(n), 2)
+                    if not G.has_edge((source, target)):
+                        G.add_edge(Edge(source, target))
+                expected = BFSWithQueue(G)
+                expected.run(0)
+                for alpha, beta in ((14, 24), (1, 1000), (0.01, 1)):
+                    algorithm = DirectionOptimizingBFS(G, alpha, beta)
+                    algorithm.run(0)
+                    for node in range(n):
+                        level = algorithm.get_level(node)
+                        if level is None:
+                            self.assertEqual(expected.distance[node],
+                                float("inf"))
+                            continue
+                        self.assertEqual(level, expected.distance[node])
+                        path = algorithm.path(0, node)
+                        self.assertEqual(len(path), level + 1)
+                        for edge in zip(path, path[1:]):
+                            self.assertTrue(G.has_edge(edge))
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import unittest
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.traversing.bfs import BFSWithQueue
+from graphtheory.traversing.msbfs import MultiSourceBFS
+from graphtheory.traversing.msbfs import BatchedBFS
+
+# 0---1   2---3
+# |   | / | / |
+# 4   5---6---7
+
+class TestMultiSourceBFS(unittest.TestCase):
+
+    def setUp(self):
+        # The graph from Cormen p.607
+        self.N = 8           # number of nodes
+        self.G = Graph(n=self.N)
+        self.nodes = range(self.N)
+        self.edges = [
+            Edge(0, 4, 2), Edge(0, 1, 3), Edge(1, 5, 4), Edge(5, 2, 5),
+            Edge(5, 6, 6), Edge(2, 6, 7), Edge(2, 3, 8), Edge(6, 3, 9),
+            Edge(6, 7, 10), Edge(3, 7, 11)]
+        for node in self.nodes:
+            self.G.add_node(node)
+        for edge in self.edges:
+            self.G.add_edge(edge)
+        #self.G.show()
+
+    def test_multi_source(self):
+        algorithm = MultiSourceBFS(self.G)
+        algorithm.run([4, 7])
+        levels = [algorithm.get_level(node) for node in self.nodes]
+        self.assertEqual(levels, [1, 2, 2, 1, 0, 2, 1, 0])
+        roots = [algorithm.get_root(node) for node in self.nodes]
+        self.assertEqual(roots, [4, 4, 7, 7, 4, 7, 7, 7])
+        self.assertEqual(algorithm.path(1), [4, 0, 1])
+        self.assertEqual(algorithm.path(2), [7, 3, 2])   # CSR order
+        self.assertEqual(algorithm.path(7), [7])
+
+    def test_batched(self):
+        algorithm = BatchedBFS(self.G)
+        algorithm.run()
+        self.assertEqual(len(algorithm.distance), self.N)
+        distance = algorithm.to_dict()
+        for source in self.nodes:
+            expected = BFSWithQueue(self.G)
+            expected.run(source)
+            self.assertEqual(distance[source], expected.distance)
+        eccentricity = algorithm.eccentricity()
+        self.assertEqual(eccentricity,
+            {0: 4, 1: 3, 2: 4, 3: 5, 4: 5, 5: 3, 6: 4, 7: 5})
+        self.assertEqual(algorithm.diameter(), 5)
+        closeness = algorithm.closeness([5])
+        self.assertAlmostEqual(closeness[5], 7.0 / 12)
+
+    def test_small_batches(self):
+        algorithm = BatchedBFS(self.G, batch=3)
+        rows = list(algorithm.iterrows([1, 2, 3, 4]))
+        self.assertEqual([source for (source, row) in rows], [1, 2, 3, 4])
+        self.assertEqual(list(rows[0][1]), [1, 0, 2, 3, 2, 1, 2, 3])
+        self.assertRaises(ValueError, BatchedBFS, self.G, 65)
+
+    def test_disconnected(self):
+        self.G.add_node(8)
+        algorithm = BatchedBFS(self.G)
+        self.assertEqual(algorithm.diameter(), float("inf"))
+        algorithm.run([8])
+        self.assertEqual(algorithm.to_dict(), {8: {8: 0}})
+        self.assertEqual(algorithm.closeness([8]), {8: 0.0})
+        algorithm = MultiSourceBFS(self.G)
+        algorithm.run([0])
+        self.assertEqual(algorithm.get_level(8), None)
+        self.assertRaises(ValueError, algorithm.path, 8)
+
+    def test_empty_graph(self):
+        algorithm = BatchedBFS(Graph(n=0))
+        self.assertEqual(algorithm.eccentricity(), {})
+        self.assertEqual(algorithm.diameter(), 0)
+        self.assertEqual(algorithm.closeness(), {})
+
+    def test_random_graphs(self):
+        random.seed(11)
+        for directed in (False, True):
+            for step in range(10):
+                n = random.randint(2, 150)   # more than one batch
+                G = Graph(n=n, directed=directed)
+                for node in range(n):
+                    G.add_node(node)
+                for _ in range(random.randint(0, 3 * n)):
+                    source, target = random.sample(range(n), 2)
+                    if not G.has_edge((source, target)):
+                        G.add_edge(Edge(source, target))
+                algorithm = BatchedBFS(G)
+                algorithm.run()
+                distance = algorithm.to_dict()
+                for source in G.iternodes():
+                    expected = BFSWithQueue(G)
+                    expected.run(source)
+                    reached = dict((node, depth) for (node, depth)
+                        in expected.distance.items() if depth != float("inf"))
+                    self.assertEqual(distance[source], reached)
+
+    def tearDown(self): pass
+
+if __name__ == "__main__":
+
+    unittest.main()
+
+# EOF
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import timeit
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.traversing.bfs import SimpleBFS
+from graphtheory.traversing.dobfs import DirectionOptimizingBFS
+
+V = 1000
+#V = 100000
+D = 16   # average degree, a random (low-diameter) graph
+random.seed(1)
+G = Graph(n=V)
+for node in range(V):
+    G.add_node(node)
+while G.e() < V * D // 2:
+    source, target = random.sample(range(V), 2)
+    if not G.has_edge((source, target)):
+        G.add_edge(Edge(source, target))
+E = G.e()
+C = CSRGraph.from_graph(G)
+
+print ("Testing SimpleBFS ..." )
+t1 = timeit.Timer(lambda: SimpleBFS(G).run(0))
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+print ("Testing DirectionOptimizingBFS (with CSR building) ..." )
+t1 = timeit.Timer(lambda: DirectionOptimizingBFS(G).run(0))
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+print ("Testing DirectionOptimizingBFS (CSRGraph) ..." )
+algorithm = DirectionOptimizingBFS(C)
+t1 = timeit.Timer(lambda: algorithm.run(0))
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+print ( "edges checked {} (top-down only {})".format(
+    algorithm.edges_checked, 2 * E) )
+print ( algorithm.directions )
+
+# Results for V = 100000, E = 800000, single run [s]:
+# SimpleBFS                        1.84
+# DirectionOptimizingBFS (Graph)   3.08 (CSRGraph.from_graph dominates)
+# DirectionOptimizingBFS (CSR)     0.12
+# edges checked 195151 (1600000 for top-down BFS), 8.2 times less
+# directions: 4 x top-down, 2 x bottom-up, top-down
+
+# EOF
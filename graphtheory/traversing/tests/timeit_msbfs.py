@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import timeit
+import random
+from graphtheory.structures.edges import Edge
+from graphtheory.structures.graphs import Graph
+from graphtheory.structures.csrgraphs import CSRGraph
+from graphtheory.traversing.bfs import SimpleBFS
+from graphtheory.traversing.dobfs import DirectionOptimizingBFS
+from graphtheory.traversing.msbfs import BatchedBFS
+
+V = 1000
+#V = 20000
+D = 8   # average degree, a random (low-diameter) graph
+S = 64   # number of sources
+random.seed(1)
+G = Graph(n=V)
+for node in range(V):
+    G.add_node(node)
+while G.e() < V * D // 2:
+    source, target = random.sample(range(V), 2)
+    if not G.has_edge((source, target)):
+        G.add_edge(Edge(source, target))
+E = G.e()
+C = CSRGraph.from_graph(G)
+sources = list(range(S))
+
+def run_simple_bfs():
+    for source in sources:
+        SimpleBFS(G).run(source)
+
+def run_direction_optimizing_bfs():
+    algorithm = DirectionOptimizingBFS(C)
+    for source in sources:
+        algorithm.run(source)
+
+print ("Testing SimpleBFS x {} ...".format(S) )
+t1 = timeit.Timer(run_simple_bfs)
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+print ("Testing DirectionOptimizingBFS x {} ...".format(S) )
+t1 = timeit.Timer(run_direction_optimizing_bfs)
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+
+print ("Testing BatchedBFS ({} sources) ...".format(S) )
+algorithm = BatchedBFS(C)
+t1 = timeit.Timer(lambda: algorithm.run(sources))
+print ( "{} {} {}".format(V, E, t1.timeit(1)) )   # single run
+print ( "edges checked {} (separate BFSs {})".format(
+    algorithm.edges_checked, 2 * E * S) )
+
+# Results for V = 20000, E = 80000, 64 sources, single run [s]:
+# SimpleBFS x 64                10.80
+# DirectionOptimizingBFS x 64   1.42
+# BatchedBFS                    1.04 (64 * 20000 distances are written)
+# edges checked 663544 (10240000 for separate BFSs), 15 times less
+
+# EOF